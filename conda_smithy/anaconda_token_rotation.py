@@ -10,14 +10,18 @@ conda-forge.yml in your feedstock to GitHub.
 """
 
 import os
-import sys
-from contextlib import redirect_stderr, redirect_stdout
+import threading
+import time
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from functools import partial
 
-import requests
 from github import Github
 
 from conda_smithy.deprecations import deprecated
-from conda_smithy.utils import update_conda_forge_config
+from conda_smithy.utils import run_in_threads, update_conda_forge_config
+
+# keep this many GitHub API requests for other tools when rotating many tokens
+GITHUB_RATE_LIMIT_RESERVE = 100
 
 
 def _get_anaconda_token():
@@ -32,6 +36,127 @@ def _get_anaconda_token():
         )
 
 
+def _with_lock(lock, func):
+    def locked():
+        with lock:
+            return func()
+
+    return locked
+
+
+def _wait_for_github_rate_limit(gh):
+    """Sleep until the GitHub API rate limit resets if it is nearly used up."""
+    remaining, _ = gh.rate_limiting
+    if remaining < GITHUB_RATE_LIMIT_RESERVE:
+        time.sleep(max(gh.rate_limiting_resettime - time.time(), 0) + 1)
+
+
+def _rotate_github_actions_token(
+    user, project, binstar_token, token_name, wait_for_rate_limit
+):
+    from conda_smithy.github import gh_token
+
+    # PyGithub clients are not thread-safe, so every thread gets its own
+    gh = Github(gh_token())
+    if wait_for_rate_limit:
+        _wait_for_github_rate_limit(gh)
+    rotate_token_in_github_actions(user, project, binstar_token, token_name, gh)
+
+
+def _rotation_tasks(
+    user,
+    project,
+    feedstock_config_path,
+    anaconda_token,
+    *,
+    drone,
+    circle,
+    travis,
+    azure,
+    appveyor,
+    github_actions,
+    token_name,
+    drone_endpoints,
+    wait_for_rate_limit=False,
+):
+    """Return the functions that rotate the token of ``project`` on each
+    provider, by the name of the provider used in error messages.
+    """
+    # travis and appveyor both edit the conda-forge.yml
+    config_lock = threading.Lock()
+
+    tasks = {}
+    if circle:
+        tasks["circle"] = partial(
+            rotate_token_in_circle, user, project, anaconda_token, token_name
+        )
+
+    if drone:
+        for drone_endpoint in drone_endpoints:
+            tasks[f"drone endpoint {drone_endpoint}"] = partial(
+                rotate_token_in_drone,
+                user,
+                project,
+                anaconda_token,
+                token_name,
+                drone_endpoint,
+            )
+
+    if travis:
+        tasks["travis"] = _with_lock(
+            config_lock,
+            partial(
+                rotate_token_in_travis,
+                user,
+                project,
+                feedstock_config_path,
+                anaconda_token,
+                token_name,
+            ),
+        )
+
+    if azure:
+        tasks["azure"] = partial(
+            rotate_token_in_azure, user, project, anaconda_token, token_name
+        )
+
+    if appveyor:
+        tasks["appveyor"] = _with_lock(
+            config_lock,
+            partial(
+                rotate_token_in_appveyor,
+                feedstock_config_path,
+                anaconda_token,
+                token_name,
+            ),
+        )
+
+    if github_actions:
+        tasks["github actions"] = partial(
+            _rotate_github_actions_token,
+            user,
+            project,
+            anaconda_token,
+            token_name,
+            wait_for_rate_limit,
+        )
+
+    return tasks
+
+
+@contextmanager
+def _secure_io():
+    """context manager that redirects stdout and
+    stderr to /dev/null to avoid spilling tokens"""
+
+    if "DEBUG_ANACONDA_TOKENS" in os.environ:
+        yield
+    else:
+        with open(os.devnull, "w") as fp:
+            with redirect_stdout(fp), redirect_stderr(fp):
+                yield
+
+
 def rotate_anaconda_token(
     user,
     project,
@@ -44,9 +169,14 @@ def rotate_anaconda_token(
     github_actions=True,
     token_name="BINSTAR_TOKEN",
     drone_endpoints=(),
+    max_workers=None,
 ):
     """Rotate the anaconda (binstar) token used by the CI providers
 
+    The providers are updated concurrently, with at most ``max_workers``
+    threads (by default one per provider). A failure on one provider does
+    not stop the others.
+
     All exceptions are swallowed and stdout/stderr from this function is
     redirected to `/dev/null`. Sanitized error messages are
     displayed at the end.
@@ -59,7 +189,7 @@ def rotate_anaconda_token(
     # note that these imports cover all providers
     from .ci_register import travis_endpoint  # noqa
     from .azure_ci_utils import default_config  # noqa
-    from conda_smithy.github import gh_token
+    from conda_smithy.github import gh_token  # noqa
 
     anaconda_token = _get_anaconda_token()
 
@@ -67,123 +197,35 @@ def rotate_anaconda_token(
     # spill tokens
     failed = False
     err_msg = None
-    with open(os.devnull, "w") as fp:
-        if "DEBUG_ANACONDA_TOKENS" in os.environ:
-            fpo = sys.stdout
-            fpe = sys.stderr
-        else:
-            fpo = fp
-            fpe = fp
-
-        with redirect_stdout(fpo), redirect_stderr(fpe):
-            try:
-                if circle:
-                    try:
-                        rotate_token_in_circle(
-                            user, project, anaconda_token, token_name
-                        )
-                    except Exception as e:
-                        if "DEBUG_ANACONDA_TOKENS" in os.environ:
-                            raise e
-                        else:
-                            err_msg = (
-                                f"Failed to rotate token for {user}/{project}"
-                                " on circle!"
-                            )
-                            failed = True
-                            raise RuntimeError(err_msg)
-
-                if drone:
-                    for drone_endpoint in drone_endpoints:
-                        try:
-                            rotate_token_in_drone(
-                                user,
-                                project,
-                                anaconda_token,
-                                token_name,
-                                drone_endpoint,
-                            )
-                        except Exception as e:
-                            if "DEBUG_ANACONDA_TOKENS" in os.environ:
-                                raise e
-                            else:
-                                err_msg = (
-                                    f"Failed to rotate token for {user}/{project}"
-                                    f" on drone endpoint {drone_endpoint}!"
-                                )
-                                failed = True
-                                raise RuntimeError(err_msg)
-
-                if travis:
-                    try:
-                        rotate_token_in_travis(
-                            user,
-                            project,
-                            feedstock_config_path,
-                            anaconda_token,
-                            token_name,
-                        )
-                    except Exception as e:
-                        if "DEBUG_ANACONDA_TOKENS" in os.environ:
-                            raise e
-                        else:
-                            err_msg = (
-                                f"Failed to rotate token for {user}/{project}"
-                                " on travis!"
-                            )
-                            failed = True
-                            raise RuntimeError(err_msg)
-
-                if azure:
-                    try:
-                        rotate_token_in_azure(user, project, anaconda_token, token_name)
-                    except Exception as e:
-                        if "DEBUG_ANACONDA_TOKENS" in os.environ:
-                            raise e
-                        else:
-                            err_msg = (
-                                f"Failed to rotate token for {user}/{project} on azure!"
-                            )
-                            failed = True
-                            raise RuntimeError(err_msg)
-
-                if appveyor:
-                    try:
-                        rotate_token_in_appveyor(
-                            feedstock_config_path, anaconda_token, token_name
-                        )
-                    except Exception as e:
-                        if "DEBUG_ANACONDA_TOKENS" in os.environ:
-                            raise e
-                        else:
-                            err_msg = (
-                                f"Failed to rotate token for {user}/{project}"
-                                " on appveyor!"
-                            )
-                            failed = True
-                            raise RuntimeError(err_msg)
-
-                if github_actions:
-                    gh = Github(gh_token())
-                    try:
-                        rotate_token_in_github_actions(
-                            user, project, anaconda_token, token_name, gh
-                        )
-                    except Exception as e:
-                        if "DEBUG_ANACONDA_TOKENS" in os.environ:
-                            raise e
-                        else:
-                            err_msg = (
-                                f"Failed to rotate token for {user}/{project}"
-                                " on github actions!"
-                            )
-                            failed = True
-                            raise RuntimeError(err_msg)
-
-            except Exception as e:
+    with _secure_io():
+        try:
+            tasks = _rotation_tasks(
+                user,
+                project,
+                feedstock_config_path,
+                anaconda_token,
+                drone=drone,
+                circle=circle,
+                travis=travis,
+                azure=azure,
+                appveyor=appveyor,
+                github_actions=github_actions,
+                token_name=token_name,
+                drone_endpoints=drone_endpoints,
+            )
+            errors = run_in_threads(tasks, max_workers=max_workers)
+            if errors:
                 if "DEBUG_ANACONDA_TOKENS" in os.environ:
-                    raise e
+                    raise next(iter(errors.values()))
+                err_msg = " ".join(
+                    f"Failed to rotate token for {user}/{project} on {provider}!"
+                    for provider in errors
+                )
                 failed = True
+        except Exception as e:
+            if "DEBUG_ANACONDA_TOKENS" in os.environ:
+                raise e
+            failed = True
 
     if failed:
         if err_msg:
@@ -196,20 +238,102 @@ def rotate_anaconda_token(
             )
 
 
+def rotate_anaconda_tokens(
+    user,
+    feedstocks,
+    drone=True,
+    circle=True,
+    travis=True,
+    azure=True,
+    appveyor=True,
+    github_actions=True,
+    token_name="BINSTAR_TOKEN",
+    drone_endpoints=(),
+    max_workers=8,
+):
+    """Rotate the anaconda (binstar) token of many feedstocks.
+
+    ``feedstocks`` maps the name of each feedstock repo to the path of its
+    conda-forge.yml. The providers of all feedstocks are updated in a single
+    pool of ``max_workers`` threads, so that is the maximum number of
+    concurrent provider updates. Before each GitHub API call, the rotation
+    waits for the GitHub rate limit to reset if it is nearly used up.
+
+    Returns the sanitized error messages of the feedstocks that failed, by
+    name; the other feedstocks are rotated regardless.
+
+    All exceptions are swallowed and stdout/stderr from this function is
+    redirected to `/dev/null`. If you need to debug this function, define
+    `DEBUG_ANACONDA_TOKENS` in your environment before calling this function.
+    """
+    # see rotate_anaconda_token
+    from .ci_register import travis_endpoint  # noqa
+    from .azure_ci_utils import default_config  # noqa
+    from conda_smithy.github import gh_token  # noqa
+
+    anaconda_token = _get_anaconda_token()
+
+    failed = False
+    errors = {}
+    with _secure_io():
+        try:
+            tasks = {}
+            for project, feedstock_config_path in feedstocks.items():
+                project_tasks = _rotation_tasks(
+                    user,
+                    project,
+                    feedstock_config_path,
+                    anaconda_token,
+                    drone=drone,
+                    circle=circle,
+                    travis=travis,
+                    azure=azure,
+                    appveyor=appveyor,
+                    github_actions=github_actions,
+                    token_name=token_name,
+                    drone_endpoints=drone_endpoints,
+                    wait_for_rate_limit=True,
+                )
+                for provider, func in project_tasks.items():
+                    tasks[project, provider] = func
+            errors = run_in_threads(tasks, max_workers=max_workers)
+            if errors and "DEBUG_ANACONDA_TOKENS" in os.environ:
+                raise next(iter(errors.values()))
+        except Exception as e:
+            if "DEBUG_ANACONDA_TOKENS" in os.environ:
+                raise e
+            failed = True
+
+    if failed:
+        raise RuntimeError(
+            f"Rotating the feedstock tokens in providers for {user} failed!"
+            " Try the command locally with DEBUG_ANACONDA_TOKENS"
+            " defined in the environment to investigate!"
+        )
+
+    failures = {}
+    for project, provider in errors:
+        failures.setdefault(project, []).append(
+            f"Failed to rotate token for {user}/{project} on {provider}!"
+        )
+    return {project: " ".join(messages) for project, messages in failures.items()}
+
+
 @deprecated(
     "2026.8",
     "2026.10",
     addendum="CircleCI is deprecated, see #2627",
 )
 def rotate_token_in_circle(user, project, binstar_token, token_name):
-    from conda_smithy.ci_register import circle_token
+    from conda_smithy.ci_register import circle_token, provider_session
 
+    session = provider_session("circle")
     url_template = (
         "https://circleci.com/api/v1.1/project/github/{user}/{project}/envvar{extra}?"
         "circle-token={token}"
     )
 
-    r = requests.get(
+    r = session.get(
         url_template.format(token=circle_token, user=user, project=project, extra="")
     )
     if r.status_code != 200:
@@ -221,7 +345,7 @@ def rotate_token_in_circle(user, project, binstar_token, token_name):
             have_binstar_token = True
 
     if have_binstar_token:
-        r = requests.delete(
+        r = session.delete(
             url_template.format(
                 token=circle_token,
                 user=user,
@@ -233,7 +357,7 @@ def rotate_token_in_circle(user, project, binstar_token, token_name):
             r.raise_for_status()
 
     data = {"name": token_name, "value": binstar_token}
-    response = requests.post(
+    response = session.post(
         url_template.format(token=circle_token, user=user, project=project, extra=""),
         data,
     )
@@ -287,17 +411,19 @@ def rotate_token_in_travis(
 ):
     """update the binstar token in travis."""
     from conda_smithy.ci_register import (
+        provider_session,
         travis_endpoint,
         travis_get_repo_info,
         travis_headers,
     )
 
+    session = provider_session("travis")
     headers = travis_headers()
 
     repo_info = travis_get_repo_info(user, project)
     repo_id = repo_info["id"]
 
-    r = requests.get(
+    r = session.get(
         f"{travis_endpoint}/repo/{repo_id}/env_vars",
         headers=headers,
     )
@@ -318,14 +444,14 @@ def rotate_token_in_travis(
     }
 
     if have_binstar_token:
-        r = requests.patch(
+        r = session.patch(
             f"{travis_endpoint}/repo/{repo_id}/env_var/{ev_id}",
             headers=headers,
             json=data,
         )
         r.raise_for_status()
     else:
-        r = requests.post(
+        r = session.post(
             f"{travis_endpoint}/repo/{repo_id}/env_vars",
             headers=headers,
             json=data,
@@ -414,11 +540,13 @@ def rotate_token_in_azure(user, project, binstar_token, token_name):
     addendum="Appveyor is deprecated, see #2627",
 )
 def rotate_token_in_appveyor(feedstock_config_path, binstar_token, token_name):
-    from conda_smithy.ci_register import appveyor_token
+    from conda_smithy.ci_register import appveyor_token, provider_session
 
     headers = {"Authorization": f"Bearer {appveyor_token}"}
     url = "https://ci.appveyor.com/api/account/encrypt"
-    response = requests.post(url, headers=headers, data={"plainValue": binstar_token})
+    response = provider_session("appveyor").post(
+        url, headers=headers, data={"plainValue": binstar_token}
+    )
     if response.status_code != 200:
         raise ValueError(response)
 
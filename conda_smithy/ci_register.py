@@ -1,15 +1,21 @@
 #!/usr/bin/env python
+import asyncio
 import os
+import random
 import sys
+import threading
 import time
+from functools import cache, partial
 
 import requests
 from conda_build.utils import create_file_with_permissions
+from requests.adapters import HTTPAdapter, Retry
 
 from conda_smithy import github
 from conda_smithy.deprecations import deprecated
 from conda_smithy.utils import (
     file_permissions,
+    run_in_threads,
     update_conda_forge_config,
 )
 
@@ -96,6 +102,80 @@ class LiveServerSession(requests.Session):
         return super().request(method, url, *args, **kwargs)
 
 
+#: the most requests per second that are sent to the API of each provider
+PROVIDER_REQUESTS_PER_SECOND = {
+    "appveyor": 5,
+    "circle": 5,
+    "drone": 5,
+    "github": 5,
+    "travis": 5,
+}
+
+
+class _ProviderRetry(Retry):
+    """Retries requests that are not idempotent only if the server asks for it.
+
+    A 429 or 503 response with a ``Retry-After`` header means that the request
+    was rejected before it was processed, so it is safe to send it again.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if self.total is False or self._is_method_retryable(method):
+            return super().is_retry(method, status_code, has_retry_after)
+        return (
+            has_retry_after
+            and status_code in self.RETRY_AFTER_STATUS_CODES
+            and bool(self.total)
+        )
+
+
+class _ProviderAdapter(HTTPAdapter):
+    """A pooled `HTTPAdapter` with retries that spaces out its requests."""
+
+    def __init__(self, requests_per_second: float):
+        super().__init__(
+            pool_maxsize=16,
+            max_retries=_ProviderRetry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                # the callers check the status of the last response
+                raise_on_status=False,
+            ),
+        )
+        self._interval = 1 / requests_per_second
+        self._lock = threading.Lock()
+        self._next_request = 0.0
+
+    def send(self, request, *args, **kwargs):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_request - now
+            self._next_request = max(now, self._next_request) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+        return super().send(request, *args, **kwargs)
+
+
+@cache
+def _provider_adapter(provider: str, pid: int) -> _ProviderAdapter:
+    return _ProviderAdapter(PROVIDER_REQUESTS_PER_SECOND[provider])
+
+
+def provider_session(provider: str, prefix_url: str = "") -> LiveServerSession:
+    """A session for the API of ``provider``.
+
+    All the sessions of a provider share one pool of keep-alive connections,
+    retry on 429 and 5xx responses (honoring ``Retry-After``) and are rate
+    limited together. Do not close them, that would close the shared pool.
+    """
+    session = LiveServerSession(prefix_url=prefix_url)
+    adapter = _provider_adapter(provider, os.getpid())
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 @deprecated(
     "2026.8",
     "2026.10",
@@ -124,7 +204,7 @@ def travis_headers():
 
         url = f"{travis_endpoint}/auth/github"
         data = {"github_token": github.gh_token()}
-        response = requests.post(url, json=data, headers=v2_headers)
+        response = provider_session("travis").post(url, json=data, headers=v2_headers)
         if response.status_code != 201:
             response.raise_for_status()
         token = response.json()["access_token"]
@@ -148,7 +228,7 @@ def add_token_to_circle(user, project):
     )
     url = url_template.format(token=circle_token, user=user, project=project)
     data = {"name": "BINSTAR_TOKEN", "value": anaconda_token}
-    response = requests.post(url, data)
+    response = provider_session("circle").post(url, data)
     if response.status_code != 201:
         raise ValueError(response)
 
@@ -159,7 +239,7 @@ def add_token_to_circle(user, project):
     addendum="Drone is deprecated, see #2627",
 )
 def drone_session(drone_endpoint=drone_default_endpoint):
-    s = LiveServerSession(prefix_url=drone_endpoint)
+    s = provider_session("drone", prefix_url=drone_endpoint)
     s.headers.update({"Authorization": f"Bearer {drone_token}"})
     return s
 
@@ -250,7 +330,7 @@ def add_project_to_circle(user, project):
         component=f"{user}/{project}/follow".lower(),
         token=circle_token,
     )
-    response = requests.post(url, headers={})
+    response = provider_session("circle").post(url, headers={})
     # It is a strange response code, but is doing what was asked...
     if response.status_code != 400:
         response.raise_for_status()
@@ -262,7 +342,7 @@ def add_project_to_circle(user, project):
         token=circle_token,
     )
     # Disable CircleCI secrets in builds of forked PRs explicitly.
-    response = requests.put(
+    response = provider_session("circle").put(
         url,
         headers=headers,
         json={"feature_flags": {"forks-receive-secret-env-vars": False}},
@@ -270,7 +350,7 @@ def add_project_to_circle(user, project):
     if response.status_code != 200:
         response.raise_for_status()
     # Enable CircleCI builds on forked PRs.
-    response = requests.put(
+    response = provider_session("circle").put(
         url, headers=headers, json={"feature_flags": {"build-fork-prs": True}}
     )
     if response.status_code != 200:
@@ -298,7 +378,7 @@ def add_project_to_appveyor(user, project):
     headers = {"Authorization": f"Bearer {appveyor_token}"}
     url = "https://ci.appveyor.com/api/projects"
 
-    response = requests.get(url, headers=headers)
+    response = provider_session("appveyor").get(url, headers=headers)
     if response.status_code != 201:
         response.raise_for_status()
     repos = [repo["repositoryName"].lower() for repo in response.json()]
@@ -310,7 +390,7 @@ def add_project_to_appveyor(user, project):
             "repositoryProvider": "gitHub",
             "repositoryName": f"{user}/{project}",
         }
-        response = requests.post(url, headers=headers, data=data)
+        response = provider_session("appveyor").post(url, headers=headers, data=data)
         if response.status_code != 201:
             response.raise_for_status()
         print(f" * {user}/{project} has been enabled on appveyor")
@@ -325,7 +405,9 @@ def appveyor_encrypt_binstar_token(feedstock_config_path, user, project):
     anaconda_token = _get_anaconda_token()
     headers = {"Authorization": f"Bearer {appveyor_token}"}
     url = "https://ci.appveyor.com/api/account/encrypt"
-    response = requests.post(url, headers=headers, data={"plainValue": anaconda_token})
+    response = provider_session("appveyor").post(
+        url, headers=headers, data={"plainValue": anaconda_token}
+    )
     if response.status_code != 200:
         raise ValueError(response)
 
@@ -348,7 +430,7 @@ def appveyor_configure(user, project):
         project = project[1:]
     project = project.replace("_", "-").replace(".", "-")
     url = f"https://ci.appveyor.com/api/projects/{user}/{project}/settings"
-    response = requests.get(url, headers=headers)
+    response = provider_session("appveyor").get(url, headers=headers)
     if response.status_code != 200:
         raise ValueError(response)
     content = response.json()
@@ -365,32 +447,81 @@ def appveyor_configure(user, project):
         settings[required_setting] = True
 
     url = "https://ci.appveyor.com/api/projects"
-    response = requests.put(url, headers=headers, json=settings)
+    response = provider_session("appveyor").put(url, headers=headers, json=settings)
     if response.status_code != 204:
         raise ValueError(response)
 
 
+def _travis_sync_delays(timeout, initial_delay=1.0, max_delay=15.0):
+    """Yield the waits between two polls of the Travis sync status.
+
+    The waits double up to ``max_delay``, with jitter so that concurrent
+    waiters do not poll together, and end at ``timeout`` seconds from now.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while (remaining := deadline - time.monotonic()) > 0:
+        yield min(random.uniform(delay / 2, delay), remaining)
+        delay = min(delay * 2, max_delay)
+
+
+def _travis_user_info(headers):
+    response = provider_session("travis").get(
+        f"{travis_endpoint}/user", headers=headers
+    )
+    content = response.json()
+    print(".", end="")
+    sys.stdout.flush()
+    return content
+
+
+def _travis_sync_timed_out(ignore, timeout):
+    if ignore:
+        print(" * Travis is being synced by somebody else. Ignoring")
+    else:
+        raise RuntimeError(f"Syncing has not finished for {timeout} seconds now.")
+
+
 @deprecated(
     "2026.8",
     "2026.10",
     addendum="Travis is deprecated, see #2627",
 )
-def travis_wait_until_synced(ignore=False):
+def travis_wait_until_synced(ignore=False, timeout=120):
+    """Wait for at most ``timeout`` seconds until Travis has synced the user."""
     headers = travis_headers()
-    is_sync_url = f"{travis_endpoint}/user"
-    for _ in range(20):
-        response = requests.get(is_sync_url, headers=headers)
-        content = response.json()
-        print(".", end="")
-        sys.stdout.flush()
-        if "is_syncing" in content and content["is_syncing"] is False:
+    delays = _travis_sync_delays(timeout)
+    while True:
+        content = _travis_user_info(headers)
+        if content.get("is_syncing") is False:
             break
-        time.sleep(6)
-    else:
-        if ignore:
-            print(" * Travis is being synced by somebody else. Ignoring")
-        else:
-            raise RuntimeError("Syncing has not finished for two minutes now.")
+        delay = next(delays, None)
+        if delay is None:
+            _travis_sync_timed_out(ignore, timeout)
+            break
+        time.sleep(delay)
+    print("")
+    return content
+
+
+@deprecated(
+    "2026.8",
+    "2026.10",
+    addendum="Travis is deprecated, see #2627",
+)
+async def travis_wait_until_synced_async(ignore=False, timeout=120):
+    """Like `travis_wait_until_synced`, so that many waits can overlap."""
+    headers = await asyncio.to_thread(travis_headers)
+    delays = _travis_sync_delays(timeout)
+    while True:
+        content = await asyncio.to_thread(_travis_user_info, headers)
+        if content.get("is_syncing") is False:
+            break
+        delay = next(delays, None)
+        if delay is None:
+            _travis_sync_timed_out(ignore, timeout)
+            break
+        await asyncio.sleep(delay)
     print("")
     return content
 
@@ -417,7 +548,7 @@ def travis_repo_writable(repo_info):
 def travis_get_repo_info(user, project, show_error=False):
     headers = travis_headers()
     url = f"{travis_endpoint}/repo/{user}%2F{project}"
-    response = requests.get(url, headers=headers)
+    response = provider_session("travis").get(url, headers=headers)
     try:
         response.raise_for_status()
         content = response.json()
@@ -433,7 +564,7 @@ def travis_get_repo_info(user, project, show_error=False):
     "2026.10",
     addendum="Travis is deprecated, see #2627",
 )
-def add_project_to_travis(user, project):
+def add_project_to_travis(user, project, sync_timeout=120):
     """
     UNUSED
     """
@@ -449,7 +580,7 @@ def add_project_to_travis(user, project):
         # Travis needs syncing. Wait until other syncs are finished.
         print(" * Travis: checking if there's a syncing already", end="")
         sys.stdout.flush()
-        user_info = travis_wait_until_synced(ignore=True)
+        user_info = travis_wait_until_synced(ignore=True, timeout=sync_timeout)
         repo_info = travis_get_repo_info(user, project, show_error=False)
         if not travis_repo_writable(repo_info):
             if not repo_info:
@@ -464,13 +595,13 @@ def add_project_to_travis(user, project):
                 )
             sys.stdout.flush()
             sync_url = "{}/user/{}/sync".format(travis_endpoint, user_info["id"])
-            response = requests.post(sync_url, headers=headers)
+            response = provider_session("travis").post(sync_url, headers=headers)
             if response.status_code != 409:
                 # 409 status code is for indicating that another synching might be happening at the
                 # same time. This can happen in conda-forge/staged-recipes when two master builds
                 # start at the same time
                 response.raise_for_status()
-            travis_wait_until_synced(ignore=False)
+            travis_wait_until_synced(ignore=False, timeout=sync_timeout)
             repo_info = travis_get_repo_info(user, project)
 
     if not repo_info:
@@ -489,7 +620,7 @@ def add_project_to_travis(user, project):
     else:
         repo_id = repo_info["id"]
         url = f"{travis_endpoint}/repo/{repo_id}/activate"
-        response = requests.post(url, headers=headers)
+        response = provider_session("travis").post(url, headers=headers)
         response.raise_for_status()
         print(f" * {user}/{project} registered on travis-ci")
 
@@ -538,7 +669,7 @@ def travis_encrypt_binstar_token(repo, string_to_encrypt):
     from Crypto.PublicKey import RSA
 
     keyurl = f"https://api.travis-ci.com/repo/{repo}/key_pair/generated"
-    r = requests.get(keyurl, headers=travis_headers())
+    r = provider_session("travis").get(keyurl, headers=travis_headers())
     r.raise_for_status()
     public_key = r.json()["public_key"]
     key = RSA.importKey(public_key)
@@ -576,7 +707,7 @@ def travis_configure(user, project):
     for name, value in settings:
         url = f"{travis_endpoint}/repo/{repo_id}/setting/{name}"
         data = {"setting.value": value}
-        response = requests.patch(url, json=data, headers=headers)
+        response = provider_session("travis").patch(url, json=data, headers=headers)
         if response.status_code != 204:
             response.raise_for_status()
 
@@ -604,7 +735,7 @@ def add_token_to_travis(user, project):
 
     repo_id = repo_info["id"]
 
-    r = requests.get(
+    r = provider_session("travis").get(
         f"{travis_endpoint}/repo/{repo_id}/env_vars",
         headers=headers,
     )
@@ -625,14 +756,14 @@ def add_token_to_travis(user, project):
     }
 
     if have_token:
-        r = requests.patch(
+        r = provider_session("travis").patch(
             f"{travis_endpoint}/repo/{repo_id}/env_var/{ev_id}",
             headers=headers,
             json=data,
         )
         r.raise_for_status()
     else:
-        r = requests.post(
+        r = provider_session("travis").post(
             f"{travis_endpoint}/repo/{repo_id}/env_vars",
             headers=headers,
             json=data,
@@ -713,6 +844,79 @@ def get_conda_hook_info(hook_url, events):
     return hook_url, payload
 
 
+CONDA_FORGE_WEBSERVICE_HOOKS = [
+    get_conda_hook_info(
+        "https://conda-forge.herokuapp.com/conda-linting/hook",
+        ["pull_request"],
+    ),
+    get_conda_hook_info(
+        "https://conda-forge.herokuapp.com/conda-forge-feedstocks/hook",
+        ["push", "repository"],
+    ),
+    get_conda_hook_info(
+        "https://conda-forge.herokuapp.com/conda-forge-teams/hook",
+        ["push", "repository"],
+    ),
+    get_conda_hook_info(
+        "https://conda-forge.herokuapp.com/conda-forge-command/hook",
+        [
+            "pull_request_review",
+            "pull_request",
+            "pull_request_review_comment",
+            "issue_comment",
+            "issues",
+        ],
+    ),
+]
+
+
+def _webservice_hook_changes(registered):
+    """The payloads of the missing hooks, and of the outdated hooks by id."""
+    hook_by_url = {
+        hook["config"].get("url"): hook
+        for hook in registered
+        if "url" in hook["config"]
+    }
+    missing = []
+    outdated = {}
+    for hook_url, payload in CONDA_FORGE_WEBSERVICE_HOOKS:
+        hook = hook_by_url.get(hook_url)
+        if hook is None:
+            missing.append(payload)
+        elif (
+            not hook.get("active", True)
+            or set(hook.get("events", [])) != set(payload["events"])
+            or hook["config"].get("content_type") != "json"
+        ):
+            outdated[hook["id"]] = payload
+    return missing, outdated
+
+
+def _reconcile_webservice_hooks(user, repo, headers, update=True, dry_run=False):
+    session = provider_session("github")
+    url = f"https://api.github.com/repos/{user}/{repo}/hooks"
+
+    # Get the current hooks to determine if anything needs doing.
+    response = session.get(url, params={"per_page": 100}, headers=headers)
+    response.raise_for_status()
+    missing, outdated = _webservice_hook_changes(response.json())
+    if not update:
+        outdated = {}
+
+    if not dry_run:
+        for payload in missing:
+            response = session.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+        for hook_id, payload in outdated.items():
+            response = session.patch(f"{url}/{hook_id}", json=payload, headers=headers)
+            response.raise_for_status()
+
+    return {
+        "created": [payload["config"]["url"] for payload in missing],
+        "updated": [payload["config"]["url"] for payload in outdated.values()],
+    }
+
+
 def add_conda_forge_webservice_hooks(user, repo):
     if user != "conda-forge":
         print(
@@ -721,49 +925,28 @@ def add_conda_forge_webservice_hooks(user, repo):
         )
 
     headers = {"Authorization": f"token {github.gh_token()}"}
-    url = f"https://api.github.com/repos/{user}/{repo}/hooks"
+    _reconcile_webservice_hooks(user, repo, headers, update=False)
 
-    # Get the current hooks to determine if anything needs doing.
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    registered = response.json()
-    hook_by_url = {
-        hook["config"].get("url"): hook
-        for hook in registered
-        if "url" in hook["config"]
-    }
 
-    hooks = [
-        get_conda_hook_info(
-            "https://conda-forge.herokuapp.com/conda-linting/hook",
-            ["pull_request"],
-        ),
-        get_conda_hook_info(
-            "https://conda-forge.herokuapp.com/conda-forge-feedstocks/hook",
-            ["push", "repository"],
-        ),
-        get_conda_hook_info(
-            "https://conda-forge.herokuapp.com/conda-forge-teams/hook",
-            ["push", "repository"],
-        ),
-        get_conda_hook_info(
-            "https://conda-forge.herokuapp.com/conda-forge-command/hook",
-            [
-                "pull_request_review",
-                "pull_request",
-                "pull_request_review_comment",
-                "issue_comment",
-                "issues",
-            ],
-        ),
-    ]
+def reconcile_conda_forge_webservice_hooks(user, repos, max_workers=8, dry_run=False):
+    """Create the missing and update the outdated webservice hooks of ``repos``.
 
-    for hook in hooks:
-        hook_url, payload = hook
-        if hook_url not in hook_by_url:
-            response = requests.post(url, json=payload, headers=headers)
-            if response.status_code != 200:
-                response.raise_for_status()
+    At most ``max_workers`` repos are reconciled at the same time. With
+    ``dry_run``, the hooks are only compared. Returns the URLs of the hooks
+    that were created and updated, by repo, and the errors, by repo.
+    """
+    headers = {"Authorization": f"token {github.gh_token()}"}
+    changes = {}
+
+    def reconcile(repo):
+        changes[repo] = _reconcile_webservice_hooks(
+            user, repo, headers, dry_run=dry_run
+        )
+
+    errors = run_in_threads(
+        {repo: partial(reconcile, repo) for repo in repos}, max_workers=max_workers
+    )
+    return {repo: changes[repo] for repo in repos if repo in changes}, errors
 
 
 def _get_anaconda_token():
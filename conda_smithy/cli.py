@@ -1,43 +1,48 @@
 import argparse
+import json
 import logging
 import os
 import subprocess
 import sys
 import tempfile
 import time
+from functools import cache
 from textwrap import dedent
 from typing import Optional, Union
 
-import conda  # noqa
-from conda_build.metadata import MetaData
-from rattler_build_conda_compat.render import MetaData as RattlerMetaData
-from rattler_build_conda_compat.utils import has_recipe as has_recipe_v1
-from ruamel.yaml import YAML
-
-import conda_smithy.cirun_utils
-from conda_smithy import __version__, configure_feedstock, feedstock_io
-from conda_smithy import lint_recipe as linter
-from conda_smithy.configure_feedstock import (
-    _load_forge_config,
-    get_cached_cfp_file_path,
-)
+# Only import what is needed to build the argument parser here. The heavy
+# modules (conda-build, rattler, the linter, configure_feedstock, ...) are
+# imported by the subcommands that need them, so that `--help`, `--version`
+# and the conda plugin stay fast.
+from conda_smithy import __version__, feedstock_io
 from conda_smithy.deprecations import deprecated
-from conda_smithy.utils import (
-    CONDA_BUILD,
-    RATTLER_BUILD,
-    _get_metadata_from_feedstock_dir,
-    get_feedstock_name_from_meta,
-    merge_dict,
-)
 
 
 def default_feedstock_config_path(feedstock_directory):
     return os.path.join(feedstock_directory, "conda-forge.yml")
 
 
+@cache
+def _default_feedstock_directory(cwd):
+    # all subcommands share this default, only look for the repo once
+    return feedstock_io.get_repo_root(cwd) or cwd
+
+
+def _read_feedstock_batch(path):
+    """Read the names of feedstock repos from ``path``, one per line."""
+    with open(path) as fh:
+        lines = [line.strip() for line in fh]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
 def generate_feedstock_content(
     target_directory, source_recipe_dir, conda_build_tool: Optional[str] = None
 ):
+    from ruamel.yaml import YAML
+
+    from conda_smithy import configure_feedstock
+    from conda_smithy.utils import merge_dict
+
     target_directory = os.path.abspath(target_directory)
     recipe_dir = "recipe"
     target_recipe_dir = os.path.join(target_directory, recipe_dir)
@@ -120,6 +125,16 @@ class Init(Subcommand):
         )
 
     def __call__(self, args):
+        from conda_build.metadata import MetaData
+        from rattler_build_conda_compat.render import MetaData as RattlerMetaData
+        from rattler_build_conda_compat.utils import has_recipe as has_recipe_v1
+
+        from conda_smithy.utils import (
+            CONDA_BUILD,
+            RATTLER_BUILD,
+            get_feedstock_name_from_meta,
+        )
+
         # check some error conditions
         if args.recipe_directory and not os.path.isdir(args.recipe_directory):
             raise OSError(
@@ -241,7 +256,7 @@ class RegisterCI(Subcommand):
         scp = self.subcommand_parser
         scp.add_argument(
             "--feedstock_directory",
-            default=feedstock_io.get_repo_root(os.getcwd()) or os.getcwd(),
+            default=_default_feedstock_directory(os.getcwd()),
             help="The directory of the feedstock git repository.",
         )
         scp.add_argument(
@@ -329,7 +344,16 @@ class RegisterCI(Subcommand):
         )
 
     def __call__(self, args):
+        import conda_smithy.cirun_utils
         from conda_smithy import ci_register
+        from conda_smithy.configure_feedstock import (
+            _load_forge_config,
+            get_cached_cfp_file_path,
+        )
+        from conda_smithy.utils import (
+            _get_metadata_from_feedstock_dir,
+            get_feedstock_name_from_meta,
+        )
 
         owner = args.user or args.organization
 
@@ -540,7 +564,7 @@ class AddAzureBuildId(Subcommand):
         scp = self.subcommand_parser
         scp.add_argument(
             "--feedstock_directory",
-            default=feedstock_io.get_repo_root(os.getcwd()) or os.getcwd(),
+            default=_default_feedstock_directory(os.getcwd()),
             help="The directory of the feedstock git repository.",
         )
         scp.add_argument(
@@ -604,7 +628,7 @@ class Regenerate(Subcommand):
         scp = self.subcommand_parser
         scp.add_argument(
             "--feedstock_directory",
-            default=feedstock_io.get_repo_root(os.getcwd()) or os.getcwd(),
+            default=_default_feedstock_directory(os.getcwd()),
             help="The directory of the feedstock git repository.",
         )
         scp.add_argument(
@@ -644,6 +668,20 @@ class Regenerate(Subcommand):
             default=None,
             help="Temporary directory to download and extract conda-forge-pinning to",
         )
+        scp.add_argument(
+            "--offline",
+            action="store_true",
+            default=False,
+            help="Skip optional network lookups, i.e. the up-to-date checks and "
+            "the Azure build_id lookup for the README",
+        )
+        scp.add_argument(
+            "--manifest",
+            default=None,
+            help="Write a JSON manifest of the rerender to this path, listing the "
+            "generated files with their hashes, the variants, the versions used "
+            "and the duration of each phase",
+        )
 
     def __call__(self, args):
         if args.temporary_directory is None:
@@ -653,6 +691,8 @@ class Regenerate(Subcommand):
             self._call(args, args.temporary_directory)
 
     def _call(self, args, temporary_directory):
+        from conda_smithy import configure_feedstock
+
         configure_feedstock.main(
             args.feedstock_directory,
             forge_yml=args.feedstock_config,
@@ -661,6 +701,8 @@ class Regenerate(Subcommand):
             exclusive_config_file=args.exclusive_config_file,
             check=args.check,
             temporary_directory=temporary_directory,
+            offline=args.offline,
+            manifest_path=args.manifest,
         )
 
 
@@ -680,19 +722,62 @@ class RecipeLint(Subcommand):
             default=None,
             help="feedstock directory",
         )
+        scp.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of recipes to lint in parallel worker processes.",
+        )
+        scp.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            help=(
+                "Output format. 'json' prints the lints and hints of every "
+                "recipe together with their message identifiers."
+            ),
+        )
+        scp.add_argument(
+            "--profile",
+            action="store_true",
+            help="Report the time spent in the slowest lint rules on stderr.",
+        )
+        scp.add_argument(
+            "--cache",
+            action="store_true",
+            help=(
+                "Reuse the results of an earlier run for recipes whose "
+                "contents, conda-forge.yml and linter data did not change."
+            ),
+        )
         scp.add_argument("recipe_directory", default=[os.getcwd()], nargs="*")
 
     def __call__(self, args):
+        from conda_smithy import lint_recipe as linter
+
         all_good = True
-        for recipe in args.recipe_directory:
-            lints, hints = linter.main(
-                os.path.join(recipe),
-                conda_forge=args.conda_forge,
-                return_hints=True,
-                feedstock_dir=args.feedstock_dir,
-            )
+        json_results = []
+        timings = {} if args.profile else None
+        for recipe, lints, hints in linter.lint_recipes(
+            args.recipe_directory,
+            conda_forge=args.conda_forge,
+            feedstock_dir=args.feedstock_dir,
+            jobs=args.jobs,
+            timings=timings,
+            use_cache=args.cache,
+        ):
             if lints:
                 all_good = False
+            if args.format == "json":
+                json_results.append(
+                    {
+                        "recipe": recipe,
+                        "lints": [linter.message_as_dict(lint) for lint in lints],
+                        "hints": [linter.message_as_dict(hint) for hint in hints],
+                    }
+                )
+            elif lints:
                 print(
                     "{} has some lint:\n  {}".format(
                         recipe,
@@ -714,6 +799,12 @@ class RecipeLint(Subcommand):
                 )
             else:
                 print(f"{recipe} is in fine form")
+        if args.format == "json":
+            print(json.dumps(json_results, indent=2))
+        if timings is not None:
+            from conda_smithy.linter.registry import format_timings
+
+            print(format_timings(timings), file=sys.stderr)
         # Exit code 1 for some lint, 0 for no lint.
         sys.exit(int(not all_good))
 
@@ -821,9 +912,17 @@ class GenerateFeedstockToken(Subcommand):
         scp = self.subcommand_parser
         scp.add_argument(
             "--feedstock_directory",
-            default=feedstock_io.get_repo_root(os.getcwd()) or os.getcwd(),
+            default=_default_feedstock_directory(os.getcwd()),
             help="The directory of the feedstock git repository.",
         )
+        scp.add_argument(
+            "--batch",
+            default=None,
+            help=(
+                "A file with the names of feedstock repos, one per line, to "
+                "generate tokens for instead of the one in --feedstock_directory."
+            ),
+        )
         scp.add_argument(
             "--unique-token-per-provider",
             action="store_true",
@@ -846,22 +945,26 @@ class GenerateFeedstockToken(Subcommand):
         )
 
         owner = args.user or args.organization
-        repo = os.path.basename(os.path.abspath(args.feedstock_directory))
-
-        if not args.unique_token_per_provider:
-            generate_and_write_feedstock_token(owner, repo)
-            print(
-                f"Your feedstock token has been generated at {feedstock_token_local_path(owner, repo)}\n"
-                "This token is stored in plaintext so be careful!"
-            )
+        if args.batch:
+            repos = _read_feedstock_batch(args.batch)
         else:
-            for ci in self.ci_names:
-                provider = ci.lower().replace("-", "_")
-                generate_and_write_feedstock_token(owner, repo, provider=provider)
+            repos = [os.path.basename(os.path.abspath(args.feedstock_directory))]
+
+        for repo in repos:
+            if not args.unique_token_per_provider:
+                generate_and_write_feedstock_token(owner, repo)
                 print(
-                    f"Your feedstock token has been generated at {feedstock_token_local_path(owner, repo, provider=provider)}\n"
+                    f"Your feedstock token has been generated at {feedstock_token_local_path(owner, repo)}\n"
                     "This token is stored in plaintext so be careful!"
                 )
+            else:
+                for ci in self.ci_names:
+                    provider = ci.lower().replace("-", "_")
+                    generate_and_write_feedstock_token(owner, repo, provider=provider)
+                    print(
+                        f"Your feedstock token has been generated at {feedstock_token_local_path(owner, repo, provider=provider)}\n"
+                        "This token is stored in plaintext so be careful!"
+                    )
 
 
 class RegisterFeedstockToken(Subcommand):
@@ -889,9 +992,25 @@ class RegisterFeedstockToken(Subcommand):
         scp = self.subcommand_parser
         scp.add_argument(
             "--feedstock_directory",
-            default=feedstock_io.get_repo_root(os.getcwd()) or os.getcwd(),
+            default=_default_feedstock_directory(os.getcwd()),
             help="The directory of the feedstock git repository.",
         )
+        scp.add_argument(
+            "--batch",
+            default=None,
+            help=(
+                "A file with the names of feedstock repos, one per line, to "
+                "register instead of the one in --feedstock_directory. Their "
+                "tokens are added to the token registry in a single commit."
+            ),
+        )
+        scp.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of worker processes that hash the tokens of a --batch.",
+        )
         scp.add_argument(
             "--token_repo",
             default=None,
@@ -957,6 +1076,7 @@ class RegisterFeedstockToken(Subcommand):
         from conda_smithy.feedstock_tokens import (
             register_feedstock_token,
             register_feedstock_token_with_providers,
+            register_feedstock_tokens,
         )
 
         drone_endpoints = args.drone_endpoints
@@ -964,7 +1084,10 @@ class RegisterFeedstockToken(Subcommand):
             drone_endpoints = [drone_default_endpoint]
 
         owner = args.user or args.organization
-        repo = os.path.basename(os.path.abspath(args.feedstock_directory))
+        if args.batch:
+            repos = _read_feedstock_batch(args.batch)
+        else:
+            repos = [os.path.basename(os.path.abspath(args.feedstock_directory))]
 
         if args.token_repo is None:
             token_repo = (
@@ -981,30 +1104,49 @@ class RegisterFeedstockToken(Subcommand):
                 setattr(args, ci, args.enable_ci)
 
         # do all providers first
-        register_feedstock_token_with_providers(
-            owner,
-            repo,
-            drone=args.drone,
-            circle=args.circle,
-            travis=args.travis,
-            azure=args.azure,
-            github_actions=args.github_actions,
-            drone_endpoints=drone_endpoints,
-            unique_token_per_provider=args.unique_token_per_provider,
-        )
+        for repo in repos:
+            register_feedstock_token_with_providers(
+                owner,
+                repo,
+                drone=args.drone,
+                circle=args.circle,
+                travis=args.travis,
+                azure=args.azure,
+                github_actions=args.github_actions,
+                drone_endpoints=drone_endpoints,
+                unique_token_per_provider=args.unique_token_per_provider,
+            )
 
         if args.existing_tokens_time_to_expiration is not None:
             expiry = int(args.existing_tokens_time_to_expiration)
         else:
             expiry = None
         # then if that works do the github repo
-        if args.unique_token_per_provider:
+        if args.batch:
+            if args.unique_token_per_provider:
+                providers = [
+                    ci_pretty.lower().replace("-", "_")
+                    for ci_pretty in self.ci_names
+                    if getattr(args, ci_pretty.lower().replace("-", "_"))
+                ]
+            else:
+                providers = [None]
+            if repos and providers:
+                register_feedstock_tokens(
+                    owner,
+                    repos,
+                    token_repo,
+                    providers=providers,
+                    existing_tokens_time_to_expiration=expiry,
+                    jobs=args.jobs,
+                )
+        elif args.unique_token_per_provider:
             for ci_pretty in self.ci_names:
                 ci = ci_pretty.lower().replace("-", "_")
                 if getattr(args, ci):
                     register_feedstock_token(
                         owner,
-                        repo,
+                        repos[0],
                         token_repo,
                         provider=ci,
                         existing_tokens_time_to_expiration=expiry,
@@ -1012,7 +1154,7 @@ class RegisterFeedstockToken(Subcommand):
         else:
             register_feedstock_token(
                 owner,
-                repo,
+                repos[0],
                 token_repo,
                 provider=None,
                 existing_tokens_time_to_expiration=expiry,
@@ -1050,7 +1192,7 @@ class UpdateAnacondaToken(Subcommand):
         scp = self.subcommand_parser
         scp.add_argument(
             "--feedstock_directory",
-            default=feedstock_io.get_repo_root(os.getcwd()) or os.getcwd(),
+            default=_default_feedstock_directory(os.getcwd()),
             help="The directory of the feedstock git repository.",
         )
         scp.add_argument(
@@ -1064,6 +1206,21 @@ class UpdateAnacondaToken(Subcommand):
             default="BINSTAR_TOKEN",
             help="The name of the environment variable you'd like to hold the token.",
         )
+        scp.add_argument(
+            "--batch",
+            default=None,
+            help=(
+                "A file with feedstock directories, one per line, whose tokens "
+                "are rotated instead of the one in --feedstock_directory."
+            ),
+        )
+        scp.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=8,
+            help="Maximum number of providers updated at the same time in a --batch.",
+        )
         group = scp.add_mutually_exclusive_group()
         group.add_argument("--user", help="github username of the repo")
         group.add_argument(
@@ -1100,7 +1257,10 @@ class UpdateAnacondaToken(Subcommand):
         )
 
     def __call__(self, args):
-        from conda_smithy.anaconda_token_rotation import rotate_anaconda_token
+        from conda_smithy.anaconda_token_rotation import (
+            rotate_anaconda_token,
+            rotate_anaconda_tokens,
+        )
 
         owner = args.user or args.organization
         repo = os.path.basename(os.path.abspath(args.feedstock_directory))
@@ -1110,7 +1270,8 @@ class UpdateAnacondaToken(Subcommand):
                 args.feedstock_directory
             )
 
-        print("Updating the anaconda/binstar token. Can take up to ~30 seconds.")
+        if not args.batch:
+            print("Updating the anaconda/binstar token. Can take up to ~30 seconds.")
         from conda_smithy.ci_register import drone_default_endpoint
 
         drone_endpoints = args.drone_endpoints
@@ -1121,25 +1282,57 @@ class UpdateAnacondaToken(Subcommand):
             if getattr(args, ci.lower().replace("-", "_")) is None:
                 setattr(args, ci.lower().replace("-", "_"), args.enable_ci)
 
-        # do all providers first
-        rotate_anaconda_token(
-            owner,
-            repo,
-            args.feedstock_config,
-            drone=args.drone,
-            circle=args.circle,
-            travis=args.travis,
-            azure=args.azure,
-            appveyor=args.appveyor,
-            github_actions=args.github_actions,
-            token_name=args.token_name,
-            drone_endpoints=drone_endpoints,
-        )
+        failures = {}
+        if args.batch:
+            feedstock_directories = _read_feedstock_batch(args.batch)
+            feedstocks = {
+                os.path.basename(os.path.abspath(directory)): (
+                    default_feedstock_config_path(directory)
+                )
+                for directory in feedstock_directories
+            }
+            print(
+                f"Updating the anaconda/binstar token of {len(feedstocks)} feedstocks."
+            )
+            failures = rotate_anaconda_tokens(
+                owner,
+                feedstocks,
+                drone=args.drone,
+                circle=args.circle,
+                travis=args.travis,
+                azure=args.azure,
+                appveyor=args.appveyor,
+                github_actions=args.github_actions,
+                token_name=args.token_name,
+                drone_endpoints=drone_endpoints,
+                max_workers=args.jobs,
+            )
+            for err_msg in failures.values():
+                print(err_msg)
+            print(
+                "Successfully updated the anaconda/binstar token for "
+                f"{len(feedstocks) - len(failures)} of {len(feedstocks)} feedstocks!"
+            )
+        else:
+            # do all providers first
+            rotate_anaconda_token(
+                owner,
+                repo,
+                args.feedstock_config,
+                drone=args.drone,
+                circle=args.circle,
+                travis=args.travis,
+                azure=args.azure,
+                appveyor=args.appveyor,
+                github_actions=args.github_actions,
+                token_name=args.token_name,
+                drone_endpoints=drone_endpoints,
+            )
 
-        print(
-            f"Successfully updated the anaconda/binstar token for "
-            f"{args.feedstock_directory}!"
-        )
+            print(
+                f"Successfully updated the anaconda/binstar token for "
+                f"{args.feedstock_directory}!"
+            )
         if args.appveyor:
             deprecated.topic(
                 "2026.8", "2026.10", addendum="Travis CI is deprecated. See #2627."
@@ -1148,6 +1341,74 @@ class UpdateAnacondaToken(Subcommand):
                 "Appveyor tokens are stored in the repo so you must commit the "
                 "local changes and push them before the new token will be used!"
             )
+        if failures:
+            raise RuntimeError(
+                f"Updating the anaconda/binstar token failed for {len(failures)} "
+                "feedstocks!"
+            )
+
+
+class ReconcileWebserviceHooks(Subcommand):
+    subcommand = "reconcile-webservice-hooks"
+
+    def __init__(self, parser):
+        super().__init__(
+            parser,
+            "Create the missing and update the outdated conda-forge webservice "
+            "hooks of many feedstock repos.",
+        )
+        scp = self.subcommand_parser
+        scp.add_argument(
+            "batch",
+            help="A file with the names of the feedstock repos, one per line.",
+        )
+        group = scp.add_mutually_exclusive_group()
+        group.add_argument("--user", help="github username of the repos")
+        group.add_argument(
+            "--organization",
+            default="conda-forge",
+            help="github organization of the repos",
+        )
+        scp.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=8,
+            help="Maximum number of repos reconciled at the same time.",
+        )
+        scp.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the hooks that would be created or updated.",
+        )
+
+    def __call__(self, args):
+        from conda_smithy.ci_register import reconcile_conda_forge_webservice_hooks
+
+        owner = args.user or args.organization
+        repos = _read_feedstock_batch(args.batch)
+        changes, errors = reconcile_conda_forge_webservice_hooks(
+            owner, repos, max_workers=args.jobs, dry_run=args.dry_run
+        )
+
+        verb = "would be" if args.dry_run else "were"
+        for repo, change in changes.items():
+            for action in ("created", "updated"):
+                for hook_url in change[action]:
+                    print(f" * {owner}/{repo}: {hook_url} {verb} {action}")
+        for repo, error in errors.items():
+            print(f" * {owner}/{repo}: failed with {error!r}")
+        n_created = sum(len(change["created"]) for change in changes.values())
+        n_updated = sum(len(change["updated"]) for change in changes.values())
+        n_changed = sum(1 for change in changes.values() if any(change.values()))
+        print(
+            f"{n_created} hooks {verb} created and {n_updated} {verb} updated "
+            f"on {n_changed} of {len(repos)} repos."
+        )
+        if errors:
+            raise RuntimeError(
+                f"Reconciling the webservice hooks failed for {len(errors)} repos!"
+            )
 
 
 if __name__ == "__main__":
@@ -6,11 +6,13 @@ import logging
 import os
 import pprint
 import re
+import stat
 import subprocess
 import sys
 import textwrap
 import time
 from collections import Counter, OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from copy import deepcopy
 from functools import cache, lru_cache
@@ -50,16 +52,22 @@ from conda_smithy import __version__
 from conda_smithy.deprecations import deprecated
 from conda_smithy.feedstock_io import (
     copy_file,
+    file_state,
+    get_repo,
+    record_changes,
     remove_file,
     remove_file_or_dir,
+    remove_files,
     set_exe_file,
     write_file,
+    write_files,
 )
 from conda_smithy.utils import (
     RATTLER_BUILD,
     HashableDict,
     ensure_standard_strings,
     fill_workflow_settings_defaults,
+    get_cache_dir,
     get_feedstock_about_from_meta,
     get_feedstock_name_from_meta,
     get_workflow_settings,
@@ -100,6 +108,11 @@ CONDA_FORGE_PINNING_LIFETIME = int(
     os.environ.get("CONDA_FORGE_PINNING_LIFETIME", 15 * 60)
 )
 
+# Cache lifetime of the Azure build_id lookups in seconds, default 1 week
+AZURE_BUILD_ID_LIFETIME = int(
+    os.environ.get("CONDA_SMITHY_AZURE_BUILD_ID_LIFETIME", 7 * 24 * 60 * 60)
+)
+
 # platforms for which ``shellcheck`` has been built for conda-forge
 # see https://github.com/conda-forge/conda-smithy/pull/2395
 CONDA_FORGE_SHELLCHECK_PLATFORMS = [
@@ -2321,6 +2334,105 @@ def azure_build_id_from_public(forge_config):
     forge_config["azure"]["build_id"] = build_def["id"]
 
 
+def _azure_build_id_cache_path():
+    return get_cache_dir() / "conda-smithy" / "azure-build-ids.json"
+
+
+def _azure_build_id_cache_key(forge_config):
+    return "/".join(
+        [
+            forge_config["azure"]["user_or_org"],
+            forge_config["azure"]["project_name"],
+            forge_config["github"]["repo_name"],
+        ]
+    )
+
+
+def _read_azure_build_id_cache():
+    try:
+        with open(_azure_build_id_cache_path(), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_cached_azure_build_id(forge_config):
+    """Return the Azure `build_id` cached for the org, project and repo of
+    `forge_config`, or None if it is not cached or has expired."""
+    entry = _read_azure_build_id_cache().get(_azure_build_id_cache_key(forge_config))
+    if not entry:
+        return None
+    if int(time.time()) - entry["ts"] > AZURE_BUILD_ID_LIFETIME:
+        return None
+    return entry["build_id"]
+
+
+def _write_cached_azure_build_id(forge_config, build_id):
+    cache_path = _azure_build_id_cache_path()
+    cache = _read_azure_build_id_cache()
+    cache[_azure_build_id_cache_key(forge_config)] = {
+        "build_id": build_id,
+        "ts": int(time.time()),
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent rerenders never
+        # read a partially written cache
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        logger.debug("Could not write the Azure build_id cache: %s", err)
+
+
+def resolve_azure_build_id(forge_config):
+    """Retrieve the Azure `build_id` for `forge_config`.
+
+    The local cache is consulted first, then the public Azure API and finally
+    the Azure API using a token. Successful lookups are cached for
+    `AZURE_BUILD_ID_LIFETIME` seconds. Returns None if the lookup failed.
+    `forge_config` is not modified.
+    """
+    build_id = get_cached_azure_build_id(forge_config)
+    if build_id is not None:
+        return build_id
+
+    lookup_config = {
+        "azure": dict(forge_config["azure"]),
+        "github": {"repo_name": forge_config["github"]["repo_name"]},
+    }
+    # Try to retrieve the build_id from the interwebs.
+    # Works if the Azure CI is public
+    try:
+        azure_build_id_from_public(lookup_config)
+    except (OSError, IndexError) as err:
+        # We don't want to command to fail if requesting the build_id fails.
+        logger.warning(
+            "Azure build_id can't be retrieved using the Azure token. Exception: %s",
+            err,
+        )
+        return None
+    except JSONDecodeError:
+        azure_build_id_from_token(lookup_config)
+
+    build_id = lookup_config["azure"]["build_id"]
+    if build_id is not None:
+        _write_cached_azure_build_id(forge_config, build_id)
+    return build_id
+
+
+def start_azure_build_id_lookup(forge_config):
+    """Start `resolve_azure_build_id` in a background thread, so that the
+    network lookup overlaps with the rendering of the CI configurations.
+
+    Returns a `concurrent.futures.Future` holding the `build_id`.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    lookup = executor.submit(resolve_azure_build_id, copy.deepcopy(forge_config))
+    executor.shutdown(wait=False)
+    return lookup
+
+
 def get_maintainer_url(user_or_team):
     if "/" in user_or_team:
         org, team_name = user_or_team.split("/")
@@ -2329,7 +2441,14 @@ def get_maintainer_url(user_or_team):
         return f"https://github.com/{user_or_team}/"
 
 
-def render_readme(jinja_env, forge_config, forge_dir, render_info=None):
+def render_readme(
+    jinja_env,
+    forge_config,
+    forge_dir,
+    render_info=None,
+    azure_build_id_lookup=None,
+    offline=False,
+):
     if "README.md" in forge_config["skip_render"]:
         logger.info("README.md rendering is skipped")
         return
@@ -2445,19 +2564,11 @@ def render_readme(jinja_env, forge_config, forge_dir, render_info=None):
 
     forge_config["channel_targets"] = channel_targets
 
-    if forge_config["azure"].get("build_id") is None:
-        # Try to retrieve the build_id from the interwebs.
-        # Works if the Azure CI is public
-        try:
-            azure_build_id_from_public(forge_config)
-        except (OSError, IndexError) as err:
-            # We don't want to command to fail if requesting the build_id fails.
-            logger.warning(
-                "Azure build_id can't be retrieved using the Azure token. Exception: %s",
-                err,
-            )
-        except JSONDecodeError:
-            azure_build_id_from_token(forge_config)
+    if forge_config["azure"].get("build_id") is None and not offline:
+        if azure_build_id_lookup is not None:
+            forge_config["azure"]["build_id"] = azure_build_id_lookup.result()
+        else:
+            forge_config["azure"]["build_id"] = resolve_azure_build_id(forge_config)
 
     logger.debug("README")
     logger.debug(yaml.dump(forge_config))
@@ -2551,10 +2662,104 @@ def render_pixi(jinja_env, forge_config, forge_dir):
         fh.write(new_file_contents.rstrip() + "\n")
 
 
-def copy_feedstock_content(forge_config, forge_dir):
+FeedstockContentFile = namedtuple(
+    "FeedstockContentFile", ["rel_path", "mode", "sha256", "git_oid", "data"]
+)
+
+
+@cache
+def get_feedstock_content_manifest():
+    """Return the files shipped in `feedstock_content` as a tuple of
+    `FeedstockContentFile`, sorted by their relative (posix) path.
+
+    The content is what `copy_file` would write, i.e. utf-8 text files are
+    normalized to LF line endings, and files in `ALL_EXECUTABLE_FILES` are
+    executable. The package content doesn't change after installation, so
+    this is only computed once per process.
+    """
     feedstock_content = os.path.join(conda_forge_content, "feedstock_content")
-    skip_files = _get_skip_files(forge_config)
-    copytree(feedstock_content, forge_dir, skip_files)
+    manifest = []
+    for root, dirs, files in os.walk(feedstock_content):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    data = fh.read().encode("utf-8")
+            except UnicodeDecodeError:
+                with open(path, "rb") as fh:
+                    data = fh.read()
+            rel_path = Path(os.path.relpath(path, feedstock_content)).as_posix()
+            mode = os.stat(path).st_mode & 0o777
+            if rel_path in ALL_EXECUTABLE_FILES:
+                mode |= stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+            git_oid = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+            manifest.append(
+                FeedstockContentFile(
+                    rel_path=rel_path,
+                    mode=mode,
+                    sha256=hashlib.sha256(data).hexdigest(),
+                    git_oid=git_oid,
+                    data=data,
+                )
+            )
+    return tuple(sorted(manifest))
+
+
+def _compile_skip_matcher(skip_files):
+    """Compile a matcher which is true for a relative posix path if the path
+    or any of its parents is in `skip_files`, i.e. the same as `_ignore_match`"""
+    prefixes = sorted(
+        {PurePath(f).as_posix().rstrip("/") for f in skip_files} - {"", "."}
+    )
+    if not prefixes:
+        return lambda rel_path: False
+    pattern = re.compile(
+        "(?:{})(?:/|$)".format("|".join(re.escape(prefix) for prefix in prefixes))
+    )
+    return lambda rel_path: pattern.match(rel_path) is not None
+
+
+def _is_feedstock_content_uptodate(forge_dir, entry, tracked):
+    if file_state(forge_dir / entry.rel_path) != (entry.sha256, entry.mode):
+        return False
+    if tracked is None:
+        return True
+    # also make sure that git tracks the file as it is
+    git_mode = 0o100755 if entry.mode & stat.S_IXUSR else 0o100644
+    return tracked.get(entry.rel_path) == (entry.git_oid, git_mode)
+
+
+def copy_feedstock_content(forge_config, forge_dir):
+    """Sync the packaged `feedstock_content` into `forge_dir`, except for
+    files in `skip_render`. Only files which differ are written."""
+    is_skipped = _compile_skip_matcher(_get_skip_files(forge_config))
+    forge_dir = Path(forge_dir).resolve()
+
+    # git index entries of the files in forge_dir, keyed by their path
+    # relative to forge_dir
+    tracked = None
+    repo = get_repo(forge_dir)
+    if repo is not None:
+        prefix = forge_dir.relative_to(Path(repo.workdir).resolve()).as_posix()
+        prefix = "" if prefix == "." else prefix + "/"
+        tracked = {
+            entry.path[len(prefix) :]: (str(entry.id), entry.mode)
+            for entry in repo.index
+            if entry.path.startswith(prefix)
+        }
+
+    outdated = []
+    for entry in get_feedstock_content_manifest():
+        if is_skipped(entry.rel_path):
+            logger.info("%s rendering is skipped", entry.rel_path)
+        elif not _is_feedstock_content_uptodate(forge_dir, entry, tracked):
+            outdated.append(entry)
+
+    write_files(
+        (os.path.join(forge_dir, entry.rel_path), entry.data, entry.mode)
+        for entry in outdated
+    )
 
 
 def _update_dict_within_dict(items, config):
@@ -3053,13 +3258,6 @@ def get_cfp_file_path(temporary_directory):
     return cf_pinning_file, cf_pinning_ver
 
 
-def get_cache_dir():
-    if sys.platform.startswith("win"):
-        return Path(os.environ.get("TEMP", Path.home() / ".cache"))
-    else:
-        return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
-
-
 def get_cached_cfp_file_path(temporary_directory):
     if cache_dir := get_cache_dir():
         smithy_cache = cache_dir / "conda-smithy"
@@ -3095,10 +3293,7 @@ def get_cached_cfp_file_path(temporary_directory):
 
 def clear_variants(forge_dir):
     "Remove all variant files placed in the .ci_support path"
-    if os.path.isdir(os.path.join(forge_dir, ".ci_support")):
-        configs = glob.glob(os.path.join(forge_dir, ".ci_support", "*.yaml"))
-        for config in configs:
-            remove_file(config)
+    remove_files(glob.glob(os.path.join(forge_dir, ".ci_support", "*.yaml")))
 
 
 def _iter_all_templates(forge_dir):
@@ -3116,13 +3311,16 @@ deprecated.constant(
 
 
 def clear_scripts(forge_dir):
-    for folder in [
-        ".azure-pipelines",
-        ".circleci",
-        ".drone",
-        ".travis",
-        ".scripts",
-    ]:
+    # only the existing files are removed, in a single git index update
+    scripts = [
+        os.path.join(forge_dir, folder, old_file)
+        for folder in [
+            ".azure-pipelines",
+            ".circleci",
+            ".drone",
+            ".travis",
+            ".scripts",
+        ]
         for old_file in [
             "run_docker_build.sh",
             "build_steps.sh",
@@ -3134,8 +3332,9 @@ def clear_scripts(forge_dir):
             "create_pagefile.sh",
             "SetPageFileSize.ps1",
             "free_disk_space.sh",
-        ]:
-            remove_file(os.path.join(forge_dir, folder, old_file))
+        ]
+    ]
+    remove_files(scripts)
 
 
 def make_jinja_env(feedstock_directory):
@@ -3246,6 +3445,68 @@ def set_migration_fns(forge_dir, forge_config):
     return
 
 
+@contextmanager
+def _timed(timings, phase):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = round(time.perf_counter() - start, 6)
+
+
+def _get_migration_versions(migration_fns):
+    """Return the timestamp and migration number of the used migrations"""
+    migrations = {}
+    for full_path in migration_fns:
+        with open(full_path, encoding="utf-8") as f:
+            migration_yaml = yaml.load(f, Loader=yaml.loader.BaseLoader) or {}
+        migrations[os.path.basename(full_path)] = {
+            "migrator_ts": migration_yaml.get("migrator_ts"),
+            "migration_number": migration_yaml.get("__migrator", {}).get(
+                "migration_number", "1"
+            ),
+        }
+    return migrations
+
+
+def make_rerender_manifest(
+    forge_dir, recorded_changes, render_info, tool_versions, migration_fns, timings
+):
+    """Create a JSON-serializable summary of a rerender.
+
+    `recorded_changes` is the result of `feedstock_io.record_changes` while
+    rerendering. Files which neither existed before nor after the rerender
+    are left out.
+    """
+    files = {}
+    for path, old_state in sorted(recorded_changes.items()):
+        new_state = file_state(path)
+        if old_state is None and new_state is None:
+            continue
+        rel_path = Path(os.path.relpath(path, forge_dir)).as_posix()
+        files[rel_path] = {
+            "sha256": new_state[0] if new_state else None,
+            "mode": oct(new_state[1]) if new_state else None,
+            "changed": old_state != new_state,
+        }
+
+    variants = {}
+    for ri in render_info:
+        for cfg in ri["forge_config"].get("configs", []):
+            variants.setdefault(ri["provider_name"], {}).setdefault(
+                cfg["platform"], []
+            ).append(cfg["config_name"])
+
+    return {
+        "changed": any(f["changed"] for f in files.values()),
+        "files": files,
+        "variants": variants,
+        "versions": tool_versions,
+        "migrations": _get_migration_versions(migration_fns),
+        "timings": timings,
+    }
+
+
 def main(
     forge_file_directory,
     forge_yml=None,
@@ -3254,93 +3515,141 @@ def main(
     exclusive_config_file=None,
     check=False,
     temporary_directory=None,
+    offline=False,
+    manifest_path=None,
 ):
+    """Rerender the feedstock in `forge_file_directory`.
+
+    Returns the rerender manifest (see `make_rerender_manifest`), which is
+    also written as JSON to `manifest_path` if given. With `check`, only
+    checks that conda-smithy is up-to-date and returns True.
+    """
     loglevel = os.environ.get("CONDA_SMITHY_LOGLEVEL", "INFO").upper()
     logger.setLevel(loglevel)
 
-    if check or not no_check_uptodate:
+    timings = {}
+    if check or not (no_check_uptodate or offline):
         # Check that conda-smithy is up-to-date
-        check_version_uptodate("conda-smithy", __version__, True)
+        with _timed(timings, "check_uptodate"):
+            check_version_uptodate("conda-smithy", __version__, True)
         if check:
             return True
 
     forge_dir = os.path.abspath(forge_file_directory)
 
-    if exclusive_config_file is not None:
-        exclusive_config_file = os.path.join(forge_dir, exclusive_config_file)
-        if not os.path.exists(exclusive_config_file):
-            raise RuntimeError("Given exclusive-config-file not found.")
-        cf_pinning_ver = None
+    with _timed(timings, "pinning"):
+        if exclusive_config_file is not None:
+            exclusive_config_file = os.path.join(forge_dir, exclusive_config_file)
+            if not os.path.exists(exclusive_config_file):
+                raise RuntimeError("Given exclusive-config-file not found.")
+            cf_pinning_ver = None
 
-    else:
-        exclusive_config_file, cf_pinning_ver = get_cached_cfp_file_path(
-            temporary_directory
-        )
+        else:
+            exclusive_config_file, cf_pinning_ver = get_cached_cfp_file_path(
+                temporary_directory
+            )
 
-    config = _load_forge_config(forge_dir, exclusive_config_file, forge_yml)
-    config["feedstock_name"] = config["github"]["repo_name"]
+    with _timed(timings, "load_config"):
+        config = _load_forge_config(forge_dir, exclusive_config_file, forge_yml)
+        config["feedstock_name"] = config["github"]["repo_name"]
+
+    # the Azure build_id is only needed for the README, look it up while
+    # the CI configurations are rendered
+    azure_build_id_lookup = None
+    if (
+        not offline
+        and config["azure"].get("build_id") is None
+        and "README.md" not in config["skip_render"]
+    ):
+        azure_build_id_lookup = start_azure_build_id_lookup(config)
 
     env = make_jinja_env(forge_dir)
     logger.debug("env rendered")
 
-    copy_feedstock_content(config, forge_dir)
-    exe_files = [".scripts/logging_utils.sh", "build-locally.py"]
-    _add_exec_bit(exe_files, forge_dir)
-
-    clear_variants(forge_dir)
-    clear_scripts(forge_dir)
-    set_migration_fns(forge_dir, config)
-    logger.debug("migration fns set")
-
-    # the order of these calls appears to matter
-    render_info = []
-    render_info.append(render_circle(env, config, forge_dir, return_metadata=True))
-    logger.debug("circle rendered")
-
-    render_info.append(render_travis(env, config, forge_dir, return_metadata=True))
-    logger.debug("travis rendered")
-
-    render_info.append(render_appveyor(env, config, forge_dir, return_metadata=True))
-    logger.debug("appveyor rendered")
-
-    render_info.append(render_azure(env, config, forge_dir, return_metadata=True))
-    logger.debug("azure rendered")
+    with record_changes() as recorded_changes:
+        with _timed(timings, "feedstock_content"):
+            copy_feedstock_content(config, forge_dir)
+            exe_files = [".scripts/logging_utils.sh", "build-locally.py"]
+            _add_exec_bit(exe_files, forge_dir)
+
+        with _timed(timings, "clear"):
+            clear_variants(forge_dir)
+            clear_scripts(forge_dir)
+        with _timed(timings, "migrations"):
+            set_migration_fns(forge_dir, config)
+        logger.debug("migration fns set")
+
+        # the order of these calls appears to matter
+        render_info = []
+        for provider_name, render in [
+            ("circle", render_circle),
+            ("travis", render_travis),
+            ("appveyor", render_appveyor),
+            ("azure", render_azure),
+            ("drone", render_drone),
+            ("woodpecker", render_woodpecker),
+            ("github_actions", render_github_actions),
+        ]:
+            with _timed(timings, f"render_{provider_name}"):
+                render_info.append(render(env, config, forge_dir, return_metadata=True))
+            logger.debug("%s rendered", provider_name)
+
+        with _timed(timings, "render_github_actions_services"):
+            render_github_actions_services(env, config, forge_dir)
+        logger.debug("github_actions services rendered")
+
+        with _timed(timings, "render_pixi"):
+            render_pixi(env, config, forge_dir)
+        logger.debug("pixi config rendered")
+
+        # put azure first just in case
+        azure_ind = ([ri["provider_name"] for ri in render_info]).index("azure")
+        tmp = render_info[0]
+        render_info[0] = render_info[azure_ind]
+        render_info[azure_ind] = tmp
+        with _timed(timings, "render_readme"):
+            render_readme(
+                env,
+                config,
+                forge_dir,
+                render_info,
+                azure_build_id_lookup=azure_build_id_lookup,
+                offline=offline,
+            )
 
-    render_info.append(render_drone(env, config, forge_dir, return_metadata=True))
-    logger.debug("drone rendered")
+        logger.debug("README rendered")
 
-    render_info.append(render_woodpecker(env, config, forge_dir, return_metadata=True))
-    logger.debug("woodpecker rendered")
+    tool_versions = {
+        "conda-smithy": __version__,
+        "conda-forge-pinning": cf_pinning_ver,
+        "conda-build": conda_build_version,
+        "rattler-build": rattler_build_version(),
+        "rattler-build-conda-compat": importlib_version("rattler_build_conda_compat"),
+    }
+    with _timed(timings, "commit"):
+        commit_changes(
+            forge_file_directory,
+            commit,
+            tool_versions["conda-smithy"],
+            tool_versions["conda-forge-pinning"],
+            tool_versions["conda-build"],
+            tool_versions["rattler-build"],
+            tool_versions["rattler-build-conda-compat"],
+        )
 
-    render_info.append(
-        render_github_actions(env, config, forge_dir, return_metadata=True)
-    )
-    logger.debug("github_actions rendered")
-
-    render_github_actions_services(env, config, forge_dir)
-    logger.debug("github_actions services rendered")
-
-    render_pixi(env, config, forge_dir)
-    logger.debug("pixi config rendered")
-
-    # put azure first just in case
-    azure_ind = ([ri["provider_name"] for ri in render_info]).index("azure")
-    tmp = render_info[0]
-    render_info[0] = render_info[azure_ind]
-    render_info[azure_ind] = tmp
-    render_readme(env, config, forge_dir, render_info)
-
-    logger.debug("README rendered")
-
-    commit_changes(
-        forge_file_directory,
-        commit,
-        __version__,
-        cf_pinning_ver,
-        conda_build_version,
-        rattler_build_version(),
-        importlib_version("rattler_build_conda_compat"),
+    manifest = make_rerender_manifest(
+        forge_dir,
+        recorded_changes,
+        render_info,
+        tool_versions,
+        config["migration_fns"],
+        timings,
     )
+    if manifest_path is not None:
+        with open(manifest_path, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+    return manifest
 
 
 if __name__ == "__main__":
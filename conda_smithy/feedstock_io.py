@@ -1,9 +1,13 @@
+import contextvars
+import hashlib
 import os
 import shutil
 import stat
 from contextlib import contextmanager
 from pathlib import Path
 
+_recorded_changes = contextvars.ContextVar("recorded_changes", default=None)
+
 
 def get_repo(path, search_parent_directories=True):
     repo = None
@@ -34,7 +38,47 @@ def get_repo_root(path):
     return repo.workdir.rstrip(os.path.sep)
 
 
+def file_state(filename):
+    """Return the ``(sha256, mode)`` of a file, or None if it does not exist."""
+    try:
+        with open(filename, "rb") as fh:
+            digest = hashlib.file_digest(fh, "sha256").hexdigest()
+        return digest, os.stat(filename).st_mode & 0o777
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+@contextmanager
+def record_changes():
+    """Record the files written or removed with the functions of this module.
+
+    Usage:
+    >>> with record_changes() as changes:
+    ...     with write_file("README.md") as fh:
+    ...         fh.write("hello")
+
+    The yielded dict maps the absolute path of every touched file to its
+    `file_state` from before it was first touched.
+    """
+    changes = {}
+    token = _recorded_changes.set(changes)
+    try:
+        yield changes
+    finally:
+        _recorded_changes.reset(token)
+
+
+def _record(filename):
+    changes = _recorded_changes.get()
+    if changes is None:
+        return
+    path = os.path.abspath(filename)
+    if path not in changes:
+        changes[path] = file_state(path)
+
+
 def set_exe_file(filename, set_exe=True):
+    _record(filename)
     all_execute_permissions = stat.S_IXOTH | stat.S_IXGRP | stat.S_IXUSR
 
     repo = get_repo(filename)
@@ -58,6 +102,7 @@ def set_exe_file(filename, set_exe=True):
 
 @contextmanager
 def write_file(filename):
+    _record(filename)
     dirname = os.path.dirname(filename)
     if dirname and not os.path.exists(dirname):
         os.makedirs(dirname)
@@ -81,6 +126,11 @@ def remove_file_or_dir(filename):
     if not os.path.isdir(filename):
         return remove_file(filename)
 
+    if _recorded_changes.get() is not None:
+        for root, _, files in os.walk(filename):
+            for name in files:
+                _record(os.path.join(root, name))
+
     repo = get_repo(filename)
     if repo:
         index_path = Path(filename).resolve().relative_to(repo.workdir).as_posix()
@@ -90,6 +140,7 @@ def remove_file_or_dir(filename):
 
 
 def remove_file(filename):
+    _record(filename)
     touch_file(filename)
 
     repo = get_repo(filename)
@@ -108,6 +159,84 @@ def remove_file(filename):
         os.removedirs(dirname)
 
 
+def write_files(files):
+    """
+    Write several files at once and add them to the git index in a single
+    index write.
+
+    `files` is an iterable of ``(filename, data, mode)`` tuples, where `data`
+    are the bytes to write and `mode` the permission bits of the file.
+    Parent directories will be created.
+    """
+    repo = None
+    index_paths = []
+    for filename, data, mode in files:
+        _record(filename)
+        parent = os.path.dirname(filename)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with open(filename, "wb") as fh:
+            fh.write(data)
+        os.chmod(filename, mode)
+
+        if repo is None:
+            repo = get_repo(filename)
+        if repo:
+            index_paths.append(
+                Path(filename).resolve().relative_to(repo.workdir).as_posix()
+            )
+
+    if repo and index_paths:
+        for index_path in index_paths:
+            repo.index.add(index_path)
+        repo.index.write()
+
+
+def remove_files(filenames):
+    """
+    Remove several files from disk and from the git index, with a single
+    index write.
+
+    Filenames which neither exist nor are tracked by git are ignored, so this
+    can be used to clean up a list of possibly stale files cheaply. Parent
+    directories which are left empty are removed.
+    """
+    filenames = [os.path.abspath(filename) for filename in filenames]
+    if not filenames:
+        return
+
+    # get the repo from the closest existing directory
+    repo_path = filenames[0]
+    while not os.path.exists(repo_path):
+        repo_path = os.path.dirname(repo_path)
+    repo = get_repo(repo_path)
+
+    index_paths = []
+    stale = []
+    for filename in filenames:
+        index_path = None
+        if repo:
+            index_path = Path(filename).resolve().relative_to(repo.workdir).as_posix()
+            if index_path in repo.index:
+                index_paths.append(index_path)
+        if os.path.isfile(filename) or index_path in index_paths:
+            _record(filename)
+            stale.append(filename)
+
+    if index_paths:
+        for index_path in index_paths:
+            repo.index.remove(index_path)
+        repo.index.write()
+
+    for filename in stale:
+        if os.path.isfile(filename):
+            os.remove(filename)
+
+    for dirname in sorted({os.path.dirname(f) for f in stale}, reverse=True):
+        if os.path.isdir(dirname) and not os.listdir(dirname):
+            os.removedirs(dirname)
+
+
 def copy_file(src, dst):
     """
     Tried to copy utf-8 text files line-by-line to avoid
@@ -117,6 +246,7 @@ def copy_file(src, dst):
 
     Parent directories will be created for `dst`.
     """
+    _record(dst)
     parent = os.path.dirname(dst)
     if parent:
         os.makedirs(parent, exist_ok=True)
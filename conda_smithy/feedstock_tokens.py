@@ -23,23 +23,26 @@ as a secret variable on the CI services. It is also hashed using `scrypt` and
 then uploaded to the token registry (a repo on GitHub).
 """
 
+import hashlib
 import hmac
 import json
+import multiprocessing
 import os
 import secrets
+import shutil
 import subprocess
-import tempfile
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from contextlib import contextmanager, redirect_stderr, redirect_stdout
-from pathlib import Path
+from functools import partial
 
 import pygit2
-import requests
 import scrypt
 from conda_build.utils import create_file_with_permissions
 
 from conda_smithy.deprecations import deprecated
-from conda_smithy.utils import file_permissions
+from conda_smithy.utils import file_permissions, get_cache_dir, run_in_threads
 
 
 class FeedstockTokenError(Exception):
@@ -60,6 +63,188 @@ def _secure_io():
                 yield
 
 
+def _get_token_repo_url(token_repo):
+    """Fill the GitHub token into the URL of the token repo."""
+    from conda_smithy.github import gh_token
+
+    github_token = gh_token()
+    return (
+        token_repo.replace("$GITHUB_TOKEN", github_token)
+        .replace("${GITHUB_TOKEN}", github_token)
+        .replace("$GH_TOKEN", github_token)
+        .replace("${GH_TOKEN}", github_token)
+    )
+
+
+def _token_repo_mirror_path(token_repo):
+    # named after the URL template, so that no token ends up in the path
+    name = hashlib.sha256(token_repo.encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir() / "conda-smithy" / "token-repos" / name
+
+
+@contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on ``path`` across processes (a no-op on Windows)."""
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+
+    with open(path, "a") as fp:
+        if fcntl is not None:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+
+
+def _fetch_token_repo(repo, token_repo_url):
+    """Fast-forward the branch of the mirror ``repo`` to the token repo."""
+    branch = repo.head.shorthand
+    # the URL may contain a token, so do not record it in FETCH_HEAD
+    subprocess.run(
+        [
+            "git",
+            "fetch",
+            "-q",
+            "--no-write-fetch-head",
+            token_repo_url,
+            f"refs/heads/{branch}:refs/heads/{branch}",
+        ],
+        check=True,
+        cwd=repo.path,
+    )
+
+
+def _update_token_repo_mirror(mirror, token_repo_url):
+    if mirror.exists():
+        try:
+            repo = pygit2.Repository(str(mirror))
+            _fetch_token_repo(repo, token_repo_url)
+            return repo
+        except Exception:
+            # e.g. the mirror is corrupt or the history was rewritten
+            shutil.rmtree(mirror)
+
+    tmp_mirror = mirror.with_name(f"{mirror.name}.{os.getpid()}.tmp")
+    try:
+        # cloning via subprocesses to take advantage of git SSH support
+        subprocess.run(
+            [
+                "git",
+                "clone",
+                "-q",
+                "--bare",
+                "--depth",
+                "1",
+                token_repo_url,
+                str(tmp_mirror),
+            ],
+            check=True,
+        )
+        # the URL may contain a token, so do not keep it in the config
+        subprocess.run(
+            ["git", "remote", "remove", "origin"], check=True, cwd=tmp_mirror
+        )
+        os.replace(tmp_mirror, mirror)
+    finally:
+        if tmp_mirror.exists():
+            shutil.rmtree(tmp_mirror)
+    return pygit2.Repository(str(mirror))
+
+
+@contextmanager
+def _token_repo_mirror(token_repo):
+    """Yield an up-to-date local mirror of the token repo and the URL to push to.
+
+    The mirror is a bare repository in the conda-smithy cache directory that
+    is shared by all calls and updated by fetching and fast-forwarding its
+    branch instead of cloning the token repo again. It is locked while in use.
+    The URL, which may contain a token, is only ever passed to git on the
+    command line.
+    """
+    token_repo_url = _get_token_repo_url(token_repo)
+    mirror = _token_repo_mirror_path(token_repo)
+    mirror.parent.mkdir(parents=True, exist_ok=True)
+    with _file_lock(mirror.with_name(f"{mirror.name}.lock")):
+        yield _update_token_repo_mirror(mirror, token_repo_url), token_repo_url
+
+
+def _read_token_data(repo, project):
+    """Read ``tokens/<project>.json`` from the branch of ``repo`` without a
+    checkout. Returns None if the project has no token file.
+    """
+    tree = repo.head.peel(pygit2.Commit).tree
+    try:
+        blob = tree[f"tokens/{project}.json"]
+    except KeyError:
+        return None
+    token_data = json.loads(blob.data)
+    if "tokens" not in token_data:
+        token_data = {"tokens": [token_data]}
+    return token_data
+
+
+def _write_token_files(repo, tree, token_files):
+    """Write a copy of ``tree`` with the token data of the projects in
+    ``token_files`` and return its id.
+    """
+    try:
+        tokens = repo.TreeBuilder(tree["tokens"])
+    except KeyError:
+        tokens = repo.TreeBuilder()
+    for project, token_data in token_files.items():
+        blob_id = repo.create_blob(json.dumps(token_data).encode("utf-8"))
+        tokens.insert(f"{project}.json", blob_id, pygit2.GIT_FILEMODE_BLOB)
+    root = repo.TreeBuilder(tree)
+    root.insert("tokens", tokens.write(), pygit2.GIT_FILEMODE_TREE)
+    return root.write()
+
+
+def _push_token_files(repo, token_repo_url, update, message, attempts=5):
+    """Commit the token files computed by ``update`` and push them.
+
+    ``update`` is called with the mirror ``repo`` and returns the new token
+    data by project. If the push is rejected because the token repo moved on,
+    the mirror is fast-forwarded and ``update`` is applied again on top of it,
+    like a ``git pull --rebase``.
+    """
+    branch = repo.head.shorthand
+    for attempt in range(attempts):
+        head = repo.head.peel(pygit2.Commit)
+        tree_id = _write_token_files(repo, head.tree, update(repo))
+        commit_id = subprocess.run(
+            ["git", "commit-tree", str(tree_id), "-p", str(head.id), "-m", message],
+            check=True,
+            cwd=repo.path,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        try:
+            subprocess.run(
+                [
+                    "git",
+                    "push",
+                    "-q",
+                    token_repo_url,
+                    f"{commit_id}:refs/heads/{branch}",
+                ],
+                check=True,
+                cwd=repo.path,
+            )
+        except subprocess.CalledProcessError:
+            if attempt == attempts - 1:
+                raise
+            _fetch_token_repo(repo, token_repo_url)
+        else:
+            repo.references.create(
+                f"refs/heads/{branch}", pygit2.Oid(hex=commit_id), force=True
+            )
+            return
+
+
 def feedstock_token_local_path(user, project, provider=None):
     """Return the path locally where the feedstock
     token is stored.
@@ -155,6 +340,87 @@ def read_feedstock_token(user, project, provider=None):
     return feedstock_token, err_msg
 
 
+def _feedstock_token_candidates(token_data, provider):
+    """Return the tokens in ``token_data`` that are valid for ``provider``
+    now, in the order in which they are most likely to match.
+    """
+    now = time.time()
+    candidates = []
+    for td in token_data["tokens"]:
+        _provider = td.get("provider", None)
+        _expires_at = td.get("expires_at", None)
+        if ((_provider is None) or (_provider == provider)) and (
+            (_expires_at is None) or (_expires_at > now)
+        ):
+            candidates.append(td)
+    # new tokens are appended to the file, and provider-specific tokens
+    # are only registered for feedstocks that use them
+    candidates.reverse()
+    candidates.sort(key=lambda td: td.get("provider", None) is None)
+    return candidates
+
+
+def _check_feedstock_token(feedstock_token, td):
+    salted_token = scrypt.hash(
+        feedstock_token,
+        bytes.fromhex(td["salt"]),
+        buflen=256,
+    )
+    return hmac.compare_digest(
+        salted_token,
+        bytes.fromhex(td["hashed_token"]),
+    )
+
+
+_scrypt_pool_lock = threading.Lock()
+# (pid, jobs, pool) of the current process, never inherited by forked children
+_scrypt_pool = None
+
+
+def _get_scrypt_pool(jobs):
+    """A pool of ``jobs`` worker processes for the scrypt hashes.
+
+    The pool is reused by later calls with the same ``jobs``, so that the
+    workers are only started once per process.
+    """
+    global _scrypt_pool
+    with _scrypt_pool_lock:
+        if (
+            _scrypt_pool is None
+            or _scrypt_pool[:2] != (os.getpid(), jobs)
+            or _scrypt_pool[2]._broken
+        ):
+            if _scrypt_pool is not None and _scrypt_pool[0] == os.getpid():
+                # the hashes already submitted to the old pool still finish
+                _scrypt_pool[2].shutdown(wait=False)
+            pool = ProcessPoolExecutor(
+                max_workers=jobs,
+                # forking is not safe, the callers may run in threads
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _scrypt_pool = (os.getpid(), jobs, pool)
+        return _scrypt_pool[2]
+
+
+def _any_feedstock_token_matches(feedstock_token, candidates, jobs=1):
+    """Whether ``feedstock_token`` matches one of the ``candidates``,
+    stopping at the first match.
+    """
+    if jobs <= 1 or len(candidates) <= 1:
+        return any(_check_feedstock_token(feedstock_token, td) for td in candidates)
+
+    pool = _get_scrypt_pool(jobs)
+    futures = [
+        pool.submit(_check_feedstock_token, feedstock_token, td) for td in candidates
+    ]
+    try:
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        # do not start the hashes that are no longer needed
+        for future in futures:
+            future.cancel()
+
+
 def feedstock_token_exists(user, project, token_repo, provider=None):
     """Test if the feedstock token exists for the given repo.
 
@@ -165,47 +431,16 @@ def feedstock_token_exists(user, project, token_repo, provider=None):
     If you need to debug this function, define `DEBUG_FEEDSTOCK_TOKENS` in
     your environment before calling this function.
     """
-    from conda_smithy.github import gh_token
-
-    github_token = gh_token()
-
     exists = False
     failed = False
     err_msg = None
-    with _secure_io(), tempfile.TemporaryDirectory() as tmpdir:
+    with _secure_io():
         try:
-            # clone the repo
-            _token_repo = (
-                token_repo.replace("$GITHUB_TOKEN", github_token)
-                .replace("${GITHUB_TOKEN}", github_token)
-                .replace("$GH_TOKEN", github_token)
-                .replace("${GH_TOKEN}", github_token)
-            )
-            subprocess.run(
-                ["git", "clone", "-q", "--depth", "1", _token_repo, tmpdir],
-                check=True,
-            )
-            token_file = os.path.join(
-                tmpdir,
-                "tokens",
-                project + ".json",
-            )
+            with _token_repo_mirror(token_repo) as (repo, _):
+                token_data = _read_token_data(repo, project)
 
-            if os.path.exists(token_file):
-                with open(token_file) as fp:
-                    token_data = json.load(fp)
-
-                if "tokens" not in token_data:
-                    token_data = {"tokens": [token_data]}
-
-                now = time.time()
-                for td in token_data["tokens"]:
-                    _provider = td.get("provider", None)
-                    _expires_at = td.get("expires_at", None)
-                    if ((_provider is None) or (_provider == provider)) and (
-                        (_expires_at is None) or (_expires_at > now)
-                    ):
-                        exists = True
+            if token_data is not None:
+                exists = bool(_feedstock_token_candidates(token_data, provider))
         except Exception as e:
             if "DEBUG_FEEDSTOCK_TOKENS" in os.environ:
                 raise e
@@ -226,9 +461,16 @@ def feedstock_token_exists(user, project, token_repo, provider=None):
     return exists
 
 
-def is_valid_feedstock_token(user, project, feedstock_token, token_repo, provider=None):
+def is_valid_feedstock_token(
+    user, project, feedstock_token, token_repo, provider=None, jobs=1
+):
     """Test if the input feedstock_token is valid.
 
+    Only the tokens registered for ``provider`` (or for all providers) that
+    have not expired are checked, and the check stops at the first one that
+    matches. With ``jobs > 1``, the scrypt hashes of the candidate tokens are
+    computed in that many worker processes.
+
     All exceptions are swallowed and stdout/stderr from this function is
     redirected to `/dev/null`. Sanitized error messages are
     displayed at the end.
@@ -236,59 +478,23 @@ def is_valid_feedstock_token(user, project, feedstock_token, token_repo, provide
     If you need to debug this function, define `DEBUG_FEEDSTOCK_TOKENS` in
     your environment before calling this function.
     """
-    from conda_smithy.github import gh_token
-
-    github_token = gh_token()
-
     failed = False
     err_msg = None
     valid = False
 
     # capture stdout, stderr and suppress all exceptions so we don't
     # spill tokens
-    with _secure_io(), tempfile.TemporaryDirectory() as tmpdir:
+    with _secure_io():
         try:
-            # clone the repo
-            _token_repo = (
-                token_repo.replace("$GITHUB_TOKEN", github_token)
-                .replace("${GITHUB_TOKEN}", github_token)
-                .replace("$GH_TOKEN", github_token)
-                .replace("${GH_TOKEN}", github_token)
-            )
-            subprocess.run(
-                ["git", "clone", "-q", "--depth", "1", _token_repo, tmpdir],
-                check=True,
-            )
-            token_file = os.path.join(
-                tmpdir,
-                "tokens",
-                project + ".json",
-            )
-
-            if os.path.exists(token_file):
-                with open(token_file) as fp:
-                    token_data = json.load(fp)
-
-                if "tokens" not in token_data:
-                    token_data = {"tokens": [token_data]}
-
-                now = time.time()
-                for td in token_data["tokens"]:
-                    _provider = td.get("provider", None)
-                    _expires_at = td.get("expires_at", None)
-                    if ((_provider is None) or (_provider == provider)) and (
-                        (_expires_at is None) or (_expires_at > now)
-                    ):
-                        salted_token = scrypt.hash(
-                            feedstock_token,
-                            bytes.fromhex(td["salt"]),
-                            buflen=256,
-                        )
-
-                        valid = hmac.compare_digest(
-                            salted_token,
-                            bytes.fromhex(td["hashed_token"]),
-                        )
+            with _token_repo_mirror(token_repo) as (repo, _):
+                token_data = _read_token_data(repo, project)
+
+            if token_data is not None:
+                valid = _any_feedstock_token_matches(
+                    feedstock_token,
+                    _feedstock_token_candidates(token_data, provider),
+                    jobs,
+                )
         except Exception as e:
             if "DEBUG_FEEDSTOCK_TOKENS" in os.environ:
                 raise e
@@ -309,6 +515,73 @@ def is_valid_feedstock_token(user, project, feedstock_token, token_repo, provide
     return valid
 
 
+def _expire_tokens(tokens, provider, existing_tokens_time_to_expiration):
+    """Drop the expired ``tokens`` and, if ``existing_tokens_time_to_expiration``
+    is not None, mark the current ones of ``provider`` to expire.
+    """
+    # clean out old tokens
+    now = time.time()
+    tokens = [td for td in tokens if td.get("expires_at", now) >= now]
+
+    if existing_tokens_time_to_expiration is not None:
+        # expire current tokens if needed
+        now_plus_expire = now + existing_tokens_time_to_expiration
+
+        for i in range(len(tokens)):
+            tokens_provider = tokens[i].get("provider", None)
+            if (
+                # doesn't have an expiration time currently
+                "expires_at" not in tokens[i]
+                and (
+                    # if token is generic, it always expires
+                    tokens_provider is None
+                    or (
+                        # if token is not generic, it has to match providers
+                        tokens_provider is not None
+                        and provider is not None
+                        and tokens_provider == provider
+                    )
+                )
+            ):
+                tokens[i]["expires_at"] = now_plus_expire
+    return tokens
+
+
+def _hash_feedstock_token(feedstock_token, provider=None):
+    """Salt and hash ``feedstock_token`` into its entry in the token repo."""
+    salt = os.urandom(64)
+    salted_token = scrypt.hash(feedstock_token, salt, buflen=256)
+    data = {
+        "salt": salt.hex(),
+        "hashed_token": salted_token.hex(),
+    }
+    if provider is not None:
+        data["provider"] = provider
+    return data
+
+
+def _append_tokens(new_tokens, existing_tokens_time_to_expiration):
+    """Return the ``update`` for `_push_token_files` that appends the token
+    entries in ``new_tokens`` (a list per project) to the token files.
+    """
+
+    def update(repo):
+        token_files = {}
+        for project, entries in new_tokens.items():
+            token_data = _read_token_data(repo, project) or {"tokens": []}
+            tokens = token_data["tokens"]
+            for provider in dict.fromkeys(data.get("provider") for data in entries):
+                tokens = _expire_tokens(
+                    tokens, provider, existing_tokens_time_to_expiration
+                )
+            # append the tokens
+            token_data["tokens"] = tokens + entries
+            token_files[project] = token_data
+        return token_files
+
+    return update
+
+
 def register_feedstock_token(
     user,
     project,
@@ -332,16 +605,12 @@ def register_feedstock_token(
     If you need to debug this function, define `DEBUG_FEEDSTOCK_TOKENS` in
     your environment before calling this function.
     """
-    from conda_smithy.github import gh_token
-
-    github_token = gh_token()
-
     failed = False
     err_msg = None
 
     # capture stdout, stderr and suppress all exceptions so we don't
     # spill tokens
-    with _secure_io(), tempfile.TemporaryDirectory() as tmpdir:
+    with _secure_io():
         try:
             feedstock_token, err_msg = read_feedstock_token(
                 user, project, provider=provider
@@ -350,94 +619,19 @@ def register_feedstock_token(
                 failed = True
                 raise FeedstockTokenError(err_msg)
 
-            # clone the repo
-            _token_repo = (
-                token_repo.replace("$GITHUB_TOKEN", github_token)
-                .replace("${GITHUB_TOKEN}", github_token)
-                .replace("$GH_TOKEN", github_token)
-                .replace("${GH_TOKEN}", github_token)
-            )
-            # cloning via subprocesses to take advantage of git SSH support
-            subprocess.run(
-                ["git", "clone", "-q", "--depth", "1", _token_repo, tmpdir],
-                check=True,
+            data = _hash_feedstock_token(feedstock_token, provider)
+            update = _append_tokens(
+                {project: [data]}, existing_tokens_time_to_expiration
             )
-            repo = pygit2.Repository(tmpdir)
-            token_file = os.path.join(
-                tmpdir,
-                "tokens",
-                project + ".json",
-            )
-
-            # append the token if needed
-            if os.path.exists(token_file):
-                with open(token_file) as fp:
-                    token_data = json.load(fp)
-                if "tokens" not in token_data:
-                    token_data = {"tokens": [token_data]}
-            else:
-                token_data = {"tokens": []}
 
-            # clean out old tokens
-            now = time.time()
-            token_data["tokens"] = [
-                td for td in token_data["tokens"] if td.get("expires_at", now) >= now
-            ]
-
-            if existing_tokens_time_to_expiration is not None:
-                # expire current tokens if needed
-                now_plus_expire = now + existing_tokens_time_to_expiration
-
-                for i in range(len(token_data["tokens"])):
-                    tokens_provider = token_data["tokens"][i].get("provider", None)
-                    if (
-                        # doesn't have an expiration time currently
-                        "expires_at" not in token_data["tokens"][i]
-                        and (
-                            # if token is generic, it always expires
-                            tokens_provider is None
-                            or (
-                                # if token is not generic, it has to match providers
-                                tokens_provider is not None
-                                and provider is not None
-                                and tokens_provider == provider
-                            )
-                        )
-                    ):
-                        token_data["tokens"][i]["expires_at"] = now_plus_expire
-
-            # salt, encrypt and write
-            salt = os.urandom(64)
-            salted_token = scrypt.hash(feedstock_token, salt, buflen=256)
-            data = {
-                "salt": salt.hex(),
-                "hashed_token": salted_token.hex(),
-            }
-            if provider is not None:
-                data["provider"] = provider
-            token_data["tokens"].append(data)
-            with open(token_file, "w") as fp:
-                json.dump(token_data, fp)
-
-            # push
-            index_path = Path(token_file).resolve().relative_to(tmpdir).as_posix()
-            repo.index.add(index_path)
-            repo.index.write()
-            subprocess.run(
-                [
-                    "git",
-                    "commit",
-                    "-q",
-                    "-m",
+            with _token_repo_mirror(token_repo) as (repo, token_repo_url):
+                _push_token_files(
+                    repo,
+                    token_repo_url,
+                    update,
                     "[ci skip] [skip ci] [cf admin skip] ***NO_CI*** "
                     f"added token for {user}/{project} on provider{'' if provider is None else ' ' + provider}",
-                ],
-                check=True,
-                cwd=tmpdir,
-            )
-
-            subprocess.run(["git", "pull", "-q", "--rebase"], check=True, cwd=tmpdir)
-            subprocess.run(["git", "push", "-q"], check=True, cwd=tmpdir)
+                )
         except Exception as e:
             if "DEBUG_FEEDSTOCK_TOKENS" in os.environ:
                 raise e
@@ -458,6 +652,92 @@ def register_feedstock_token(
     return failed
 
 
+def register_feedstock_tokens(
+    user,
+    projects,
+    token_repo,
+    providers=(None,),
+    existing_tokens_time_to_expiration=None,
+    jobs=1,
+):
+    """Register the feedstock tokens of many feedstocks with the token repo.
+
+    This is the bulk version of `register_feedstock_token`: the tokens of
+    every project in ``projects`` for every provider in ``providers`` (None
+    for the generic token) are read, hashed, with ``jobs`` worker processes
+    if ``jobs > 1``, and added to the token repo in a single commit and push.
+    If the push is rejected, only the token files are rewritten on top of
+    the new commits of the token repo; the tokens are not hashed again.
+
+    All exceptions are swallowed and stdout/stderr from this function is
+    redirected to `/dev/null`. Sanitized error messages are
+    displayed at the end.
+
+    If you need to debug this function, define `DEBUG_FEEDSTOCK_TOKENS` in
+    your environment before calling this function.
+    """
+    failed = False
+    err_msg = None
+
+    # capture stdout, stderr and suppress all exceptions so we don't
+    # spill tokens
+    with _secure_io():
+        try:
+            keys = [
+                (project, provider) for project in projects for provider in providers
+            ]
+            tokens = []
+            for project, provider in keys:
+                feedstock_token, err_msg = read_feedstock_token(
+                    user, project, provider=provider
+                )
+                if err_msg:
+                    failed = True
+                    raise FeedstockTokenError(err_msg)
+                tokens.append(feedstock_token)
+
+            token_providers = [provider for _, provider in keys]
+            if jobs > 1 and len(keys) > 1:
+                pool = _get_scrypt_pool(jobs)
+                entries = list(pool.map(_hash_feedstock_token, tokens, token_providers))
+            else:
+                entries = list(map(_hash_feedstock_token, tokens, token_providers))
+
+            new_tokens = {project: [] for project in projects}
+            for (project, _), data in zip(keys, entries):
+                new_tokens[project].append(data)
+            update = _append_tokens(new_tokens, existing_tokens_time_to_expiration)
+
+            provider_names = ", ".join(
+                "generic" if provider is None else provider for provider in providers
+            )
+            with _token_repo_mirror(token_repo) as (repo, token_repo_url):
+                _push_token_files(
+                    repo,
+                    token_repo_url,
+                    update,
+                    "[ci skip] [skip ci] [cf admin skip] ***NO_CI*** "
+                    f"added tokens for {len(new_tokens)} feedstocks of {user} "
+                    f"on providers {provider_names}",
+                )
+        except Exception as e:
+            if "DEBUG_FEEDSTOCK_TOKENS" in os.environ:
+                raise e
+            failed = True
+
+    if failed:
+        if err_msg:
+            raise FeedstockTokenError(err_msg)
+        else:
+            raise FeedstockTokenError(
+                f"Registering the feedstock tokens for {len(projects)} feedstocks"
+                f" of {user} failed! Try the command locally with"
+                " DEBUG_FEEDSTOCK_TOKENS defined in the environment to investigate!"
+            )
+
+    return failed
+
+
 def register_feedstock_token_with_providers(
     user,
     project,
@@ -470,12 +750,17 @@ def register_feedstock_token_with_providers(
     clobber=True,
     drone_endpoints=(),
     unique_token_per_provider=False,
+    max_workers=None,
 ):
     """Register the feedstock token with provider CI services.
 
     Note that if a feedstock token is already registered and `clobber=True`
     this function will overwrite existing tokens.
 
+    The providers are updated concurrently, with at most ``max_workers``
+    threads (by default one per provider). A failure on one provider does
+    not stop the others.
+
     All exceptions are swallowed and stdout/stderr from this function is
     redirected to `/dev/null`. Sanitized error messages are
     displayed at the end.
@@ -489,21 +774,7 @@ def register_feedstock_token_with_providers(
     from .azure_ci_utils import default_config  # noqa
     from conda_smithy.ci_register import drone_default_endpoint
 
-    def _register_token(user, project, clobber, provider, func, args=None):
-        args = args or tuple()
-
-        if unique_token_per_provider:
-            feedstock_token, err_msg = read_feedstock_token(
-                user, project, provider=provider
-            )
-        else:
-            feedstock_token, err_msg = read_feedstock_token(
-                user, project, provider=None
-            )
-
-        if err_msg:
-            raise FeedstockTokenError(err_msg)
-
+    def _register_token(provider, func, feedstock_token, args=()):
         try:
             func(user, project, feedstock_token, clobber, *args)
         except Exception as e:
@@ -523,52 +794,45 @@ def register_feedstock_token_with_providers(
 
     with _secure_io():
         try:
+            providers = []
             if circle:
-                _register_token(
-                    user,
-                    project,
-                    clobber,
-                    "circle",
-                    add_feedstock_token_to_circle,
-                )
-
+                providers.append(("circle", add_feedstock_token_to_circle, ()))
             if drone:
                 for drone_endpoint in drone_endpoints:
-                    _register_token(
-                        user,
-                        project,
-                        clobber,
-                        "drone",
-                        add_feedstock_token_to_drone,
-                        args=(drone_endpoint,),
+                    providers.append(
+                        ("drone", add_feedstock_token_to_drone, (drone_endpoint,))
                     )
-
             if travis:
-                _register_token(
-                    user,
-                    project,
-                    clobber,
-                    "travis",
-                    add_feedstock_token_to_travis,
-                )
-
+                providers.append(("travis", add_feedstock_token_to_travis, ()))
             if azure:
-                _register_token(
-                    user,
-                    project,
-                    clobber,
-                    "azure",
-                    add_feedstock_token_to_azure,
+                providers.append(("azure", add_feedstock_token_to_azure, ()))
+            if github_actions:
+                providers.append(
+                    ("github_actions", add_feedstock_token_to_github_actions, ())
                 )
 
-            if github_actions:
-                _register_token(
+            # read all of the tokens before touching any provider
+            tasks = {}
+            for provider, func, args in providers:
+                feedstock_token, err_msg = read_feedstock_token(
                     user,
                     project,
-                    clobber,
-                    "github_actions",
-                    add_feedstock_token_to_github_actions,
+                    provider=provider if unique_token_per_provider else None,
+                )
+                if err_msg:
+                    raise FeedstockTokenError(err_msg)
+                tasks[provider, args] = partial(
+                    _register_token, provider, func, feedstock_token, args
                 )
+
+            errors = run_in_threads(tasks, max_workers=max_workers)
+            if errors:
+                error = next(iter(errors.values()))
+                if "DEBUG_FEEDSTOCK_TOKENS" in os.environ or not all(
+                    isinstance(e, FeedstockTokenError) for e in errors.values()
+                ):
+                    raise error
+                raise FeedstockTokenError(" ".join(str(e) for e in errors.values()))
         except FeedstockTokenError as e:
             raise e
         except Exception as e:
@@ -590,14 +854,15 @@ def register_feedstock_token_with_providers(
     addendum="CircleCI is deprecated, see #2627",
 )
 def add_feedstock_token_to_circle(user, project, feedstock_token, clobber):
-    from conda_smithy.ci_register import circle_token
+    from conda_smithy.ci_register import circle_token, provider_session
 
+    session = provider_session("circle")
     url_template = (
         "https://circleci.com/api/v1.1/project/github/{user}/{project}/envvar{extra}?"
         "circle-token={token}"
     )
 
-    r = requests.get(
+    r = session.get(
         url_template.format(token=circle_token, user=user, project=project, extra="")
     )
     if r.status_code != 200:
@@ -609,7 +874,7 @@ def add_feedstock_token_to_circle(user, project, feedstock_token, clobber):
             have_feedstock_token = True
 
     if have_feedstock_token and clobber:
-        r = requests.delete(
+        r = session.delete(
             url_template.format(
                 token=circle_token,
                 user=user,
@@ -622,7 +887,7 @@ def add_feedstock_token_to_circle(user, project, feedstock_token, clobber):
 
     if not have_feedstock_token or (have_feedstock_token and clobber):
         data = {"name": "FEEDSTOCK_TOKEN", "value": feedstock_token}
-        response = requests.post(
+        response = session.post(
             url_template.format(
                 token=circle_token, user=user, project=project, extra=""
             ),
@@ -678,17 +943,19 @@ def add_feedstock_token_to_drone(
 def add_feedstock_token_to_travis(user, project, feedstock_token, clobber):
     """Add the FEEDSTOCK_TOKEN to travis."""
     from conda_smithy.ci_register import (
+        provider_session,
         travis_endpoint,
         travis_get_repo_info,
         travis_headers,
     )
 
+    session = provider_session("travis")
     headers = travis_headers()
 
     repo_info = travis_get_repo_info(user, project)
     repo_id = repo_info["id"]
 
-    r = requests.get(
+    r = session.get(
         f"{travis_endpoint}/repo/{repo_id}/env_vars",
         headers=headers,
     )
@@ -709,14 +976,14 @@ def add_feedstock_token_to_travis(user, project, feedstock_token, clobber):
     }
 
     if have_feedstock_token and clobber:
-        r = requests.patch(
+        r = session.patch(
             f"{travis_endpoint}/repo/{repo_id}/env_var/{ev_id}",
             headers=headers,
             json=data,
         )
         r.raise_for_status()
     elif not have_feedstock_token:
-        r = requests.post(
+        r = session.post(
             f"{travis_endpoint}/repo/{repo_id}/env_vars",
             headers=headers,
             json=data,
@@ -1,24 +1,123 @@
 import argparse
+import contextlib
 import glob
-import multiprocessing
+import json
 import os
+import subprocess
+import sys
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Optional
 
 import pygit2
 from github import Github
 
 from conda_smithy import github as smithy_github
-from conda_smithy.utils import get_yaml, render_meta_yaml
-
-
-def feedstock_repos(gh_organization="conda-forge"):
-    token = smithy_github.gh_token()
-    gh = Github(token)
-    org = gh.get_organization(gh_organization)
-    repos = []
-    for repo in org.get_repos():
-        if repo.name.endswith("-feedstock"):
-            repo.package_name = repo.name.rsplit("-feedstock", 1)[0]
-            repos.append(repo)
+from conda_smithy.utils import get_cache_dir, get_yaml, render_meta_yaml
+
+#: the repo index of an organization is rebuilt from scratch after this many
+#: seconds, which drops the repos that were deleted or renamed in the meantime
+REPO_INDEX_LIFETIME = 7 * 24 * 60 * 60
+
+_REPO_INDEX_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(
+      first: 100, after: $cursor, orderBy: {field: PUSHED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name url pushedAt }
+    }
+  }
+}
+"""
+
+
+def _repo_index_path(gh_organization):
+    return get_cache_dir() / "conda-smithy" / "repo-index" / f"{gh_organization}.json"
+
+
+def _read_repo_index(gh_organization):
+    try:
+        with open(_repo_index_path(gh_organization), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_repo_index(gh_organization, index):
+    index_path = _repo_index_path(gh_organization)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file first so that concurrent runs never read a
+    # partially written index
+    tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(index))
+    os.replace(tmp_path, index_path)
+
+
+def repo_index(gh_organization="conda-forge", refresh=False):
+    """The ``clone_url`` and ``pushed_at`` of the feedstocks of ``gh_organization``.
+
+    The index is cached on disk. It is updated with the repos that were pushed
+    to since its last update, newest first, and rebuilt after
+    `REPO_INDEX_LIFETIME` or with ``refresh``.
+    """
+    now = int(time.time())
+    index = {} if refresh else _read_repo_index(gh_organization)
+    if not index or now - index["built_at"] > REPO_INDEX_LIFETIME:
+        index = {"built_at": now, "repos": {}}
+    repos = index["repos"]
+    # ISO 8601 timestamps in UTC sort like the times they stand for
+    last_pushed_at = max((repo["pushed_at"] for repo in repos.values()), default="")
+
+    requester = Github(smithy_github.gh_token()).requester
+    cursor = None
+    done = False
+    while not done:
+        _, data = requester.graphql_query(
+            _REPO_INDEX_QUERY, {"org": gh_organization, "cursor": cursor}
+        )
+        page = data["data"]["organization"]["repositories"]
+        for node in page["nodes"]:
+            pushed_at = node["pushedAt"] or ""
+            if last_pushed_at and pushed_at < last_pushed_at:
+                # the other repos have not changed since the last update
+                done = True
+                break
+            if node["name"].endswith("-feedstock"):
+                repos[node["name"]] = {
+                    "clone_url": f"{node['url']}.git",
+                    "pushed_at": pushed_at,
+                }
+        done = done or not page["pageInfo"]["hasNextPage"]
+        cursor = page["pageInfo"]["endCursor"]
+
+    _write_repo_index(gh_organization, index)
+    return repos
+
+
+def feedstock_repos(gh_organization="conda-forge", refresh=False):
+    """The feedstock repos of ``gh_organization``, from its `repo_index`.
+
+    Each repo is an argparse.Namespace with the ``name``, ``package_name``,
+    ``clone_url`` and ``pushed_at`` of the feedstock.
+    """
+    repos = [
+        argparse.Namespace(
+            name=name,
+            package_name=name.rsplit("-feedstock", 1)[0],
+            clone_url=repo["clone_url"],
+            pushed_at=repo["pushed_at"],
+        )
+        for name, repo in repo_index(gh_organization, refresh=refresh).items()
+    ]
     return sorted(repos, key=lambda repo: repo.name.lower())
 
 
@@ -45,70 +144,264 @@ def cloned_feedstocks(feedstocks_directory):
         yield feedstock
 
 
-def fetch_feedstock(repo_dir):
-    """Git fetch --all a single git repository."""
-    repo = pygit2.Repository(repo_dir)
-    for remote in repo.remotes:
+#: the number of feedstocks that are cloned or fetched at the same time
+DEFAULT_SYNC_JOBS = 16
+
+#: the file in the feedstocks directory with the state of the last sync
+SYNC_STATE_FILE = ".feedstocks-sync.json"
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """The outcome of cloning or fetching one feedstock.
+
+    ``action`` is one of "cloned", "fetched", "unchanged" or "failed", and
+    ``remote_refs`` has the refs of the remotes that were synced, by remote.
+    """
+
+    name: str
+    action: str
+    remote_refs: dict = field(default_factory=dict)
+    errors: list = field(default_factory=list)
+
+
+def _git(*args, cwd=None):
+    # never ask for credentials, e.g. when GitHub answers with an auth
+    # challenge for a deleted or renamed repo, or the sync would hang
+    return subprocess.run(
+        ["git", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+    ).stdout
+
+
+def _remote_refs(url):
+    """The branches and tags of the remote at ``url``, like ``git ls-remote``."""
+    refs = {}
+    for line in _git("ls-remote", "--heads", "--tags", url).splitlines():
+        sha, ref = line.split("\t", 1)
+        refs[ref] = sha
+    return refs
+
+
+def read_sync_state(feedstocks_directory):
+    """The state of each feedstock at its last sync, by name.
+
+    That is the refs of its ``remotes``, by remote, and the ``pushed_at`` of
+    its repo in the `repo_index` if it was known.
+    """
+    try:
+        with open(os.path.join(feedstocks_directory, SYNC_STATE_FILE)) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_sync_state(feedstocks_directory, state):
+    path = os.path.join(feedstocks_directory, SYNC_STATE_FILE)
+    # write to a temporary file first so that an interrupted sync never leaves
+    # a partially written state behind
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as fh:
+        json.dump(state, fh, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def fetch_feedstock(repo_dir, known_refs=None):
+    """Git fetch all the remotes of a single git repository.
+
+    Remotes whose refs are the same as in ``known_refs`` (by remote name) are
+    not fetched.
+    """
+    name = os.path.basename(repo_dir)
+    known_refs = known_refs or {}
+    remote_refs = {}
+    errors = []
+    fetched = False
+    for remote in pygit2.Repository(repo_dir).remotes:
         try:
-            remote.fetch()
-        except pygit2.GitError:
-            print(f"Failed to fetch {remote.name} from {remote.url}.")
+            refs = _remote_refs(remote.url)
+            if refs != known_refs.get(remote.name):
+                _git("fetch", "-q", remote.name, cwd=repo_dir)
+                fetched = True
+        except subprocess.CalledProcessError:
+            errors.append(f"Failed to fetch {remote.name} from {remote.url}.")
+        else:
+            remote_refs[remote.name] = refs
+    if errors:
+        action = "failed"
+    else:
+        action = "fetched" if fetched else "unchanged"
+    return SyncResult(name, action, remote_refs, errors)
+
+
+def _sync_feedstocks(
+    feedstocks_directory, tasks, jobs=DEFAULT_SYNC_JOBS, pushed_at=None
+):
+    """Run the sync ``tasks`` (functions of the known refs, by feedstock name).
+
+    At most ``jobs`` tasks run at the same time. The feedstocks that changed
+    or failed are printed as their tasks finish, and the refs the tasks saw
+    are saved in the sync state, with the ``pushed_at`` of the feedstocks
+    whose upstream was synced.
+    Returns the `SyncResult` of each feedstock, by name.
+    """
+    pushed_at = pushed_at or {}
+    state = read_sync_state(feedstocks_directory)
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(task, state.get(name, {}).get("remotes")): name
+                for name, task in tasks.items()
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = SyncResult(name, "failed", errors=[repr(e)])
+                results[name] = result
+                entry = state.setdefault(name, {})
+                entry["remotes"] = {**entry.get("remotes", {}), **result.remote_refs}
+                if (
+                    name in pushed_at
+                    and result.action != "failed"
+                    and "upstream" in result.remote_refs
+                ):
+                    entry["pushed_at"] = pushed_at[name]
+                # most feedstocks are usually unchanged, do not list them all
+                if result.action == "unchanged":
+                    continue
+                print(f"[{i}/{len(futures)}] {name}: {result.action}")
+                for error in result.errors:
+                    print(f"    {error}")
+    finally:
+        _write_sync_state(feedstocks_directory, state)
+    return {name: results[name] for name in sorted(results)}
+
+
+def _print_sync_summary(results):
+    """Print how many feedstocks were synced, and return the number of failures."""
+    counts = {}
+    for result in results.values():
+        counts[result.action] = counts.get(result.action, 0) + 1
+    print(
+        ", ".join(f"{count} {action}" for action, count in sorted(counts.items()))
+        or "No feedstocks to sync."
+    )
+    return counts.get("failed", 0)
 
 
-def fetch_feedstocks(feedstock_directory):
+def fetch_feedstocks(feedstock_directory, jobs=DEFAULT_SYNC_JOBS, organization=None):
     """
     Do a git fetch on all of the cloned feedstocks.
 
-    Note: This function uses multiprocessing to parallelise the fetch process.
+    At most ``jobs`` feedstocks are fetched at the same time, and the remotes
+    whose refs have not changed since the last sync are skipped. With an
+    ``organization``, the feedstocks that were not pushed to in it since the
+    last sync (by its `repo_index`) are skipped as a whole. Returns the
+    `SyncResult` of each feedstock, by name.
 
     """
-    feedstocks = list(cloned_feedstocks(feedstock_directory))
-    # We pick the minimum of ncpus x10 and total feedstocks for the pool size.
-    n_processes = min([len(feedstocks), multiprocessing.cpu_count() * 10])
-    pool = multiprocessing.Pool(n_processes)
-    for repo in feedstocks:
-        repo_dir = repo.directory
-        pool.apply_async(fetch_feedstock, args=(repo_dir,))
-    pool.close()
-    pool.join()
+    pushed_at = {}
+    if organization:
+        pushed_at = {
+            name: repo["pushed_at"] for name, repo in repo_index(organization).items()
+        }
+    state = read_sync_state(feedstock_directory)
+
+    results = {}
+    tasks = {}
+    for feedstock in cloned_feedstocks(feedstock_directory):
+        last_pushed_at = state.get(feedstock.name, {}).get("pushed_at")
+        if feedstock.name in pushed_at and pushed_at[feedstock.name] == last_pushed_at:
+            results[feedstock.name] = SyncResult(feedstock.name, "unchanged")
+        else:
+            tasks[feedstock.name] = partial(fetch_feedstock, feedstock.directory)
+    results.update(
+        _sync_feedstocks(feedstock_directory, tasks, jobs=jobs, pushed_at=pushed_at)
+    )
+    return {name: results[name] for name in sorted(results)}
 
 
 def feedstocks_list_handle_args(args):
-    for repo in feedstock_repos(args.organization):
+    for repo in feedstock_repos(args.organization, refresh=args.refresh_index):
         print(repo.name)
 
 
-def clone_feedstock(feedstock_gh_repo, feedstocks_dir):
+def clone_feedstock(feedstock_gh_repo, feedstocks_dir, depth=None, blobless=False):
+    """Clone a feedstock with the ``upstream`` remote, if it is not cloned yet.
+
+    ``depth`` makes a shallow clone and ``blobless`` a clone that downloads
+    the contents of the files only when they are checked out.
+    """
     repo = feedstock_gh_repo
 
     clone_directory = os.path.join(feedstocks_dir, repo.name)
     if not os.path.exists(clone_directory):
-        print(f"Cloning {repo.name}")
-        clone = pygit2.clone_repository(repo.clone_url, clone_directory)
-        clone.remotes.delete("origin")
-    else:
-        clone = pygit2.Repository(clone_directory)
-
+        refs = _remote_refs(repo.clone_url)
+        args = ["clone", "-q", "--origin", "upstream"]
+        if depth:
+            args += [f"--depth={depth}", "--no-single-branch"]
+        if blobless:
+            args.append("--filter=blob:none")
+        _git(*args, repo.clone_url, clone_directory)
+        return SyncResult(repo.name, "cloned", {"upstream": refs})
+
+    clone = pygit2.Repository(clone_directory)
     if "upstream" in clone.remotes.names():
         clone.remotes.delete("upstream")
     clone.remotes.create("upstream", repo.clone_url)
+    return SyncResult(repo.name, "unchanged")
 
 
-def clone_all(gh_org, feedstocks_dir):
-    feedstocks = feedstock_repos(gh_org)
+def _clone_feedstock_task(repo, feedstocks_dir, known_refs, **kwargs):
+    try:
+        return clone_feedstock(repo, feedstocks_dir, **kwargs)
+    except subprocess.CalledProcessError as e:
+        error = f"Failed to clone {repo.clone_url}: {e.stderr.strip()}"
+        return SyncResult(repo.name, "failed", errors=[error])
 
-    # We pick the minimum of ncpus x10 and total feedstocks for the pool size.
-    n_processes = min([len(feedstocks), multiprocessing.cpu_count() * 10])
-    pool = multiprocessing.Pool(n_processes)
-    for repo in feedstocks:
-        pool.apply_async(clone_feedstock, args=(repo, feedstocks_dir))
-    pool.close()
-    pool.join()
+
+def clone_feedstocks(
+    feedstocks, feedstocks_dir, jobs=DEFAULT_SYNC_JOBS, depth=None, blobless=False
+):
+    """Clone the ``feedstocks`` repos that are not cloned yet.
+
+    At most ``jobs`` feedstocks are cloned at the same time. Returns the
+    `SyncResult` of each feedstock, by name.
+    """
+    tasks = {
+        repo.name: partial(
+            _clone_feedstock_task, repo, feedstocks_dir, depth=depth, blobless=blobless
+        )
+        for repo in feedstocks
+    }
+    pushed_at = {repo.name: repo.pushed_at for repo in feedstocks}
+    return _sync_feedstocks(feedstocks_dir, tasks, jobs=jobs, pushed_at=pushed_at)
+
+
+def clone_all(gh_org, feedstocks_dir, jobs=DEFAULT_SYNC_JOBS, **kwargs):
+    feedstocks = feedstock_repos(gh_org)
+    results = clone_feedstocks(feedstocks, feedstocks_dir, jobs=jobs, **kwargs)
+    _print_sync_summary(results)
     return feedstocks
 
 
 def feedstocks_clone_all_handle_args(args):
-    clone_all(args.organization, args.feedstocks_directory)
+    results = clone_feedstocks(
+        feedstock_repos(args.organization, refresh=args.refresh_index),
+        args.feedstocks_directory,
+        jobs=args.jobs,
+        depth=1 if args.shallow else None,
+        blobless=args.blobless,
+    )
+    return 1 if _print_sync_summary(results) else 0
 
 
 def feedstocks_list_cloned_handle_args(args):
@@ -116,27 +409,203 @@ def feedstocks_list_cloned_handle_args(args):
         print(os.path.basename(feedstock.directory))
 
 
-def feedstocks_apply_cloned_handle_args(args):
-    import subprocess
+@dataclass(frozen=True)
+class ApplyResult:
+    """The outcome of running a command in one feedstock.
 
-    for feedstock in cloned_feedstocks(args.feedstocks_directory):
-        env = os.environ.copy()
-        context = {
-            "FEEDSTOCK_DIRECTORY": feedstock.directory,
-            "FEEDSTOCK_BASENAME": feedstock.name,
-            "FEEDSTOCK_NAME": feedstock.package,
-        }
-        env.update(context)
-        cmd = [
-            item.format(feedstock.directory, feedstock=feedstock, **context)
-            for item in args.cmd
-        ]
+    ``returncode`` is None if the command timed out, and ``stdout`` and
+    ``stderr`` are None if they were not captured.
+    """
+
+    name: str
+    cmd: list
+    returncode: Optional[int]
+    duration: float
+    stdout: Optional[str] = None
+    stderr: Optional[str] = None
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+
+def _decode_output(output):
+    # the output of a command that timed out is bytes, even in text mode
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output
+
+
+def apply_to_feedstock(feedstock, cmd, timeout=None, capture=True):
+    """Run ``cmd`` in the directory of a cloned ``feedstock``.
+
+    The items of ``cmd`` and the environment are expanded with the
+    FEEDSTOCK_NAME, FEEDSTOCK_DIRECTORY and FEEDSTOCK_BASENAME of the
+    feedstock. The command is killed after ``timeout`` seconds. Without
+    ``capture``, its output goes to the terminal.
+    """
+    env = os.environ.copy()
+    context = {
+        "FEEDSTOCK_DIRECTORY": feedstock.directory,
+        "FEEDSTOCK_BASENAME": feedstock.name,
+        "FEEDSTOCK_NAME": feedstock.package,
+    }
+    env.update(context)
+    cmd = [
+        item.format(feedstock.directory, feedstock=feedstock, **context) for item in cmd
+    ]
+    if not capture:
         print('\nRunning "{}" for {}:'.format(" ".join(cmd), feedstock.package))
-        subprocess.check_call(cmd, env=env, cwd=feedstock.directory)
+        sys.stdout.flush()
+    start = time.monotonic()
+    try:
+        process = subprocess.run(
+            cmd,
+            env=env,
+            cwd=feedstock.directory,
+            capture_output=capture,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        returncode = None
+        stdout, stderr = _decode_output(e.stdout), _decode_output(e.stderr)
+    else:
+        returncode = process.returncode
+        stdout, stderr = process.stdout, process.stderr
+    duration = time.monotonic() - start
+    return ApplyResult(feedstock.name, cmd, returncode, duration, stdout, stderr)
+
+
+def _report_apply_result(result, output_dir=None, jsonl=None):
+    if result.stdout is not None and output_dir is None and jsonl is None:
+        # the output was neither streamed nor written to files
+        print('\nRan "{}" for {}:'.format(" ".join(result.cmd), result.name))
+        print(result.stdout, end="")
+        print(result.stderr, end="", file=sys.stderr)
+    if output_dir is not None:
+        for stream in ("stdout", "stderr"):
+            with open(os.path.join(output_dir, f"{result.name}.{stream}"), "w") as fh:
+                fh.write(getattr(result, stream) or "")
+    if jsonl is not None:
+        jsonl.write(json.dumps(asdict(result)) + "\n")
+        jsonl.flush()
+    if result.returncode is None:
+        print(f"{result.name}: timed out after {result.duration:.1f} seconds")
+    elif not result.ok:
+        print(f"{result.name}: failed with exit code {result.returncode}")
+
+
+def apply_cloned(
+    feedstocks_directory,
+    cmd,
+    jobs=1,
+    timeout=None,
+    keep_going=False,
+    output_dir=None,
+    jsonl_path=None,
+    regexp=None,
+    randomise=False,
+):
+    """Run ``cmd`` in the cloned feedstocks, see `apply_to_feedstock`.
+
+    At most ``jobs`` commands run at the same time. With one job, their output
+    goes to the terminal. Otherwise it is captured and printed per feedstock.
+    It can also be written to ``<output_dir>/<feedstock>.stdout`` and
+    ``.stderr``, and/or to ``jsonl_path`` as one JSON object per feedstock.
+    Unless ``keep_going``, no more commands are started after one fails or
+    times out. ``regexp`` and ``randomise`` select the feedstocks like in
+    `feedstocks_repos`. Returns the `ApplyResult` of each feedstock that was
+    run, by name.
+    """
+    feedstocks = iter(
+        _select_feedstocks(
+            cloned_feedstocks(feedstocks_directory), regexp=regexp, randomise=randomise
+        )
+    )
+    capture = jobs > 1 or output_dir is not None or jsonl_path is not None
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    results = {}
+    with contextlib.ExitStack() as stack:
+        jsonl = None
+        if jsonl_path is not None:
+            jsonl = stack.enter_context(open(jsonl_path, "w"))
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=jobs))
+        running = set()
+        stop = False
+        while True:
+            # only submit as many commands as can run, to be able to stop
+            while not stop and len(running) < jobs:
+                feedstock = next(feedstocks, None)
+                if feedstock is None:
+                    break
+                running.add(
+                    pool.submit(
+                        apply_to_feedstock,
+                        feedstock,
+                        cmd,
+                        timeout=timeout,
+                        capture=capture,
+                    )
+                )
+            if not running:
+                break
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results[result.name] = result
+                _report_apply_result(result, output_dir, jsonl)
+                stop = stop or not (result.ok or keep_going)
+    return {name: results[name] for name in sorted(results)}
+
+
+def feedstocks_apply_cloned_handle_args(args):
+    results = apply_cloned(
+        args.feedstocks_directory,
+        args.cmd,
+        jobs=args.jobs,
+        timeout=args.timeout,
+        keep_going=args.keep_going,
+        output_dir=args.output_dir,
+        jsonl_path=args.jsonl,
+        regexp=args.regexp,
+        randomise=args.randomise,
+    )
+    failed = [result for result in results.values() if not result.ok]
+    if args.jobs > 1 or failed:
+        print(
+            f"Ran {len(results)} feedstocks: {len(results) - len(failed)} "
+            f"succeeded, {len(failed)} failed."
+        )
+    return 1 if failed else 0
 
 
 def feedstocks_fetch_handle_args(args):
-    return fetch_feedstocks(args.feedstocks_directory)
+    results = fetch_feedstocks(
+        args.feedstocks_directory, jobs=args.jobs, organization=args.organization
+    )
+    return 1 if _print_sync_summary(results) else 0
+
+
+def _select_feedstocks(feedstocks, regexp=None, randomise=False):
+    """Filter ``feedstocks`` by package name and shuffle them, see `feedstocks_repos`."""
+    if regexp:
+        import re
+
+        regexp = re.compile(regexp)
+        feedstocks = [
+            feedstock for feedstock in feedstocks if regexp.match(feedstock.package)
+        ]
+
+    if randomise:
+        import random
+
+        feedstocks = list(feedstocks)
+        random.shuffle(feedstocks)
+
+    return feedstocks
 
 
 def feedstocks_repos(
@@ -171,21 +640,9 @@ def feedstocks_repos(
         print("Cloning all missing repos...")
         clone_all(organization, feedstocks_directory)
 
-    feedstocks = cloned_feedstocks(feedstocks_directory)
-
-    if regexp:
-        import re
-
-        regexp = re.compile(regexp)
-        feedstocks = [
-            feedstock for feedstock in feedstocks if regexp.match(feedstock.package)
-        ]
-
-    if randomise:
-        import random
-
-        feedstocks = list(feedstocks)
-        random.shuffle(feedstocks)
+    feedstocks = _select_feedstocks(
+        cloned_feedstocks(feedstocks_directory), regexp=regexp, randomise=randomise
+    )
 
     for feedstock in feedstocks:
         repo = pygit2.Repository(feedstock.directory)
@@ -278,6 +735,11 @@ def main():
     list_feedstocks = subparsers.add_parser("list", help=list_feedstocks_help)
     list_feedstocks.set_defaults(func=feedstocks_list_handle_args)
     list_feedstocks.add_argument("--organization", default="conda-forge")
+    list_feedstocks.add_argument(
+        "--refresh-index",
+        action="store_true",
+        help="Rebuild the cached index of the repos of the organization.",
+    )
 
     clone_feedstocks = subparsers.add_parser(
         "clone",
@@ -286,6 +748,29 @@ def main():
     clone_feedstocks.set_defaults(func=feedstocks_clone_all_handle_args)
     clone_feedstocks.add_argument("--organization", default="conda-forge")
     clone_feedstocks.add_argument("--feedstocks-directory", default="./")
+    clone_feedstocks.add_argument(
+        "--refresh-index",
+        action="store_true",
+        help="Rebuild the cached index of the repos of the organization.",
+    )
+    clone_feedstocks.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_SYNC_JOBS,
+        help="Maximum number of feedstocks cloned at the same time.",
+    )
+    clone_depth = clone_feedstocks.add_mutually_exclusive_group()
+    clone_depth.add_argument(
+        "--shallow",
+        action="store_true",
+        help="Only clone the latest commit of each branch.",
+    )
+    clone_depth.add_argument(
+        "--blobless",
+        action="store_true",
+        help="Only download the contents of the files when they are checked out.",
+    )
 
     list_cloned_feedstocks = subparsers.add_parser(
         "list-cloned",
@@ -300,6 +785,44 @@ def main():
     )
     apply_cloned_feedstocks.set_defaults(func=feedstocks_apply_cloned_handle_args)
     apply_cloned_feedstocks.add_argument("--feedstocks-directory", default="./")
+    apply_cloned_feedstocks.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Maximum number of feedstocks the command runs in at the same time.",
+    )
+    apply_cloned_feedstocks.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Kill the command after this many seconds in a feedstock.",
+    )
+    apply_cloned_feedstocks.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="Run the command in all feedstocks even if it fails in some.",
+    )
+    apply_cloned_feedstocks.add_argument(
+        "--output-dir",
+        default=None,
+        help="Write the output in each feedstock to <feedstock>.stdout/.stderr here.",
+    )
+    apply_cloned_feedstocks.add_argument(
+        "--jsonl",
+        default=None,
+        help="Write the result and output in each feedstock to this JSON lines file.",
+    )
+    apply_cloned_feedstocks.add_argument(
+        "--regexp",
+        default=None,
+        help="Only run in the feedstocks whose package name matches this regexp.",
+    )
+    apply_cloned_feedstocks.add_argument(
+        "--randomise",
+        action="store_true",
+        help="Run in the feedstocks in a random order.",
+    )
     apply_cloned_feedstocks.add_argument(
         "cmd",
         nargs="+",
@@ -314,6 +837,21 @@ def main():
     )
     fetch_feedstocks.set_defaults(func=feedstocks_fetch_handle_args)
     fetch_feedstocks.add_argument("--feedstocks-directory", default="./")
+    fetch_feedstocks.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_SYNC_JOBS,
+        help="Maximum number of feedstocks fetched at the same time.",
+    )
+    fetch_feedstocks.add_argument(
+        "--organization",
+        default=None,
+        help=(
+            "Skip the feedstocks that were not pushed to in this GitHub "
+            "organization since they were last fetched."
+        ),
+    )
 
     args = parser.parse_args()
     return args.func(args)
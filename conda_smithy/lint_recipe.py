@@ -1,13 +1,17 @@
 import copy
+import hashlib
 import json
 import logging
 import os
 import sys
 import time
-from collections.abc import Mapping
-from functools import lru_cache
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
 from glob import glob
 from inspect import cleandoc
+from itertools import repeat
 from pathlib import Path
 from textwrap import indent
 from typing import Any, Optional
@@ -24,7 +28,9 @@ from conda_build.metadata import (
 from rattler_build_conda_compat import loader as rattler_loader
 from ruamel.yaml.constructor import DuplicateKeyError
 
+from conda_smithy import __version__
 from conda_smithy.configure_feedstock import _read_forge_config
+from conda_smithy.feedstock_io import get_repo
 from conda_smithy.linter import conda_recipe_v1_linter
 from conda_smithy.linter import messages as msg
 from conda_smithy.linter.hints import (
@@ -87,17 +93,26 @@ from conda_smithy.linter.lints import (
     lint_subheaders,
     lint_usage_of_legacy_patterns,
 )
+from conda_smithy.linter.messages.base import LinterMessage, RenderedMessage
+from conda_smithy.linter.registry import RULES, RuleInput, rule, run_rules, select_rules
 from conda_smithy.linter.utils import (
     CONDA_BUILD_TOOL,
     EXPECTED_SECTION_ORDER,
+    LINTER_HINTS_TOML_URL,
     RATTLER_BUILD_TOOL,
+    RecipeSource,
     find_local_config_file,
     flatten_v1_if_else,
     get_all_test_requirements,
+    get_global_pinning_python_min,
+    get_http_session,
+    get_linter_data_version,
     get_section,
     load_linter_toml_metadata,
+    seed_linter_data,
+    snapshot_linter_data,
 )
-from conda_smithy.utils import get_yaml, render_meta_yaml
+from conda_smithy.utils import get_cache_dir, get_yaml, render_meta_yaml
 from conda_smithy.validate_schema import validate_json_schema
 
 NEEDED_FAMILIES = ["gpl", "bsd", "mit", "apache", "psf"]
@@ -108,6 +123,22 @@ LOGGER = logging.getLogger(__name__)
 #: rather than a definitive answer about whether a maintainer exists.
 _TRANSIENT_STATUS = frozenset({429, 500, 502, 503, 504})
 
+# Cache lifetimes of the maintainer existence checks in seconds. Accounts
+# rarely disappear, so positive results are kept for a week; negative results
+# only for an hour so that a freshly created account or team is picked up.
+MAINTAINER_EXISTS_LIFETIME = int(
+    os.environ.get("CONDA_SMITHY_MAINTAINER_EXISTS_LIFETIME", 7 * 24 * 60 * 60)
+)
+MAINTAINER_MISSING_LIFETIME = int(
+    os.environ.get("CONDA_SMITHY_MAINTAINER_MISSING_LIFETIME", 60 * 60)
+)
+# Lifetime of the stored results of the rules that query the network in the
+# lint cache (`recipe-lint --cache`), in seconds. The rest of the stored
+# results stays valid as long as the inputs of the cache key do not change.
+LINT_CACHE_NETWORK_LIFETIME = int(
+    os.environ.get("CONDA_SMITHY_LINT_CACHE_NETWORK_LIFETIME", 60 * 60)
+)
+
 
 def _get_feedstock_config(recipe_dir: Optional[str] = None) -> dict:
     feedstock_config_keys = {}
@@ -161,10 +192,12 @@ def lintify_meta_yaml(
     recipe_dir: Optional[str] = None,
     conda_forge: bool = False,
     recipe_version: int = 0,
+    recipe_source: Optional[RecipeSource] = None,
+    timings: Optional[dict[str, float]] = None,
+    rule_results: Optional[dict[str, tuple[list[str], list[str]]]] = None,
 ) -> tuple[list[str], list[str]]:
     lints = []
     hints = []
-    major_sections = list(meta.keys())
     feedstock_config_keys = _get_feedstock_config(recipe_dir)
     lints_to_skip = feedstock_config_keys.get("linter", {}).get("skip", [])
 
@@ -180,288 +213,27 @@ def lintify_meta_yaml(
         lints.append(msg.r.DuplicateRecipes().as_string())
         return lints, hints
 
+    # read the recipe once; every rule below works on this snapshot
+    if recipe_source is None:
+        recipe_source = RecipeSource.from_file(recipe_fname)
+
     if recipe_version == 1:
         schema_version = meta.get("schema_version", 1)
         if schema_version != 1:
             lints.append(f"Unsupported recipe.yaml schema version {schema_version}")
             return lints, hints
 
-    sources_section = get_section(meta, "source", lints, recipe_version)
-    build_section = get_section(meta, "build", lints, recipe_version)
-    requirements_section = get_section(meta, "requirements", lints, recipe_version)
-    build_requirements = requirements_section.get("build", [])
-    run_reqs = requirements_section.get("run", [])
-    if recipe_version == 1:
-        test_section = get_section(meta, "tests", lints, recipe_version)
-    else:
-        test_section = get_section(meta, "test", lints, recipe_version)
-    about_section = get_section(meta, "about", lints, recipe_version)
-    extra_section = get_section(meta, "extra", lints, recipe_version)
-    package_section = get_section(meta, "package", lints, recipe_version)
-    outputs_section = get_section(meta, "outputs", lints, recipe_version)
-
-    recipe_dirname = os.path.basename(recipe_dir) if recipe_dir else "recipe"
-    is_staged_recipes = recipe_dirname != "recipe"
-
-    # 0: Top level keys should be expected
-    unexpected_sections = []
-    if recipe_version == 0:
-        expected_keys = EXPECTED_SECTION_ORDER
-    else:
-        expected_keys = (
-            conda_recipe_v1_linter.EXPECTED_SINGLE_OUTPUT_SECTION_ORDER
-            + conda_recipe_v1_linter.EXPECTED_MULTIPLE_OUTPUT_SECTION_ORDER
-        )
-
-    for section in major_sections:
-        if section not in expected_keys:
-            lints.append(msg.r.UnexpectedSection(section=section).as_string())
-            unexpected_sections.append(section)
-
-    for section in unexpected_sections:
-        major_sections.remove(section)
-
-    # 1: Top level keys in recipe file should have a specific order.
-    lint_section_order(major_sections, lints, recipe_version)
-
-    # 2: The about section should have a home, license and summary.
-    lint_about_contents(about_section, lints, recipe_version)
-
-    # 3a: The recipe should have some maintainers.
-    # 3b: Maintainers should be a list
-    lint_recipe_maintainers(extra_section, lints)
-
-    # 3c: feedstock-name should not end with "-feedstock"
-    lint_feedstock_name_not_end_with_feedstock(extra_section, lints)
-
-    # 4: The recipe should have some tests.
-    lint_recipe_have_tests(
-        recipe_dir,
-        test_section,
-        outputs_section,
-        lints,
-        hints,
-        recipe_version,
-    )
-
-    # 5: License cannot be 'unknown.'
-    lint_license_cannot_be_unknown(about_section, lints)
-
-    # 6: Selectors should be in a tidy form.
-    if recipe_version == 0:
-        # v1 does not have selectors in comments form
-        lint_selectors_should_be_in_tidy_form(recipe_fname, lints, hints)
-
-    # 6a: Comment-style selectors must not be used in v1 recipes.
-    if recipe_version == 1:
-        lint_no_comment_selectors(recipe_fname, lints, hints)
-
-    # 7: The build section should have a build number.
-    lint_build_section_should_have_a_number(build_section, lints)
-
-    # 8: The build section should be before the run section in requirements.
-    lint_build_section_should_be_before_run(requirements_section, lints)
-
-    # 9: Files downloaded should have a hash.
-    lint_sources_should_have_hash(sources_section, lints)
-
-    # 10: License should not include the word 'license'.
-    lint_license_should_not_have_license(about_section, lints)
-
-    # 11: There should be one empty line at the end of the file.
-    lint_should_be_empty_line(recipe_fname, lints)
-
-    # 12: License family must be valid (conda-build checks for that)
-    # we skip it for v1 builds as it will validate it
-    # See more: https://prefix-dev.github.io/rattler-build/latest/reference/recipe_file/#about-section
-    if recipe_version == 0:
-        try:
-            ensure_valid_license_family(meta)
-        except RuntimeError as e:
-            lints.append(str(e))
-
-    # 12a: License family must be valid (conda-build checks for that)
-    license = about_section.get("license", "").lower()
-    lint_license_family_should_be_valid(
-        about_section, license, NEEDED_FAMILIES, lints, recipe_version
-    )
-
-    # 13: Check that the recipe name is valid
-    if recipe_version == 1:
-        recipe_name = conda_recipe_v1_linter.lint_recipe_name(meta, lints)
-    else:
-        recipe_name = lint_recipe_name(
-            package_section,
-            lints,
-        )
-
-    # 14: Run conda-forge specific lints
-    if conda_forge:
-        run_conda_forge_specific(
-            meta,
-            recipe_dir,
-            lints,
-            hints,
-            recipe_version=recipe_version,
-            feedstock_config=feedstock_config_keys,
-        )
-
-    # 15: Check if we are using legacy patterns
-    lint_usage_of_legacy_patterns(requirements_section, lints)
-
-    # 16: Subheaders should be in the allowed subheadings
-    if recipe_version == 0:
-        lint_subheaders(major_sections, meta, lints)
-
-    # 17: Validate noarch
-    noarch_value = build_section.get("noarch")
-    lint_noarch(noarch_value, lints)
-
-    # Interlude: load recipe config
-    recipe_config_keys = _get_recipe_config_keys(recipe_dir)
-
-    # 18: noarch doesn't work with selectors for runtime dependencies
-    noarch_platforms = len(feedstock_config_keys.get("noarch_platforms", [])) > 1
-    if "lint_noarch_selectors" not in lints_to_skip:
-        if recipe_version == 1:
-            raw_requirements_section = meta.get("requirements", {})
-            lint_recipe_v1_noarch_and_runtime_dependencies(
-                noarch_value,
-                raw_requirements_section,
-                build_section,
-                noarch_platforms,
-                lints,
-            )
-        else:
-            lint_noarch_and_runtime_dependencies(
-                noarch_value,
-                recipe_fname,
-                feedstock_config_keys,
-                recipe_config_keys["conda_build_config.yaml"],
-                lints,
-            )
-
-    # 19: check version
-    if recipe_version == 1:
-        conda_recipe_v1_linter.lint_package_version(meta, lints)
-    else:
-        lint_package_version(package_section, lints)
-
-    # 20: Jinja2 variable definitions should be nice.
-    lint_jinja_variables_definitions(recipe_fname, lints)
-
-    # 21: Legacy usage of compilers
-    lint_legacy_usage_of_compilers(build_requirements, lints)
-
-    # 22: Single space in pinned requirements
-    lint_single_space_in_pinned_requirements(
-        requirements_section, lints, recipe_version
-    )
-
-    # 23: non noarch builds shouldn't use version constraints on python and r-base
-    lint_non_noarch_builds(
-        requirements_section,
-        outputs_section,
-        build_section,
-        noarch_value,
-        lints,
-        recipe_version,
-    )
-
-    # 24: jinja2 variable references should be {{<one space>var<one space>}}
-    lint_jinja_var_references(recipe_fname, hints, recipe_version=recipe_version)
-
-    # 25: require a lower bound on python version
-    lint_require_lower_bound_on_python_version(
-        run_reqs, outputs_section, noarch_value, lints
-    )
-
-    # 26: pin_subpackage is for subpackages and pin_compatible is for
-    # non-subpackages of the recipe. Contact @carterbox for troubleshooting
-    # this lint.
-    lint_pin_subpackages(
+    context = LintContext.from_meta(
         meta,
-        outputs_section,
-        package_section,
         lints,
+        recipe_dir=recipe_dir,
         recipe_version=recipe_version,
+        conda_forge=conda_forge,
+        recipe_source=recipe_source,
+        feedstock_config=feedstock_config_keys,
     )
-
-    # 27: Check usage of whl files as a source
-    lint_check_usage_of_whls(recipe_fname, noarch_value, lints, hints)
-
-    # 28: Check that Rust licenses are bundled.
-    lint_rust_licenses_are_bundled(
-        recipe_name, build_requirements, lints, recipe_version=recipe_version
-    )
-
-    # 29: Check that go licenses are bundled.
-    lint_go_licenses_are_bundled(
-        recipe_name, build_requirements, lints, recipe_version=recipe_version
-    )
-
-    # 30: two configuration files present
-    if sum(v is not None for v in recipe_config_keys.values()) > 1:
-        lints.append(msg.rv.MoreThanOneConfigFile().as_string())
-
-    # 31: stdlib-related lints
-    if "lint_stdlib" not in lints_to_skip:
-        for config_fn in recipe_config_keys.keys():
-            lint_stdlib(
-                meta,
-                requirements_section,
-                recipe_dir,
-                config_fn,
-                lints,
-                # the version of the config file does not change the version of the recipe
-                recipe_version=recipe_version,
-            )
-
-    # 32: floats should be quoted
-    lint_floats_quoted(meta, lints, recipe_version=recipe_version)
-
-    # hints
-    # 1: suggest pip
-    hint_pip_usage(build_section, hints)
-
-    # 2: suggest python noarch (skip on feedstocks)
-    raw_requirements_section = meta.get("requirements", {})
-    hint_suggest_noarch(
-        noarch_value,
-        build_requirements,
-        raw_requirements_section,
-        is_staged_recipes,
-        conda_forge,
-        recipe_fname,
-        hints,
-        recipe_version=recipe_version,
-    )
-
-    # 3: suggest fixing all recipe/*.sh shellcheck findings
-    hint_shellcheck_usage(recipe_dir, hints, feedstock_config=feedstock_config_keys)
-
-    # 4: Check for SPDX
-    hint_check_spdx(about_section, hints)
-
-    # 5: hint pypi.io -> files.pythonhosted.org
-    hint_legacy_pypi_url(sources_section, hints)
-
-    # 6: warn of `name =version=build` specs, suggest `name version build`
-    # see https://github.com/conda/conda-build/issues/5571#issuecomment-2604505922
-    if recipe_version == 0:
-        hint_space_separated_specs(
-            requirements_section,
-            test_section,
-            outputs_section,
-            hints,
-        )
-
-    # 7. check for obsolete os_version
-    if "hint_os_version" not in lints_to_skip:
-        hint_os_version(feedstock_config_keys, hints)
-
-    # 8. check for bld.bat with rattler-build
-    hint_rattler_build_bld_bat(recipe_dir, hints, recipe_version)
+    rules = select_rules(RULES, recipe_version, conda_forge, skip=lints_to_skip)
+    run_rules(rules, context, lints, hints, timings=timings, results=rule_results)
 
     return lints, hints
 
@@ -489,7 +261,7 @@ def _head_with_retries(url: str, *, retries: int = 4) -> Optional[requests.Respo
     resp = None
     for attempt in range(retries):
         try:
-            resp = requests.head(url, allow_redirects=False, timeout=30)
+            resp = get_http_session().head(url, allow_redirects=False, timeout=30)
         except requests.RequestException as exc:
             LOGGER.warning(
                 "HEAD %s failed (attempt %d/%d): %r",
@@ -629,274 +401,829 @@ def _team_exists(org_team: str) -> Optional[bool]:
         return True
 
 
-def run_conda_forge_specific(
-    meta, recipe_dir, lints, hints, recipe_version: int = 0, feedstock_config=None
-):
-    if recipe_version == 1:
-        recipe_fname = os.path.join(recipe_dir or "", "recipe.yaml")
-    else:
-        recipe_fname = os.path.join(recipe_dir or "", "meta.yaml")
+# GitHub limits the number of nodes a single GraphQL query may request
+_GRAPHQL_BATCH_SIZE = 50
 
-    if feedstock_config is None:
-        feedstock_config = _get_feedstock_config(recipe_dir)
-    lints_to_skip = feedstock_config.get("linter", {}).get("skip", [])
 
-    # Retrieve sections from meta
-    package_section = get_section(meta, "package", lints, recipe_version=recipe_version)
-    extra_section = get_section(meta, "extra", lints, recipe_version=recipe_version)
-    requirements_section = get_section(
-        meta, "requirements", lints, recipe_version=recipe_version
-    )
-    outputs_section = get_section(meta, "outputs", lints, recipe_version=recipe_version)
+def _owners_exist_graphql(maintainers: Sequence[str]) -> dict[str, Optional[bool]]:
+    """Resolve users and ``org/team`` entries with one GraphQL query per batch.
+
+    Every entry gets an aliased ``repositoryOwner`` field, which is ``null``
+    (rather than an error) for unknown logins. Users exist if they resolve to
+    a ``User``; teams exist if their organization has a team with that slug.
+    """
+    results: dict[str, Optional[bool]] = {}
+    queried = []
+    for maintainer in maintainers:
+        if "/" in maintainer:
+            org, team = maintainer.split("/", 1)
+            if not org or not team:
+                results[maintainer] = False
+                continue
+        queried.append(maintainer)
+
+    requester = _cached_gh().requester
+    for start in range(0, len(queried), _GRAPHQL_BATCH_SIZE):
+        batch = queried[start : start + _GRAPHQL_BATCH_SIZE]
+        params, fields, variables = [], [], {}
+        for i, maintainer in enumerate(batch):
+            if "/" in maintainer:
+                org, team = maintainer.split("/", 1)
+                params += [f"$o{i}: String!", f"$t{i}: String!"]
+                fields.append(
+                    f"m{i}: repositoryOwner(login: $o{i}) "
+                    f"{{ __typename ... on Organization {{ team(slug: $t{i}) {{ id }} }} }}"
+                )
+                variables.update({f"o{i}": org, f"t{i}": team})
+            else:
+                params.append(f"$o{i}: String!")
+                fields.append(f"m{i}: repositoryOwner(login: $o{i}) {{ __typename }}")
+                variables[f"o{i}"] = maintainer
+        query = "query({}) {{ {} }}".format(", ".join(params), " ".join(fields))
+        try:
+            _, data = requester.graphql_query(query, variables)
+        except github.GithubException as exc:
+            # rate limit / server error / etc. - undetermined
+            LOGGER.warning(
+                "Could not confirm maintainers %r exist: %r", list(batch), exc
+            )
+            results.update(dict.fromkeys(batch, None))
+            continue
+
+        owners = data["data"]
+        for i, maintainer in enumerate(batch):
+            owner = owners.get(f"m{i}")
+            if "/" in maintainer:
+                results[maintainer] = bool(owner and owner.get("team"))
+            else:
+                results[maintainer] = bool(owner and owner["__typename"] == "User")
+    return results
 
-    build_section = get_section(meta, "build", lints, recipe_version)
-    noarch_value = build_section.get("noarch")
-    test_reqs = get_all_test_requirements(meta, lints, recipe_version)
 
-    # Fetch list of recipe maintainers
-    maintainers = extra_section.get("recipe-maintainers", [])
+def _maintainer_cache_path():
+    return get_cache_dir() / "conda-smithy" / "maintainers.json"
 
-    recipe_dirname = os.path.basename(recipe_dir) if recipe_dir else "recipe"
-    if recipe_version == 1:
-        recipe_name = conda_recipe_v1_linter.get_recipe_name(meta)
-    else:
-        recipe_name = package_section.get("name", "").strip()
-    is_staged_recipes = recipe_dirname != "recipe"
 
-    # 1: Check that the recipe does not exist in conda-forge or bioconda
-    # moved to staged-recipes directly
+def _read_maintainer_cache() -> dict:
+    try:
+        with open(_maintainer_cache_path(), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
 
-    # 2: Check that the recipe maintainers exists:
+
+def _get_cached_maintainers(maintainers: Sequence[str]) -> dict[str, bool]:
+    """The cached existence results of ``maintainers`` that have not expired."""
+    cache = _read_maintainer_cache()
+    now = int(time.time())
+    results = {}
     for maintainer in maintainers:
-        if "/" in maintainer:
-            exists = _team_exists(maintainer)
+        entry = cache.get(maintainer)
+        if not entry:
+            continue
+        if entry["exists"]:
+            lifetime = MAINTAINER_EXISTS_LIFETIME
         else:
-            exists = _maintainer_exists(maintainer)
-        if exists is False:
-            lints.append(
-                msg.cf.MaintainerMissing(
-                    maintainer=maintainer, path=recipe_fname
-                ).as_string()
-            )
-        elif exists is None:
-            # the existence check could not be completed (e.g. GitHub rate
-            # limit); fail the lint and ask for it to be retried rather than
-            # risk a false-positive or false-negative
-            lints.append(
-                msg.cf.InconclusiveMaintainerCheck(
-                    maintainer=maintainer, path=recipe_fname
-                ).as_string()
-            )
-
-    # 3: if the recipe dir is inside the example dir
-    # moved to staged-recipes directly
+            lifetime = MAINTAINER_MISSING_LIFETIME
+        if now - entry["ts"] <= lifetime:
+            results[maintainer] = entry["exists"]
+    return results
+
+
+def _write_cached_maintainers(results: Mapping[str, bool]) -> None:
+    if not results:
+        return
+    cache_path = _maintainer_cache_path()
+    cache = _read_maintainer_cache()
+    now = int(time.time())
+    cache.update(
+        {
+            maintainer: {"exists": exists, "ts": now}
+            for maintainer, exists in results.items()
+        }
+    )
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent linter runs never
+        # read a partially written cache
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        LOGGER.debug("Could not write the maintainer cache: %s", err)
+
+
+def _maintainers_exist(maintainers: Sequence[str]) -> dict[str, Optional[bool]]:
+    """Check which recipe maintainers (users or ``org/team``) exist on GitHub.
+
+    Returns a mapping with the same ``True``/``False``/``None`` semantics as
+    `_maintainer_exists` and `_team_exists`. Results are cached on disk for
+    `MAINTAINER_EXISTS_LIFETIME` or `MAINTAINER_MISSING_LIFETIME` seconds;
+    undetermined results are never cached. The remaining entries are resolved
+    by a single batched GraphQL query with a token, or by concurrent HEAD
+    checks without one.
+    """
+    maintainers = list(dict.fromkeys(maintainers))
+    cached = _get_cached_maintainers(maintainers)
+    to_check = [m for m in maintainers if m not in cached]
+    if not to_check:
+        return cached
+
+    have_token = "GH_TOKEN" in os.environ
+    if have_token:
+        results = _owners_exist_graphql(to_check)
+    else:
 
-    # 4: Do not delete example recipe
-    # removed in favor of direct check in staged-recipes CI
+        def check(maintainer):
+            if "/" in maintainer:
+                return _team_exists(maintainer)
+            return _maintainer_exists(maintainer)
 
-    # 5: Package-specific hints
-    # (e.g. do not depend on matplotlib, only matplotlib-base)
-    # we use a copy here since the += below modifies the original list
-    build_reqs = copy.deepcopy(requirements_section.get("build") or [])
-    host_reqs = copy.deepcopy(requirements_section.get("host") or [])
-    run_reqs = copy.deepcopy(requirements_section.get("run") or [])
-    for out in outputs_section:
-        if recipe_version == 1:
-            output_requirements = rattler_loader.load_all_requirements(out)
-            build_reqs += output_requirements.get("build") or []
-            host_reqs += output_requirements.get("host") or []
-            run_reqs += output_requirements.get("run") or []
-        else:
-            _req = out.get("requirements") or {}
-            if isinstance(_req, Mapping):
-                build_reqs += _req.get("build") or []
-                host_reqs += _req.get("host") or []
-                run_reqs += _req.get("run") or []
-            else:
-                run_reqs += _req
+        with ThreadPoolExecutor(max_workers=min(len(to_check), 8)) as pool:
+            results = dict(zip(to_check, pool.map(check, to_check)))
 
-    specific_hints = (load_linter_toml_metadata() or {}).get("hints", {})
-    all_reqs = build_reqs + host_reqs + run_reqs
-    if recipe_version == 1:
-        all_reqs = flatten_v1_if_else(all_reqs)
+    # teams are only assumed to exist without a token, do not cache that
+    _write_cached_maintainers(
+        {
+            maintainer: exists
+            for maintainer, exists in results.items()
+            if exists is not None and (have_token or "/" not in maintainer)
+        }
+    )
+    return {m: cached[m] if m in cached else results[m] for m in maintainers}
 
-    for rq in all_reqs:
-        dep = rq.split(" ")[0].strip()
-        dep_hint = specific_hints.get(dep)
-        if dep_hint:
-            msg.cf.PackageToAvoid(
-                package_hint=dep_hint, path=recipe_fname
-            ).append_if_absent(hints)
 
-    # 6: Check if all listed maintainers have commented:
-    # moved to staged recipes directly
+@dataclass(frozen=True)
+class LintContext:
+    """Everything the lint rules may read about one recipe.
 
-    # 7: Ensure that the recipe has some .ci_support files
-    if not is_staged_recipes and recipe_dir is not None:
-        ci_support_files = glob(os.path.join(recipe_dir, "..", ".ci_support", "*.yaml"))
-        if not ci_support_files:
-            lints.append(msg.cf.NoVariantConfigs().as_string())
-    else:
-        ci_support_files = []
+    The sections are extracted once, up front; the remaining inputs are
+    derived on first use so that rules which are skipped never pay for them.
+    """
 
-    # 8: Ensure the recipe specifies a Python build backend if needed
-    if "hint_pip_no_build_backend" not in lints_to_skip:
-        host_or_build_reqs = (requirements_section.get("host") or []) or (
-            requirements_section.get("build") or []
+    meta: Any
+    recipe_dir: Optional[str]
+    recipe_version: int
+    conda_forge: bool
+    recipe_source: Optional[RecipeSource]
+    feedstock_config: dict
+    sources_section: list
+    build_section: dict
+    requirements_section: dict
+    test_section: Any
+    about_section: dict
+    extra_section: dict
+    package_section: dict
+    outputs_section: list
+
+    @classmethod
+    def from_meta(
+        cls,
+        meta,
+        lints,
+        recipe_dir=None,
+        recipe_version: int = 0,
+        conda_forge: bool = False,
+        recipe_source: Optional[RecipeSource] = None,
+        feedstock_config=None,
+    ) -> "LintContext":
+        """Extract the sections of ``meta``, reporting malformed ones to ``lints``."""
+        return cls(
+            meta=meta,
+            recipe_dir=recipe_dir,
+            recipe_version=recipe_version,
+            conda_forge=conda_forge,
+            recipe_source=recipe_source,
+            feedstock_config=feedstock_config or {},
+            sources_section=get_section(meta, "source", lints, recipe_version),
+            build_section=get_section(meta, "build", lints, recipe_version),
+            requirements_section=get_section(
+                meta, "requirements", lints, recipe_version
+            ),
+            test_section=get_section(
+                meta, "tests" if recipe_version == 1 else "test", lints, recipe_version
+            ),
+            about_section=get_section(meta, "about", lints, recipe_version),
+            extra_section=get_section(meta, "extra", lints, recipe_version),
+            package_section=get_section(meta, "package", lints, recipe_version),
+            outputs_section=get_section(meta, "outputs", lints, recipe_version),
         )
-        if recipe_version == 1:
-            host_or_build_reqs = flatten_v1_if_else(host_or_build_reqs)
-        hint_pip_no_build_backend(host_or_build_reqs, recipe_name, hints)
-        for out in outputs_section:
-            if recipe_version == 1:
-                output_requirements = rattler_loader.load_all_requirements(out)
-                build_reqs = output_requirements.get("build") or []
-                host_reqs = output_requirements.get("host") or []
-            else:
-                _req = out.get("requirements") or {}
-                if isinstance(_req, Mapping):
-                    build_reqs = _req.get("build") or []
-                    host_reqs = _req.get("host") or []
-                else:
-                    build_reqs = []
-                    host_reqs = []
 
-            name = out.get("name", "").strip()
-            hint_pip_no_build_backend(host_reqs or build_reqs, name, hints)
+    @property
+    def recipe_fname(self) -> str:
+        fname = "recipe.yaml" if self.recipe_version == 1 else "meta.yaml"
+        return os.path.join(self.recipe_dir or "", fname)
 
-    # 9: No duplicates in conda-forge.yml
-    if (
-        not is_staged_recipes
-        and recipe_dir is not None
-        and os.path.exists(
-            cfyml_pth := os.path.join(recipe_dir, "..", "conda-forge.yml")
+    @property
+    def is_staged_recipes(self) -> bool:
+        recipe_dirname = (
+            os.path.basename(self.recipe_dir) if self.recipe_dir else "recipe"
         )
-    ):
-        try:
-            with open(cfyml_pth, encoding="utf-8") as fh:
-                get_yaml(allow_duplicate_keys=False).load(fh)
-        except DuplicateKeyError:
-            lints.append(msg.fc.NoDuplicateKeys().as_string())
+        return recipe_dirname != "recipe"
 
-    # 10: check for proper noarch python syntax
-    if "hint_python_min" not in lints_to_skip:
-        hint_noarch_python_use_python_min(
-            requirements_section.get("host") or [],
-            requirements_section.get("run") or [],
-            test_reqs,
-            outputs_section,
-            noarch_value,
-            recipe_version,
-            hints,
-        )
+    @property
+    def noarch_value(self):
+        return self.build_section.get("noarch")
 
-    # 10b: noarch python recipes should test the minimum AND latest python
-    if "hint_noarch_python_test_latest" not in lints_to_skip and recipe_version == 1:
-        hint_noarch_python_test_latest(
-            get_section(meta, "tests", lints, recipe_version),
-            requirements_section.get("run") or [],
-            outputs_section,
-            noarch_value,
-            recipe_version,
-            hints,
+    @cached_property
+    def expected_sections(self) -> list[str]:
+        if self.recipe_version == 0:
+            return EXPECTED_SECTION_ORDER
+        return (
+            conda_recipe_v1_linter.EXPECTED_SINGLE_OUTPUT_SECTION_ORDER
+            + conda_recipe_v1_linter.EXPECTED_MULTIPLE_OUTPUT_SECTION_ORDER
         )
 
-    # 10c: python version-independent (abi3) recipes should test latest too
-    if (
-        "hint_python_version_independent_test_latest" not in lints_to_skip
-        and recipe_version == 1
-    ):
-        hint_python_version_independent_test_latest(
-            get_section(meta, "tests", lints, recipe_version),
-            requirements_section.get("run") or [],
-            outputs_section,
-            build_section,
-            recipe_version,
-            hints,
-        )
+    @cached_property
+    def major_sections(self) -> list[str]:
+        """The top-level keys of the recipe, without unexpected ones."""
+        return [s for s in self.meta.keys() if s in self.expected_sections]
 
-    # 10d: abi3 recipes no longer need the manual cross-python
-    # `ignore_run_exports` workaround; rattler-build handles it natively
+    @cached_property
+    def recipe_name(self) -> str:
+        if self.recipe_version == 1:
+            return conda_recipe_v1_linter.get_recipe_name(self.meta)
+        return self.package_section.get("name", "").strip()
+
+    @cached_property
+    def test_requirements(self) -> list[str]:
+        return get_all_test_requirements(self.meta, [], self.recipe_version)
+
+    @cached_property
+    def recipe_config_keys(self) -> dict:
+        return _get_recipe_config_keys(self.recipe_dir)
+
+    @cached_property
+    def ci_support_files(self) -> list[str]:
+        if self.is_staged_recipes or self.recipe_dir is None:
+            return []
+        return glob(os.path.join(self.recipe_dir, "..", ".ci_support", "*.yaml"))
+
+
+def _lintable_recipe_name(context: LintContext) -> Optional[str]:
+    name = context.recipe_name
+    # Avoid false positives if the recipe is using variables
+    # from conda_build_config.yaml.
+    if context.recipe_version == 1 and "${{" in name:
+        return None
+    return name
+
+
+# region Recipe rules, part 1
+
+
+@rule(
+    "lint_unexpected_sections",
+    messages=[msg.r.UnexpectedSection],
+    inputs=[RuleInput.META],
+)
+def _lint_unexpected_sections(context: LintContext, lints, hints):
+    # 0: Top level keys should be expected
+    for section in context.meta.keys():
+        if section not in context.expected_sections:
+            lints.append(msg.r.UnexpectedSection(section=section).as_string())
+
+
+@rule("lint_section_order", messages=[msg.r.SectionOrder], inputs=[RuleInput.META])
+def _lint_section_order(context: LintContext, lints, hints):
+    # 1: Top level keys in recipe file should have a specific order.
+    lint_section_order(context.major_sections, lints, context.recipe_version)
+
+
+@rule("lint_about_contents", messages=[msg.r.MissingAboutItem], inputs=[RuleInput.META])
+def _lint_about_contents(context: LintContext, lints, hints):
+    # 2: The about section should have a home, license and summary.
+    lint_about_contents(context.about_section, lints, context.recipe_version)
+
+
+@rule(
+    "lint_recipe_maintainers",
+    messages=[msg.r.NoMaintainers, msg.r.MaintainersMustBeList],
+    inputs=[RuleInput.META],
+)
+def _lint_recipe_maintainers(context: LintContext, lints, hints):
+    # 3a: The recipe should have some maintainers.
+    # 3b: Maintainers should be a list
+    lint_recipe_maintainers(context.extra_section, lints)
+
+
+@rule(
+    "lint_feedstock_name_not_end_with_feedstock",
+    messages=[msg.r.ExtraFeedstockNameSuffix],
+    inputs=[RuleInput.META],
+)
+def _lint_feedstock_name_not_end_with_feedstock(context: LintContext, lints, hints):
+    # 3c: feedstock-name should not end with "-feedstock"
+    lint_feedstock_name_not_end_with_feedstock(context.extra_section, lints)
+
+
+@rule(
+    "lint_recipe_have_tests",
+    messages=[msg.r.RequiredTests, msg.r.RecommendedTests],
+    inputs=[RuleInput.META, RuleInput.FILESYSTEM],
+)
+def _lint_recipe_have_tests(context: LintContext, lints, hints):
+    # 4: The recipe should have some tests.
+    lint_recipe_have_tests(
+        context.recipe_dir,
+        context.test_section,
+        context.outputs_section,
+        lints,
+        hints,
+        context.recipe_version,
+    )
+
+
+@rule(
+    "lint_license_cannot_be_unknown",
+    messages=[msg.r.UnknownLicense],
+    inputs=[RuleInput.META],
+)
+def _lint_license_cannot_be_unknown(context: LintContext, lints, hints):
+    # 5: License cannot be 'unknown.'
+    lint_license_cannot_be_unknown(context.about_section, lints)
+
+
+@rule(
+    "lint_selectors_should_be_in_tidy_form",
+    messages=[
+        msg.r.FormattedSelectors,
+        msg.r.OldPythonSelectorsHint,
+        msg.r.OldPythonSelectorsLint,
+    ],
+    inputs=[RuleInput.RECIPE_TEXT],
+    # v1 does not have selectors in comments form
+    recipe_versions=[0],
+)
+def _lint_selectors_should_be_in_tidy_form(context: LintContext, lints, hints):
+    # 6: Selectors should be in a tidy form.
+    lint_selectors_should_be_in_tidy_form(context.recipe_source, lints, hints)
+
+
+@rule(
+    "lint_no_comment_selectors",
+    messages=[msg.r.NoCommentSelectors],
+    inputs=[RuleInput.RECIPE_TEXT],
+    recipe_versions=[1],
+)
+def _lint_no_comment_selectors(context: LintContext, lints, hints):
+    # 6a: Comment-style selectors must not be used in v1 recipes.
+    lint_no_comment_selectors(context.recipe_source, lints, hints)
+
+
+@rule(
+    "lint_build_section_should_have_a_number",
+    messages=[msg.r.BuildNumberMissing],
+    inputs=[RuleInput.META],
+)
+def _lint_build_section_should_have_a_number(context: LintContext, lints, hints):
+    # 7: The build section should have a build number.
+    lint_build_section_should_have_a_number(context.build_section, lints)
+
+
+@rule(
+    "lint_build_section_should_be_before_run",
+    messages=[msg.r.RequirementsOrder],
+    inputs=[RuleInput.META],
+)
+def _lint_build_section_should_be_before_run(context: LintContext, lints, hints):
+    # 8: The build section should be before the run section in requirements.
+    lint_build_section_should_be_before_run(context.requirements_section, lints)
+
+
+@rule(
+    "lint_sources_should_have_hash",
+    messages=[msg.r.SourceHash],
+    inputs=[RuleInput.META],
+)
+def _lint_sources_should_have_hash(context: LintContext, lints, hints):
+    # 9: Files downloaded should have a hash.
+    lint_sources_should_have_hash(context.sources_section, lints)
+
+
+@rule(
+    "lint_license_should_not_have_license",
+    messages=[msg.r.LicenseFieldMentionsLicense],
+    inputs=[RuleInput.META],
+)
+def _lint_license_should_not_have_license(context: LintContext, lints, hints):
+    # 10: License should not include the word 'license'.
+    lint_license_should_not_have_license(context.about_section, lints)
+
+
+@rule(
+    "lint_should_be_empty_line",
+    messages=[msg.r.TooManyEmptyLines, msg.r.TooFewEmptyLines],
+    inputs=[RuleInput.RECIPE_TEXT],
+)
+def _lint_should_be_empty_line(context: LintContext, lints, hints):
+    # 11: There should be one empty line at the end of the file.
+    lint_should_be_empty_line(context.recipe_source, lints)
+
+
+@rule("lint_license_family", inputs=[RuleInput.META], recipe_versions=[0])
+def _lint_license_family(context: LintContext, lints, hints):
+    # 12: License family must be valid (conda-build checks for that)
+    # we skip it for v1 builds as it will validate it
+    # See more: https://prefix-dev.github.io/rattler-build/latest/reference/recipe_file/#about-section
+    try:
+        ensure_valid_license_family(context.meta)
+    except RuntimeError as e:
+        lints.append(str(e))
+
+
+@rule(
+    "lint_license_family_should_be_valid",
+    messages=[msg.r.LicenseFamily],
+    inputs=[RuleInput.META],
+)
+def _lint_license_family_should_be_valid(context: LintContext, lints, hints):
+    # 12a: License family must be valid (conda-build checks for that)
+    license = context.about_section.get("license", "").lower()
+    lint_license_family_should_be_valid(
+        context.about_section, license, NEEDED_FAMILIES, lints, context.recipe_version
+    )
+
+
+@rule("lint_recipe_name", messages=[msg.r.InvalidPackageName], inputs=[RuleInput.META])
+def _lint_recipe_name(context: LintContext, lints, hints):
+    # 13: Check that the recipe name is valid
+    if context.recipe_version == 1:
+        conda_recipe_v1_linter.lint_recipe_name(context.meta, lints)
+    else:
+        lint_recipe_name(context.package_section, lints)
+
+
+# endregion
+# region conda-forge specific rules
+
+
+@rule("conda_forge_sections", inputs=[RuleInput.META], conda_forge=True)
+def _conda_forge_sections(context: LintContext, lints, hints):
+    # the conda-forge specific lints report malformed sections on their own
+    recipe_version = context.recipe_version
+    for name in ("package", "extra", "requirements", "outputs", "build"):
+        get_section(context.meta, name, lints, recipe_version=recipe_version)
+    get_all_test_requirements(context.meta, lints, recipe_version)
+
+
+@rule(
+    "lint_maintainers_exist",
+    messages=[msg.cf.MaintainerMissing, msg.cf.InconclusiveMaintainerCheck],
+    inputs=[RuleInput.META, RuleInput.NETWORK],
+    conda_forge=True,
+)
+def _lint_maintainers_exist(context: LintContext, lints, hints):
+    # 2: Check that the recipe maintainers exists:
+    maintainers = context.extra_section.get("recipe-maintainers", [])
+    existing = _maintainers_exist(maintainers)
+    for maintainer in maintainers:
+        exists = existing[maintainer]
+        if exists is False:
+            lints.append(
+                msg.cf.MaintainerMissing(
+                    maintainer=maintainer, path=context.recipe_fname
+                ).as_string()
+            )
+        elif exists is None:
+            # the existence check could not be completed (e.g. GitHub rate
+            # limit); fail the lint and ask for it to be retried rather than
+            # risk a false-positive or false-negative
+            lints.append(
+                msg.cf.InconclusiveMaintainerCheck(
+                    maintainer=maintainer, path=context.recipe_fname
+                ).as_string()
+            )
+
+
+@rule(
+    "hint_packages_to_avoid",
+    messages=[msg.cf.PackageToAvoid],
+    inputs=[RuleInput.META, RuleInput.NETWORK],
+    conda_forge=True,
+)
+def _hint_packages_to_avoid(context: LintContext, lints, hints):
+    # 5: Package-specific hints
+    # (e.g. do not depend on matplotlib, only matplotlib-base)
+    # we use a copy here since the += below modifies the original list
+    requirements_section = context.requirements_section
+    build_reqs = copy.deepcopy(requirements_section.get("build") or [])
+    host_reqs = copy.deepcopy(requirements_section.get("host") or [])
+    run_reqs = copy.deepcopy(requirements_section.get("run") or [])
+    for out in context.outputs_section:
+        if context.recipe_version == 1:
+            output_requirements = rattler_loader.load_all_requirements(out)
+            build_reqs += output_requirements.get("build") or []
+            host_reqs += output_requirements.get("host") or []
+            run_reqs += output_requirements.get("run") or []
+        else:
+            _req = out.get("requirements") or {}
+            if isinstance(_req, Mapping):
+                build_reqs += _req.get("build") or []
+                host_reqs += _req.get("host") or []
+                run_reqs += _req.get("run") or []
+            else:
+                run_reqs += _req
+
+    specific_hints = (load_linter_toml_metadata() or {}).get("hints", {})
+    all_reqs = build_reqs + host_reqs + run_reqs
+    if context.recipe_version == 1:
+        all_reqs = flatten_v1_if_else(all_reqs)
+
+    for rq in all_reqs:
+        dep = rq.split(" ")[0].strip()
+        dep_hint = specific_hints.get(dep)
+        if dep_hint:
+            msg.cf.PackageToAvoid(
+                package_hint=dep_hint, path=context.recipe_fname
+            ).append_if_absent(hints)
+
+
+@rule(
+    "lint_ci_support_files",
+    messages=[msg.cf.NoVariantConfigs],
+    inputs=[RuleInput.FILESYSTEM],
+    conda_forge=True,
+)
+def _lint_ci_support_files(context: LintContext, lints, hints):
+    # 7: Ensure that the recipe has some .ci_support files
+    if context.is_staged_recipes or context.recipe_dir is None:
+        return
+    if not context.ci_support_files:
+        lints.append(msg.cf.NoVariantConfigs().as_string())
+
+
+@rule(
+    "hint_pip_no_build_backend",
+    messages=[msg.r.PythonBuildBackendHost],
+    inputs=[RuleInput.META],
+    conda_forge=True,
+    skippable=True,
+)
+def _hint_pip_no_build_backend(context: LintContext, lints, hints):
+    # 8: Ensure the recipe specifies a Python build backend if needed
+    requirements_section = context.requirements_section
+    host_or_build_reqs = (requirements_section.get("host") or []) or (
+        requirements_section.get("build") or []
+    )
+    if context.recipe_version == 1:
+        host_or_build_reqs = flatten_v1_if_else(host_or_build_reqs)
+    hint_pip_no_build_backend(host_or_build_reqs, context.recipe_name, hints)
+    for out in context.outputs_section:
+        if context.recipe_version == 1:
+            output_requirements = rattler_loader.load_all_requirements(out)
+            build_reqs = output_requirements.get("build") or []
+            host_reqs = output_requirements.get("host") or []
+        else:
+            _req = out.get("requirements") or {}
+            if isinstance(_req, Mapping):
+                build_reqs = _req.get("build") or []
+                host_reqs = _req.get("host") or []
+            else:
+                build_reqs = []
+                host_reqs = []
+
+        name = out.get("name", "").strip()
+        hint_pip_no_build_backend(host_reqs or build_reqs, name, hints)
+
+
+@rule(
+    "lint_no_duplicate_keys",
+    messages=[msg.fc.NoDuplicateKeys],
+    inputs=[RuleInput.FILESYSTEM],
+    conda_forge=True,
+)
+def _lint_no_duplicate_keys(context: LintContext, lints, hints):
+    # 9: No duplicates in conda-forge.yml
     if (
-        "hint_abi3_cross_python_run_exports" not in lints_to_skip
-        and recipe_version == 1
-    ):
-        hint_abi3_cross_python_run_exports(
-            requirements_section,
-            outputs_section,
-            build_section,
-            recipe_version,
-            hints,
+        not context.is_staged_recipes
+        and context.recipe_dir is not None
+        and os.path.exists(
+            cfyml_pth := os.path.join(context.recipe_dir, "..", "conda-forge.yml")
         )
+    ):
+        try:
+            with open(cfyml_pth, encoding="utf-8") as fh:
+                get_yaml(allow_duplicate_keys=False).load(fh)
+        except DuplicateKeyError:
+            lints.append(msg.fc.NoDuplicateKeys().as_string())
 
-    # 10e: abi3 recipes should verify their extension modules with abi3audit
-    if "hint_abi3_missing_abi3audit" not in lints_to_skip:
-        hint_abi3_missing_abi3audit(
-            get_section(
-                meta,
-                "tests" if recipe_version == 1 else "test",
-                lints,
-                recipe_version,
-            ),
-            outputs_section,
-            build_section,
-            requirements_section,
-            recipe_version,
-            hints,
-        )
 
-    if os.path.exists(recipe_fname):
-        with open(recipe_fname, encoding="utf-8") as fh:
-            recipe_text = fh.read()
+@rule(
+    "hint_python_min",
+    messages=[msg.r.PythonMinPin],
+    inputs=[RuleInput.META],
+    conda_forge=True,
+    skippable=True,
+)
+def _hint_python_min(context: LintContext, lints, hints):
+    # 10: check for proper noarch python syntax
+    hint_noarch_python_use_python_min(
+        context.requirements_section.get("host") or [],
+        context.requirements_section.get("run") or [],
+        context.test_requirements,
+        context.outputs_section,
+        context.noarch_value,
+        context.recipe_version,
+        hints,
+    )
 
-        # 11: ensure we can parse the recipe
-        lint_recipe_is_parsable(
-            recipe_text,
-            lints,
-            hints,
-            recipe_version=recipe_version,
-        )
 
-        # 11b: redefining python_min to the global pinning default is redundant
-        if "hint_redundant_python_min" not in lints_to_skip:
-            hint_redundant_python_min(
-                meta,
-                recipe_text,
-                recipe_version,
-                hints,
-            )
+@rule(
+    "hint_noarch_python_test_latest",
+    messages=[msg.r.NoarchPythonTestLatest],
+    inputs=[RuleInput.META],
+    recipe_versions=[1],
+    conda_forge=True,
+    skippable=True,
+)
+def _hint_noarch_python_test_latest(context: LintContext, lints, hints):
+    # 10b: noarch python recipes should test the minimum AND latest python
+    hint_noarch_python_test_latest(
+        get_section(context.meta, "tests", lints, context.recipe_version),
+        context.requirements_section.get("run") or [],
+        context.outputs_section,
+        context.noarch_value,
+        context.recipe_version,
+        hints,
+    )
+
+
+@rule(
+    "hint_python_version_independent_test_latest",
+    messages=[msg.r.PythonVersionIndependentTestLatest],
+    inputs=[RuleInput.META],
+    recipe_versions=[1],
+    conda_forge=True,
+    skippable=True,
+)
+def _hint_python_version_independent_test_latest(context: LintContext, lints, hints):
+    # 10c: python version-independent (abi3) recipes should test latest too
+    hint_python_version_independent_test_latest(
+        get_section(context.meta, "tests", lints, context.recipe_version),
+        context.requirements_section.get("run") or [],
+        context.outputs_section,
+        context.build_section,
+        context.recipe_version,
+        hints,
+    )
+
+
+@rule(
+    "hint_abi3_cross_python_run_exports",
+    messages=[msg.r.Abi3CrossPythonRunExports],
+    inputs=[RuleInput.META],
+    recipe_versions=[1],
+    conda_forge=True,
+    skippable=True,
+)
+def _hint_abi3_cross_python_run_exports(context: LintContext, lints, hints):
+    # 10d: abi3 recipes no longer need the manual cross-python
+    # `ignore_run_exports` workaround; rattler-build handles it natively
+    hint_abi3_cross_python_run_exports(
+        context.requirements_section,
+        context.outputs_section,
+        context.build_section,
+        context.recipe_version,
+        hints,
+    )
 
-        # 12: ensure is_abi3 is boolean
-        lint_recipe_is_abi3_bool(
-            recipe_text,
+
+@rule(
+    "hint_abi3_missing_abi3audit",
+    messages=[msg.r.Abi3MissingAbi3Audit],
+    inputs=[RuleInput.META],
+    conda_forge=True,
+    skippable=True,
+)
+def _hint_abi3_missing_abi3audit(context: LintContext, lints, hints):
+    # 10e: abi3 recipes should verify their extension modules with abi3audit
+    hint_abi3_missing_abi3audit(
+        get_section(
+            context.meta,
+            "tests" if context.recipe_version == 1 else "test",
             lints,
-        )
+            context.recipe_version,
+        ),
+        context.outputs_section,
+        context.build_section,
+        context.requirements_section,
+        context.recipe_version,
+        hints,
+    )
 
-        # 12b: defining SP_DIR is an obsolete rattler-build workaround
-        if "hint_rattler_build_sp_dir" not in lints_to_skip:
-            hint_rattler_build_sp_dir(
-                recipe_text,
-                hints,
-                recipe_version,
-            )
 
+@rule(
+    "lint_recipe_is_parsable",
+    messages=[msg.r.NotParsableLint, msg.r.NotParsableHint],
+    inputs=[RuleInput.RECIPE_TEXT],
+    conda_forge=True,
+)
+def _lint_recipe_is_parsable(context: LintContext, lints, hints):
+    # 11: ensure we can parse the recipe
+    if context.recipe_source is None:
+        return
+    lint_recipe_is_parsable(
+        context.recipe_source.text,
+        lints,
+        hints,
+        recipe_version=context.recipe_version,
+    )
+
+
+@rule(
+    "hint_redundant_python_min",
+    messages=[msg.r.RedundantPythonMin],
+    inputs=[RuleInput.RECIPE_TEXT, RuleInput.META, RuleInput.NETWORK],
+    conda_forge=True,
+    skippable=True,
+)
+def _hint_redundant_python_min(context: LintContext, lints, hints):
+    # 11b: redefining python_min to the global pinning default is redundant
+    if context.recipe_source is None:
+        return
+    hint_redundant_python_min(
+        context.meta,
+        context.recipe_source.text,
+        context.recipe_version,
+        hints,
+    )
+
+
+@rule(
+    "lint_recipe_is_abi3_bool",
+    messages=[msg.r.PythonIsAbi3Bool],
+    inputs=[RuleInput.RECIPE_TEXT],
+    conda_forge=True,
+)
+def _lint_recipe_is_abi3_bool(context: LintContext, lints, hints):
+    # 12: ensure is_abi3 is boolean
+    if context.recipe_source is None:
+        return
+    lint_recipe_is_abi3_bool(context.recipe_source.text, lints)
+
+
+@rule(
+    "hint_rattler_build_sp_dir",
+    messages=[msg.r.RattlerSPDir],
+    inputs=[RuleInput.RECIPE_TEXT],
+    conda_forge=True,
+    skippable=True,
+)
+def _hint_rattler_build_sp_dir(context: LintContext, lints, hints):
+    # 12b: defining SP_DIR is an obsolete rattler-build workaround
+    if context.recipe_source is None:
+        return
+    hint_rattler_build_sp_dir(
+        context.recipe_source.text,
+        hints,
+        context.recipe_version,
+    )
+
+
+@rule(
+    "lint_empty_variants_file",
+    messages=[msg.cf.NoEmptyVariantsFile],
+    inputs=[RuleInput.FILESYSTEM],
+    conda_forge=True,
+)
+def _lint_empty_variants_file(context: LintContext, lints, hints):
     # 13: no empty conda_build_config.yaml files
-    cbc_pth = os.path.join(recipe_dir or "", "conda_build_config.yaml")
+    cbc_pth = os.path.join(context.recipe_dir or "", "conda_build_config.yaml")
     if os.path.exists(cbc_pth):
         with open(cbc_pth, encoding="utf-8") as fh:
             data = fh.read()
         if not data or not data.strip():
             lints.append(msg.cf.NoEmptyVariantsFile(path=cbc_pth).as_string())
 
+
+@rule(
+    "lint_osx_pins",
+    messages=[
+        msg.rv.MacOSDeploymentTargetBelow,
+        msg.rv.MacOSDeploymentTargetBelowStdlib,
+        msg.rv.MacOSDeploymentTargetRename,
+    ],
+    inputs=[RuleInput.FILESYSTEM],
+    conda_forge=True,
+)
+def _lint_osx_pins(context: LintContext, lints, hints):
     # 14: incorrect configuration on osx for c_stdlib_version, MACOSX_SDK_VERSION etc.
     # get recipe config files (we don't care about the content, only if it's non-None)
-    recipe_config_keys = _get_recipe_config_keys(recipe_dir)
-    for config_fn, content in recipe_config_keys.items():
+    for config_fn, content in context.recipe_config_keys.items():
         if content is not None:
-            lint_osx_pins(recipe_dir, config_fn, lints, recipe_version)
+            lint_osx_pins(context.recipe_dir, config_fn, lints, context.recipe_version)
+
 
+@rule(
+    "lint_no_custom_gha_workflows",
+    messages=[msg.cf.NoCustomGHAWorkflows],
+    inputs=[RuleInput.FILESYSTEM],
+    conda_forge=True,
+)
+def _lint_no_custom_gha_workflows(context: LintContext, lints, hints):
     # 15: Do not allow custom Github Actions workflows
-    gha_workflows_dir = Path(recipe_dir or "", "..", ".github", "workflows")
+    gha_workflows_dir = Path(context.recipe_dir or "", "..", ".github", "workflows")
     gha_workflows = [
         *gha_workflows_dir.glob("*.yml"),
         *gha_workflows_dir.glob("*.yaml"),
@@ -908,20 +1235,456 @@ def run_conda_forge_specific(
             msg.cf.NoCustomGHAWorkflows(path=f"{gha_workflows}/*.yaml").as_string()
         )
 
+
+@rule(
+    "hint_dependency_pins",
+    messages=[msg.cf.PinnedDependencyOverridden],
+    inputs=[RuleInput.META, RuleInput.FILESYSTEM],
+    conda_forge=True,
+)
+def _hint_dependency_pins(context: LintContext, lints, hints):
     # 16: Check for requirements overriding dependency pins
     hint_dependency_pins(
-        requirements_section, outputs_section, ci_support_files, hints, recipe_version
+        context.requirements_section,
+        context.outputs_section,
+        context.ci_support_files,
+        hints,
+        context.recipe_version,
     )
 
+
+@rule(
+    "hint_deprecated_environment_variables",
+    messages=[msg.cf.DeprecatedEnvironmentVariable],
+    inputs=[RuleInput.FEEDSTOCK_CONFIG],
+    conda_forge=True,
+)
+def _hint_deprecated_environment_variables(context: LintContext, lints, hints):
     # 17: Check for deprecated conda-forge.yml variables (that cannot be caught
     # via the schema)
-    hint_deprecated_environment_variables(feedstock_config, hints)
-
+    hint_deprecated_environment_variables(context.feedstock_config, hints)
+
+
+@rule(
+    "lint_invalid_workflow_settings",
+    messages=[
+        msg.cf.WorkflowSettingsNonPlatformSpecificPath,
+        msg.cf.WorkflowSettingsOverlappingEntries,
+        msg.cf.WorkflowSettingsPlatformOSMismatch,
+        msg.cf.WorkflowSettingsSpecificEntryTooLoose,
+    ],
+    inputs=[RuleInput.FEEDSTOCK_CONFIG],
+    conda_forge=True,
+)
+def _lint_invalid_workflow_settings(context: LintContext, lints, hints):
     # 18: Check for invalid values in workflow_settings in conda-forge.yml
-    lint_invalid_workflow_settings(feedstock_config, lints)
+    lint_invalid_workflow_settings(context.feedstock_config, lints)
+
 
+@rule(
+    "lint_feedstock_name",
+    messages=[msg.cf.MismatchedFeedstockName],
+    inputs=[RuleInput.META, RuleInput.FEEDSTOCK_CONFIG, RuleInput.FILESYSTEM],
+    conda_forge=True,
+)
+def _lint_feedstock_name(context: LintContext, lints, hints):
     # 19: Check for missing feedstock-name (if necessary).
-    lint_feedstock_name(meta, feedstock_config, recipe_version, recipe_dir, lints)
+    lint_feedstock_name(
+        context.meta,
+        context.feedstock_config,
+        context.recipe_version,
+        context.recipe_dir,
+        lints,
+    )
+
+
+# endregion
+# region Recipe rules, part 2
+
+
+@rule(
+    "lint_usage_of_legacy_patterns",
+    messages=[msg.r.PinnedNumpy],
+    inputs=[RuleInput.META],
+)
+def _lint_usage_of_legacy_patterns(context: LintContext, lints, hints):
+    # 15: Check if we are using legacy patterns
+    lint_usage_of_legacy_patterns(context.requirements_section, lints)
+
+
+@rule(
+    "lint_subheaders",
+    messages=[msg.r.UnexpectedSubsection],
+    inputs=[RuleInput.META],
+    recipe_versions=[0],
+)
+def _lint_subheaders(context: LintContext, lints, hints):
+    # 16: Subheaders should be in the allowed subheadings
+    lint_subheaders(context.major_sections, context.meta, lints)
+
+
+@rule("lint_noarch", messages=[msg.r.NoarchValue], inputs=[RuleInput.META])
+def _lint_noarch(context: LintContext, lints, hints):
+    # 17: Validate noarch
+    lint_noarch(context.noarch_value, lints)
+
+
+@rule(
+    "lint_noarch_selectors",
+    messages=[msg.r.NoarchSelectorsV0, msg.r.NoarchSelectorsV1],
+    inputs=[
+        RuleInput.META,
+        RuleInput.RECIPE_TEXT,
+        RuleInput.FEEDSTOCK_CONFIG,
+        RuleInput.FILESYSTEM,
+    ],
+    skippable=True,
+)
+def _lint_noarch_selectors(context: LintContext, lints, hints):
+    # 18: noarch doesn't work with selectors for runtime dependencies
+    if context.recipe_version == 1:
+        noarch_platforms = len(context.feedstock_config.get("noarch_platforms", [])) > 1
+        lint_recipe_v1_noarch_and_runtime_dependencies(
+            context.noarch_value,
+            context.meta.get("requirements", {}),
+            context.build_section,
+            noarch_platforms,
+            lints,
+        )
+    else:
+        lint_noarch_and_runtime_dependencies(
+            context.noarch_value,
+            context.recipe_source,
+            context.feedstock_config,
+            context.recipe_config_keys["conda_build_config.yaml"],
+            lints,
+        )
+
+
+@rule(
+    "lint_package_version",
+    messages=[msg.r.MissingVersion, msg.r.InvalidVersion],
+    inputs=[RuleInput.META],
+)
+def _lint_package_version(context: LintContext, lints, hints):
+    # 19: check version
+    if context.recipe_version == 1:
+        conda_recipe_v1_linter.lint_package_version(context.meta, lints)
+    else:
+        lint_package_version(context.package_section, lints)
+
+
+@rule(
+    "lint_jinja_variables_definitions",
+    messages=[msg.r.JinjaDefinitions],
+    inputs=[RuleInput.RECIPE_TEXT],
+)
+def _lint_jinja_variables_definitions(context: LintContext, lints, hints):
+    # 20: Jinja2 variable definitions should be nice.
+    lint_jinja_variables_definitions(context.recipe_source, lints)
+
+
+@rule(
+    "lint_legacy_usage_of_compilers",
+    messages=[msg.r.LegacyToolchain],
+    inputs=[RuleInput.META],
+)
+def _lint_legacy_usage_of_compilers(context: LintContext, lints, hints):
+    # 21: Legacy usage of compilers
+    lint_legacy_usage_of_compilers(context.requirements_section.get("build", []), lints)
+
+
+@rule(
+    "lint_single_space_in_pinned_requirements",
+    messages=[
+        msg.r.RequirementJoinVersionOperator,
+        msg.r.RequirementSeparateNameVersion,
+    ],
+    inputs=[RuleInput.META],
+)
+def _lint_single_space_in_pinned_requirements(context: LintContext, lints, hints):
+    # 22: Single space in pinned requirements
+    lint_single_space_in_pinned_requirements(
+        context.requirements_section, lints, context.recipe_version
+    )
+
+
+@rule(
+    "lint_non_noarch_builds",
+    messages=[msg.r.LanguageHostRun, msg.r.LanguageHostRunUnpinned],
+    inputs=[RuleInput.META],
+)
+def _lint_non_noarch_builds(context: LintContext, lints, hints):
+    # 23: non noarch builds shouldn't use version constraints on python and r-base
+    lint_non_noarch_builds(
+        context.requirements_section,
+        context.outputs_section,
+        context.build_section,
+        context.noarch_value,
+        lints,
+        context.recipe_version,
+    )
+
+
+@rule(
+    "lint_jinja_var_references",
+    messages=[msg.r.JinjaExpression],
+    inputs=[RuleInput.RECIPE_TEXT],
+)
+def _lint_jinja_var_references(context: LintContext, lints, hints):
+    # 24: jinja2 variable references should be {{<one space>var<one space>}}
+    lint_jinja_var_references(
+        context.recipe_source, hints, recipe_version=context.recipe_version
+    )
+
+
+@rule(
+    "lint_require_lower_bound_on_python_version",
+    messages=[msg.r.PythonLowerBound],
+    inputs=[RuleInput.META],
+)
+def _lint_require_lower_bound_on_python_version(context: LintContext, lints, hints):
+    # 25: require a lower bound on python version
+    lint_require_lower_bound_on_python_version(
+        context.requirements_section.get("run", []),
+        context.outputs_section,
+        context.noarch_value,
+        lints,
+    )
+
+
+@rule(
+    "lint_pin_subpackages",
+    messages=[msg.r.PinSubpackagePinCompatible],
+    inputs=[RuleInput.META],
+)
+def _lint_pin_subpackages(context: LintContext, lints, hints):
+    # 26: pin_subpackage is for subpackages and pin_compatible is for
+    # non-subpackages of the recipe. Contact @carterbox for troubleshooting
+    # this lint.
+    lint_pin_subpackages(
+        context.meta,
+        context.outputs_section,
+        context.package_section,
+        lints,
+        recipe_version=context.recipe_version,
+    )
+
+
+@rule(
+    "lint_check_usage_of_whls",
+    messages=[
+        msg.r.CompiledWheelsNotAllowed,
+        msg.r.PureWheelsNotAllowed,
+        msg.r.PureWheelsNotAllowedNoarch,
+    ],
+    inputs=[RuleInput.RECIPE_TEXT, RuleInput.META],
+)
+def _lint_check_usage_of_whls(context: LintContext, lints, hints):
+    # 27: Check usage of whl files as a source
+    lint_check_usage_of_whls(context.recipe_source, context.noarch_value, lints, hints)
+
+
+@rule(
+    "lint_rust_licenses_are_bundled",
+    messages=[msg.r.RustLicenses],
+    inputs=[RuleInput.META],
+)
+def _lint_rust_licenses_are_bundled(context: LintContext, lints, hints):
+    # 28: Check that Rust licenses are bundled.
+    lint_rust_licenses_are_bundled(
+        _lintable_recipe_name(context),
+        context.requirements_section.get("build", []),
+        lints,
+        recipe_version=context.recipe_version,
+    )
+
+
+@rule(
+    "lint_go_licenses_are_bundled", messages=[msg.r.GoLicenses], inputs=[RuleInput.META]
+)
+def _lint_go_licenses_are_bundled(context: LintContext, lints, hints):
+    # 29: Check that go licenses are bundled.
+    lint_go_licenses_are_bundled(
+        _lintable_recipe_name(context),
+        context.requirements_section.get("build", []),
+        lints,
+        recipe_version=context.recipe_version,
+    )
+
+
+@rule(
+    "lint_single_recipe_config_file",
+    messages=[msg.rv.MoreThanOneConfigFile],
+    inputs=[RuleInput.FILESYSTEM],
+)
+def _lint_single_recipe_config_file(context: LintContext, lints, hints):
+    # 30: two configuration files present
+    if sum(v is not None for v in context.recipe_config_keys.values()) > 1:
+        lints.append(msg.rv.MoreThanOneConfigFile().as_string())
+
+
+@rule(
+    "lint_stdlib",
+    messages=[msg.r.StdlibJinja, msg.r.StdlibMacOS, msg.r.StdlibSysroot],
+    inputs=[RuleInput.META, RuleInput.FILESYSTEM],
+    skippable=True,
+)
+def _lint_stdlib(context: LintContext, lints, hints):
+    # 31: stdlib-related lints
+    for config_fn in context.recipe_config_keys.keys():
+        lint_stdlib(
+            context.meta,
+            context.requirements_section,
+            context.recipe_dir,
+            config_fn,
+            lints,
+            # the version of the config file does not change the version of the recipe
+            recipe_version=context.recipe_version,
+        )
+
+
+@rule(
+    "lint_floats_quoted", messages=[msg.r.VersionParsedAsFloat], inputs=[RuleInput.META]
+)
+def _lint_floats_quoted(context: LintContext, lints, hints):
+    # 32: floats should be quoted
+    lint_floats_quoted(context.meta, lints, recipe_version=context.recipe_version)
+
+
+# endregion
+# region Recipe hints
+
+
+@rule("hint_pip_usage", messages=[msg.r.UsePip], inputs=[RuleInput.META])
+def _hint_pip_usage(context: LintContext, lints, hints):
+    # 1: suggest pip
+    hint_pip_usage(context.build_section, hints)
+
+
+@rule(
+    "hint_suggest_noarch",
+    messages=[msg.r.SuggestNoarch],
+    inputs=[RuleInput.META, RuleInput.RECIPE_TEXT],
+)
+def _hint_suggest_noarch(context: LintContext, lints, hints):
+    # 2: suggest python noarch (skip on feedstocks)
+    hint_suggest_noarch(
+        context.noarch_value,
+        context.requirements_section.get("build", []),
+        context.meta.get("requirements", {}),
+        context.is_staged_recipes,
+        context.conda_forge,
+        context.recipe_source,
+        hints,
+        recipe_version=context.recipe_version,
+    )
+
+
+@rule(
+    "hint_shellcheck_usage",
+    messages=[msg.r.ScriptShellcheckReport, msg.r.ScriptShellcheckFailure],
+    inputs=[RuleInput.FILESYSTEM, RuleInput.FEEDSTOCK_CONFIG, RuleInput.SUBPROCESS],
+)
+def _hint_shellcheck_usage(context: LintContext, lints, hints):
+    # 3: suggest fixing all recipe/*.sh shellcheck findings
+    hint_shellcheck_usage(
+        context.recipe_dir, hints, feedstock_config=context.feedstock_config
+    )
+
+
+@rule(
+    "hint_check_spdx",
+    messages=[msg.r.LicenseSPDX, msg.r.InvalidLicenseException],
+    inputs=[RuleInput.META],
+)
+def _hint_check_spdx(context: LintContext, lints, hints):
+    # 4: Check for SPDX
+    hint_check_spdx(context.about_section, hints)
+
+
+@rule("hint_legacy_pypi_url", messages=[msg.r.LegacyPyPIURL], inputs=[RuleInput.META])
+def _hint_legacy_pypi_url(context: LintContext, lints, hints):
+    # 5: hint pypi.io -> files.pythonhosted.org
+    hint_legacy_pypi_url(context.sources_section, hints)
+
+
+@rule(
+    "hint_space_separated_specs",
+    messages=[msg.r.SpaceSeparatedSpecs],
+    inputs=[RuleInput.META],
+    recipe_versions=[0],
+)
+def _hint_space_separated_specs(context: LintContext, lints, hints):
+    # 6: warn of `name =version=build` specs, suggest `name version build`
+    # see https://github.com/conda/conda-build/issues/5571#issuecomment-2604505922
+    hint_space_separated_specs(
+        context.requirements_section,
+        context.test_section,
+        context.outputs_section,
+        hints,
+    )
+
+
+@rule(
+    "hint_os_version",
+    messages=[msg.fc.OSVersionLower],
+    inputs=[RuleInput.FEEDSTOCK_CONFIG],
+    skippable=True,
+)
+def _hint_os_version(context: LintContext, lints, hints):
+    # 7. check for obsolete os_version
+    hint_os_version(context.feedstock_config, hints)
+
+
+@rule(
+    "hint_rattler_build_bld_bat",
+    messages=[msg.r.RattlerBldBat],
+    inputs=[RuleInput.FILESYSTEM],
+)
+def _hint_rattler_build_bld_bat(context: LintContext, lints, hints):
+    # 8. check for bld.bat with rattler-build
+    hint_rattler_build_bld_bat(context.recipe_dir, hints, context.recipe_version)
+
+
+# endregion
+
+
+def run_conda_forge_specific(
+    meta,
+    recipe_dir,
+    lints,
+    hints,
+    recipe_version: int = 0,
+    feedstock_config=None,
+    recipe_source: Optional[RecipeSource] = None,
+    timings: Optional[dict[str, float]] = None,
+):
+    if feedstock_config is None:
+        feedstock_config = _get_feedstock_config(recipe_dir)
+    lints_to_skip = feedstock_config.get("linter", {}).get("skip", [])
+
+    context = LintContext.from_meta(
+        meta,
+        # `conda_forge_sections` reports malformed sections
+        [],
+        recipe_dir=recipe_dir,
+        recipe_version=recipe_version,
+        conda_forge=True,
+        recipe_source=recipe_source,
+        feedstock_config=feedstock_config,
+    )
+    if recipe_source is None:
+        context = replace(
+            context, recipe_source=RecipeSource.from_file(context.recipe_fname)
+        )
+    rules = select_rules(
+        (r for r in RULES if r.conda_forge),
+        recipe_version,
+        conda_forge=True,
+        skip=lints_to_skip,
+    )
+    run_rules(rules, context, lints, hints, timings=timings)
 
 
 def _format_validation_msg(error: jsonschema.ValidationError):
@@ -998,28 +1761,30 @@ def find_recipe_directory(
     return (recipe_dir, build_tool)
 
 
-def main(recipe_dir, conda_forge=False, return_hints=False, feedstock_dir=None):
-    recipe_dir, build_tool = find_recipe_directory(recipe_dir, feedstock_dir)
-
-    if build_tool == RATTLER_BUILD_TOOL:
-        recipe_file = os.path.join(recipe_dir, "recipe.yaml")
-    else:
-        recipe_file = os.path.join(recipe_dir, "meta.yaml")
-
-    if not os.path.exists(recipe_file):
-        raise OSError(f"No recipe file found in {recipe_dir}")
-
+def _load_recipe(recipe_source: RecipeSource, build_tool: str) -> Any:
     if build_tool == CONDA_BUILD_TOOL:
-        with open(recipe_file, encoding="utf-8") as fh:
-            content = render_meta_yaml("".join(fh))
-            meta = get_yaml().load(content)
-    else:
-        # we have to preserve the string quoting information for properly
-        # rendering the context section of the recipe
-        yl = get_yaml(preserve_quotes=True)
-        with open(recipe_file, encoding="utf-8") as fp:
-            meta = yl.load(fp.read())
+        content = render_meta_yaml(recipe_source.text)
+        return get_yaml().load(content)
+    # we have to preserve the string quoting information for properly
+    # rendering the context section of the recipe
+    yl = get_yaml(preserve_quotes=True)
+    return yl.load(recipe_source.text)
 
+
+def _lint_recipe_results(
+    recipe_dir: str,
+    build_tool: str,
+    recipe_source: RecipeSource,
+    conda_forge: bool,
+    timings: Optional[dict[str, float]] = None,
+) -> dict:
+    """Lint a recipe, keeping the lints and hints of every rule apart.
+
+    The result has the messages reported before the rules (``before``), the
+    ``(name, lints, hints)`` of every rule that ran (``rules``) and the
+    conda-forge.yml validation results (``after``), in reporting order.
+    """
+    meta = _load_recipe(recipe_source, build_tool)
     recipe_version = 1 if build_tool == RATTLER_BUILD_TOOL else 0
 
     # this call to lint the confa-forge.yml has to come before the
@@ -1029,15 +1794,258 @@ def main(recipe_dir, conda_forge=False, return_hints=False, feedstock_dir=None):
     # see https://github.com/prefix-dev/rattler-build-conda-compat/issues/88
     validation_errors, validation_hints = lintify_forge_yaml(recipe_dir=recipe_dir)
 
-    results, hints = lintify_meta_yaml(
+    rule_results = {}
+    lints, hints = lintify_meta_yaml(
         meta,
         recipe_dir,
         conda_forge,
         recipe_version=recipe_version,
+        recipe_source=recipe_source,
+        timings=timings,
+        rule_results=rule_results,
+    )
+    # the rules append their messages after anything reported up front
+    num_rule_lints = sum(len(rule_lints) for rule_lints, _ in rule_results.values())
+    num_rule_hints = sum(len(rule_hints) for _, rule_hints in rule_results.values())
+    return {
+        "before": (
+            lints[: len(lints) - num_rule_lints],
+            hints[: len(hints) - num_rule_hints],
+        ),
+        "rules": [
+            (name, rule_lints, rule_hints)
+            for name, (rule_lints, rule_hints) in rule_results.items()
+        ],
+        "after": (
+            [_format_validation_msg(err) for err in validation_errors],
+            list(validation_hints),
+        ),
+    }
+
+
+def _flatten_lint_results(results: dict) -> tuple[list[str], list[str]]:
+    lints, hints = list(results["before"][0]), list(results["before"][1])
+    for _, rule_lints, rule_hints in results["rules"]:
+        lints.extend(rule_lints)
+        hints.extend(rule_hints)
+    lints.extend(results["after"][0])
+    hints.extend(results["after"][1])
+    return lints, hints
+
+
+def _lint_cache_key(recipe_dir: str, build_tool: str, conda_forge: bool) -> str:
+    """A hash of everything the lint results of ``recipe_dir`` depend on.
+
+    That is the path and contents of the recipe directory, the feedstock
+    configuration files, the conda-smithy version and, for conda-forge, the
+    other feedstock files the rules look at, the git remotes the feedstock
+    name is checked against and the versions of the remote linter data.
+    """
+    hasher = hashlib.sha256()
+
+    def add(*parts):
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode("utf-8")
+            # length-prefix every part so that no two inputs hash the same
+            hasher.update(len(part).to_bytes(8, "little"))
+            hasher.update(part)
+
+    # the messages contain paths, and the directory name tells whether this
+    # is a staged-recipes layout
+    add(__version__, build_tool, str(conda_forge), os.path.abspath(recipe_dir))
+    for root, dirs, files in os.walk(recipe_dir):
+        dirs.sort()
+        for fn in sorted(files):
+            path = os.path.join(root, fn)
+            add(os.path.relpath(path, recipe_dir), Path(path).read_bytes())
+    for config_filename in (
+        "conda-forge.yml",
+        "conda_build_config.yaml",
+        "variants.yaml",
+    ):
+        if config_file := find_local_config_file(recipe_dir, config_filename):
+            add(config_filename, Path(config_file).read_bytes())
+    if conda_forge:
+        feedstock_dir = Path(recipe_dir, "..")
+        for pattern in (".ci_support/*.yaml", ".github/workflows/*"):
+            for path in sorted(feedstock_dir.glob(pattern)):
+                if path.is_file():
+                    add(path.relative_to(feedstock_dir).as_posix(), path.read_bytes())
+        if (repo := get_repo(recipe_dir)) is not None:
+            for remote_name in ("upstream", "origin"):
+                if remote_name in repo.remotes.names():
+                    add(remote_name, repo.remotes[remote_name].url or "")
+        add(
+            get_linter_data_version(LINTER_HINTS_TOML_URL) or "",
+            get_global_pinning_python_min() or "",
+        )
+    return hasher.hexdigest()
+
+
+def _lint_cache_path(key: str) -> Path:
+    return get_cache_dir() / "conda-smithy" / "lint" / f"{key}.json"
+
+
+@lru_cache(maxsize=1)
+def _message_classes() -> dict[str, type[LinterMessage]]:
+    return {
+        obj.identifier: obj
+        for module in msg.all_modules
+        for obj in vars(module).values()
+        if isinstance(obj, type)
+        and issubclass(obj, LinterMessage)
+        and hasattr(obj, "identifier")
+    }
+
+
+def _dump_messages(messages: Sequence[str]) -> list[list[Optional[str]]]:
+    return [[message_as_dict(m)["identifier"], str(m)] for m in messages]
+
+
+def _load_messages(messages: Sequence[Sequence[Optional[str]]]) -> list[str]:
+    message_classes = _message_classes()
+    return [
+        (
+            RenderedMessage(text, message_classes[identifier])
+            if identifier in message_classes
+            else text
+        )
+        for identifier, text in messages
+    ]
+
+
+def _read_lint_cache(key: str) -> Optional[dict]:
+    try:
+        with open(_lint_cache_path(key), encoding="utf-8") as fh:
+            entry = json.load(fh)
+        return {
+            "before": tuple(_load_messages(m) for m in entry["before"]),
+            "rules": [
+                (name, _load_messages(rule_lints), _load_messages(rule_hints))
+                for name, rule_lints, rule_hints in entry["rules"]
+            ],
+            "after": tuple(_load_messages(m) for m in entry["after"]),
+            "network_ts": entry["network_ts"],
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_lint_cache(key: str, results: dict) -> None:
+    cache_path = _lint_cache_path(key)
+    entry = {
+        "before": [_dump_messages(m) for m in results["before"]],
+        "rules": [
+            [name, _dump_messages(rule_lints), _dump_messages(rule_hints)]
+            for name, rule_lints, rule_hints in results["rules"]
+        ],
+        "after": [_dump_messages(m) for m in results["after"]],
+        "network_ts": results["network_ts"],
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent linter runs never
+        # read a partially written cache
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        LOGGER.debug("Could not write the lint cache: %s", err)
+
+
+def _rerun_network_rules(
+    results: dict,
+    recipe_dir: str,
+    build_tool: str,
+    recipe_source: RecipeSource,
+    conda_forge: bool,
+    timings: Optional[dict[str, float]] = None,
+) -> dict:
+    """Replace the results of the rules that query the network in ``results``."""
+    names = {name for name, _, _ in results["rules"]}
+    rules = [r for r in RULES if r.name in names and RuleInput.NETWORK in r.inputs]
+    if not rules:
+        return results
+    context = LintContext.from_meta(
+        _load_recipe(recipe_source, build_tool),
+        [],
+        recipe_dir=recipe_dir,
+        recipe_version=1 if build_tool == RATTLER_BUILD_TOOL else 0,
+        conda_forge=conda_forge,
+        recipe_source=recipe_source,
+        feedstock_config=_get_feedstock_config(recipe_dir),
     )
+    rule_results = {}
+    run_rules(rules, context, [], [], timings=timings, results=rule_results)
+    refreshed = []
+    for name, rule_lints, rule_hints in results["rules"]:
+        if name in rule_results:
+            rule_lints, rule_hints = rule_results[name]
+        refreshed.append((name, rule_lints, rule_hints))
+    return {**results, "rules": refreshed}
 
-    results.extend([_format_validation_msg(err) for err in validation_errors])
-    hints.extend(validation_hints)
+
+def _lint_recipe_results_cached(
+    recipe_dir: str,
+    build_tool: str,
+    recipe_source: RecipeSource,
+    conda_forge: bool,
+    timings: Optional[dict[str, float]] = None,
+) -> dict:
+    """`_lint_recipe_results`, reusing the results of an earlier run.
+
+    Results are stored in the conda-smithy cache directory under the
+    `_lint_cache_key` of the recipe. The rules that query the network (e.g.
+    whether the maintainers exist) are rerun once their results are older
+    than `LINT_CACHE_NETWORK_LIFETIME` seconds.
+    """
+    key = _lint_cache_key(recipe_dir, build_tool, conda_forge)
+    now = int(time.time())
+    results = _read_lint_cache(key)
+    if results is None:
+        results = _lint_recipe_results(
+            recipe_dir, build_tool, recipe_source, conda_forge, timings=timings
+        )
+    elif now - results["network_ts"] > LINT_CACHE_NETWORK_LIFETIME:
+        results = _rerun_network_rules(
+            results, recipe_dir, build_tool, recipe_source, conda_forge, timings
+        )
+    else:
+        return results
+    results["network_ts"] = now
+    _write_lint_cache(key, results)
+    return results
+
+
+def main(
+    recipe_dir,
+    conda_forge=False,
+    return_hints=False,
+    feedstock_dir=None,
+    timings=None,
+    use_cache=False,
+):
+    recipe_dir, build_tool = find_recipe_directory(recipe_dir, feedstock_dir)
+
+    if build_tool == RATTLER_BUILD_TOOL:
+        recipe_file = os.path.join(recipe_dir, "recipe.yaml")
+    else:
+        recipe_file = os.path.join(recipe_dir, "meta.yaml")
+
+    recipe_source = RecipeSource.from_file(recipe_file)
+    if recipe_source is None:
+        raise OSError(f"No recipe file found in {recipe_dir}")
+
+    if use_cache:
+        lint_results = _lint_recipe_results_cached(
+            recipe_dir, build_tool, recipe_source, conda_forge, timings=timings
+        )
+    else:
+        lint_results = _lint_recipe_results(
+            recipe_dir, build_tool, recipe_source, conda_forge, timings=timings
+        )
+    results, hints = _flatten_lint_results(lint_results)
 
     if return_hints:
         return results, hints
@@ -1045,6 +2053,98 @@ def main(recipe_dir, conda_forge=False, return_hints=False, feedstock_dir=None):
         return results
 
 
+def _init_lint_worker(linter_data: Mapping[str, Optional[str]]) -> None:
+    seed_linter_data(linter_data)
+
+
+def _lint_one(
+    recipe_dir: str,
+    conda_forge: bool,
+    feedstock_dir: Optional[str],
+    profile: bool,
+    use_cache: bool = False,
+) -> tuple[list[str], list[str], Optional[dict[str, float]]]:
+    timings = {} if profile else None
+    lints, hints = main(
+        recipe_dir,
+        conda_forge=conda_forge,
+        return_hints=True,
+        feedstock_dir=feedstock_dir,
+        timings=timings,
+        use_cache=use_cache,
+    )
+    return lints, hints, timings
+
+
+def lint_recipes(
+    recipe_dirs: Sequence[str],
+    conda_forge: bool = False,
+    feedstock_dir: Optional[str] = None,
+    jobs: int = 1,
+    timings: Optional[dict[str, float]] = None,
+    use_cache: bool = False,
+) -> Iterator[tuple[str, list[str], list[str]]]:
+    """Lint several recipes, yielding ``(recipe_dir, lints, hints)`` in order.
+
+    With ``jobs > 1`` the recipes are linted in a pool of worker processes.
+    The remote linter data is fetched once up front and handed to every
+    worker, and each worker keeps its own caches warm across the recipes
+    it lints.
+
+    If ``timings`` is given, the time spent in each lint rule is added to it,
+    summed over all recipes.
+
+    With ``use_cache``, the results of recipes that did not change since
+    they were last linted are taken from the conda-smithy cache directory.
+    """
+    profile = timings is not None
+    if jobs <= 1 or len(recipe_dirs) <= 1:
+        results = (
+            _lint_one(recipe_dir, conda_forge, feedstock_dir, profile, use_cache)
+            for recipe_dir in recipe_dirs
+        )
+        yield from _collect_lint_results(recipe_dirs, results, timings)
+        return
+
+    linter_data = snapshot_linter_data() if conda_forge else {}
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(recipe_dirs)),
+        initializer=_init_lint_worker,
+        initargs=(linter_data,),
+    ) as pool:
+        results = pool.map(
+            _lint_one,
+            recipe_dirs,
+            repeat(conda_forge),
+            repeat(feedstock_dir),
+            repeat(profile),
+            repeat(use_cache),
+        )
+        yield from _collect_lint_results(recipe_dirs, results, timings)
+
+
+def _collect_lint_results(recipe_dirs, results, timings):
+    for recipe_dir, (lints, hints, recipe_timings) in zip(recipe_dirs, results):
+        if timings is not None:
+            for name, duration in recipe_timings.items():
+                timings[name] = timings.get(name, 0.0) + duration
+        yield recipe_dir, lints, hints
+
+
+def message_as_dict(message: str) -> dict[str, Optional[str]]:
+    """Describe a lint or hint, including its `linter.messages` identifier.
+
+    Messages that were not rendered from a `LinterMessage` (e.g. schema
+    validation errors) have no identifier.
+    """
+    message_class = getattr(message, "message_class", None)
+    return {
+        "identifier": message_class.identifier if message_class else None,
+        "name": message_class.__name__ if message_class else None,
+        "message": str(message),
+    }
+
+
 if __name__ == "__main__":
     # This block is supposed to help debug how the rendered version
     # of the linter bot would look like in Github. Taken from
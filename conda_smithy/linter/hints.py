@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
 import shutil
 import subprocess
 import sys
 from collections.abc import Generator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from glob import glob
+from pathlib import Path
 from typing import Any
 
 from conda.deprecations import deprecated
@@ -16,6 +21,7 @@ from conda_smithy.linter import conda_recipe_v1_linter
 from conda_smithy.linter import messages as msg
 from conda_smithy.linter.utils import (
     VALID_PYTHON_BUILD_BACKENDS,
+    RecipeSource,
     find_local_config_file,
     flatten_v1_if_else,
     get_all_test_requirements,
@@ -23,7 +29,7 @@ from conda_smithy.linter.utils import (
     get_version_independent,
     is_selector_line,
 )
-from conda_smithy.utils import get_yaml
+from conda_smithy.utils import get_cache_dir, get_yaml
 
 
 def hint_pip_usage(build_section, hints):
@@ -63,7 +69,7 @@ def hint_suggest_noarch(
     raw_requirements_section,
     is_staged_recipes,
     conda_forge,
-    recipe_fname,
+    recipe_source: RecipeSource | None,
     hints,
     recipe_version: int = 0,
 ):
@@ -78,34 +84,116 @@ def hint_suggest_noarch(
             conda_recipe_v1_linter.hint_noarch_usage(
                 build_reqs, raw_requirements_section, hints
             )
-        else:
-            with open(recipe_fname, encoding="utf-8") as fh:
-                runreqs_spacing = None
-                no_arch_possible = True
-                for line in fh:
-                    line_s = line.strip()
-                    if line_s == "host:" or line_s == "run:":
-                        runreqs_spacing = line[: -len(line.lstrip())]
+        elif recipe_source is not None:
+            runreqs_spacing = None
+            no_arch_possible = True
+            for line in recipe_source.lines:
+                line_s = line.strip()
+                if line_s == "host:" or line_s == "run:":
+                    runreqs_spacing = line[: -len(line.lstrip())]
+                    continue
+                if line_s.startswith("skip:") and is_selector_line(line):
+                    no_arch_possible = False
+                    break
+                if runreqs_spacing is not None:
+                    if runreqs_spacing == line[: -len(line.lstrip())]:
+                        runreqs_spacing = None
                         continue
-                    if line_s.startswith("skip:") and is_selector_line(line):
+                    if is_selector_line(line):
                         no_arch_possible = False
                         break
-                    if runreqs_spacing is not None:
-                        if runreqs_spacing == line[: -len(line.lstrip())]:
-                            runreqs_spacing = None
-                            continue
-                        if is_selector_line(line):
-                            no_arch_possible = False
-                            break
-                if no_arch_possible:
-                    hints.append(msg.r.SuggestNoarch().as_string())
+            if no_arch_possible:
+                hints.append(msg.r.SuggestNoarch().as_string())
+
+
+#: the number of scripts checked by each of the parallel shellcheck processes
+SHELLCHECK_SCRIPTS_PER_PROCESS = 8
+
+
+@lru_cache(maxsize=1)
+def _shellcheck_version(shellcheck: str) -> str:
+    return subprocess.run(
+        [shellcheck, "--version"],
+        capture_output=True,
+        text=True,
+        env={"PATH": os.getenv("PATH")},
+    ).stdout
+
+
+def _run_shellcheck(cmd: list[str], shell_scripts: list[str]) -> tuple[int, str]:
+    p = subprocess.Popen(
+        cmd + shell_scripts,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env={
+            "PATH": os.getenv("PATH")
+        },  # exclude other env variables to protect against token leakage
+    )
+    sc_stdout, _ = p.communicate()
+    return p.returncode, sc_stdout.decode(sys.stdout.encoding)
+
+
+def _shellcheck_cache_path(cmd: list[str], shell_scripts: list[str]) -> Path:
+    hasher = hashlib.sha256()
+    hasher.update(_shellcheck_version(shutil.which(cmd[0])).encode("utf-8"))
+    hasher.update(json.dumps(cmd).encode("utf-8"))
+    for script in shell_scripts:
+        with open(script, "rb") as fh:
+            content_hash = hashlib.sha256(fh.read()).hexdigest()
+        hasher.update(json.dumps([script, content_hash]).encode("utf-8"))
+    name = hasher.hexdigest()
+    return get_cache_dir() / "conda-smithy" / "shellcheck" / f"{name}.json"
+
+
+def _shellcheck(cmd: list[str], shell_scripts: list[str]) -> tuple[int, str]:
+    """Run ``cmd`` on ``shell_scripts``, returning its exit code and output.
+
+    Large sets of scripts are split across parallel shellcheck processes.
+    Results are cached on disk by the shellcheck version and the contents of
+    the scripts.
+    """
+    cache_path = _shellcheck_cache_path(cmd, shell_scripts)
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cached = json.load(fh)
+        return cached["returncode"], cached["output"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    batches = [
+        shell_scripts[i : i + SHELLCHECK_SCRIPTS_PER_PROCESS]
+        for i in range(0, len(shell_scripts), SHELLCHECK_SCRIPTS_PER_PROCESS)
+    ]
+    with ThreadPoolExecutor(max_workers=min(len(batches), os.cpu_count() or 1)) as pool:
+        results = list(pool.map(partial(_run_shellcheck, cmd), batches))
+    output = "".join(batch_output for _, batch_output in results)
+    returncodes = [returncode for returncode, _ in results]
+    failed = [returncode for returncode in returncodes if returncode not in (0, 1)]
+    if failed:
+        # something went wrong, try again next time
+        return failed[0], output
+
+    returncode = max(returncodes)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent linter runs never
+        # read a partially written cache
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"returncode": returncode, "output": output}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return returncode, output
 
 
 def hint_shellcheck_usage(recipe_dir, hints, feedstock_config=None):
     shellcheck_enabled = False
     shell_scripts = []
     if recipe_dir:
-        shell_scripts = glob(os.path.join(recipe_dir, "*.sh"))
+        shell_scripts = sorted(glob(os.path.join(recipe_dir, "*.sh")))
         if not shell_scripts:
             return
         if feedstock_config is None:
@@ -129,30 +217,18 @@ def hint_shellcheck_usage(recipe_dir, hints, feedstock_config=None):
                 "--exclude=SC2154",
             ]
 
-            p = subprocess.Popen(
-                cmd + shell_scripts,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                env={
-                    "PATH": os.getenv("PATH")
-                },  # exclude other env variables to protect against token leakage
-            )
-            sc_stdout, _ = p.communicate()
+            returncode, sc_stdout = _shellcheck(cmd, shell_scripts)
 
-            if p.returncode == 1:
+            if returncode == 1:
                 # All files successfully scanned with some issues.
-                findings = (
-                    sc_stdout.decode(sys.stdout.encoding)
-                    .replace("\r\n", "\n")
-                    .splitlines()
-                )
+                findings = sc_stdout.replace("\r\n", "\n").splitlines()
                 hints.append(
                     msg.r.ScriptShellcheckReport(
                         command=cmd,
                         output_lines=findings,
                     ).as_string()
                 )
-            elif p.returncode != 0:
+            elif returncode != 0:
                 # Something went wrong.
                 hints.append(msg.r.ScriptShellcheckFailure().as_string())
 
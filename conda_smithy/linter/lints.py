@@ -4,7 +4,6 @@ import itertools
 import logging
 import os
 import re
-import tempfile
 from collections.abc import Sequence
 from typing import Any, Literal, Optional
 from urllib.parse import urlsplit
@@ -17,6 +16,7 @@ from ruamel.yaml import CommentedSeq
 from conda_smithy.feedstock_io import get_repo
 from conda_smithy.linter import conda_recipe_v1_linter
 from conda_smithy.linter import messages as msg
+from conda_smithy.linter.recipe_parsers import run_recipe_parsers
 from conda_smithy.linter.utils import (
     EXPECTED_SECTION_ORDER,
     FIELDS,
@@ -24,14 +24,13 @@ from conda_smithy.linter.utils import (
     REQUIREMENTS_ORDER,
     TEST_FILES,
     TEST_KEYS,
+    RecipeSource,
     _lint_package_version,
     _lint_recipe_name,
     flatten_v1_if_else,
     get_section,
     get_version_independent,
     is_selector_line,
-    jinja_lines,
-    selector_lines,
 )
 from conda_smithy.utils import (
     ensure_standard_strings,
@@ -41,6 +40,9 @@ from conda_smithy.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds each third-party parser may take in `lint_recipe_is_parsable`.
+RECIPE_PARSER_TIMEOUT = float(os.environ.get("CONDA_SMITHY_RECIPE_PARSER_TIMEOUT", 60))
+
 
 def lint_section_order(
     major_sections: list[str],
@@ -136,7 +138,9 @@ def lint_license_cannot_be_unknown(about_section, lints):
         lints.append(msg.r.UnknownLicense().as_string())
 
 
-def lint_selectors_should_be_in_tidy_form(recipe_fname, lints, hints):
+def lint_selectors_should_be_in_tidy_form(
+    recipe_source: Optional[RecipeSource], lints, hints
+):
     bad_selectors, bad_lines = [], []
     python_selectors_lint, py_selector_lines_lint = [], []
     python_selectors_hint, py_selector_lines_hint = [], []
@@ -144,22 +148,21 @@ def lint_selectors_should_be_in_tidy_form(recipe_fname, lints, hints):
     good_selectors_pat = re.compile(r"(.+?)\s{2,}#\s\[(.+)\](?(2).*)$")
     # Look out for py27, py35 selectors; we prefer py==35
     python_selectors_pat = re.compile(r".+#\s*\[.*?(py\d{2,3}).*\]")
-    if os.path.exists(recipe_fname):
-        with open(recipe_fname, encoding="utf-8") as fh:
-            for selector_line, line_number in selector_lines(fh):
-                if not good_selectors_pat.match(selector_line):
-                    bad_selectors.append(selector_line)
-                    bad_lines.append(line_number)
-                python_matches = python_selectors_pat.match(selector_line)
-                if python_matches:
-                    for py_selector in python_matches.groups():
-                        if int(py_selector[2:]) in (27, 34, 35, 36):
-                            # py27, py35 and so on are ok up to py36 (included); only warn
-                            python_selectors_hint.append(selector_line)
-                            py_selector_lines_hint.append(line_number)
-                        else:
-                            python_selectors_lint.append(selector_line)
-                            py_selector_lines_lint.append(line_number)
+    if recipe_source is not None:
+        for selector_line, line_number in recipe_source.selector_lines:
+            if not good_selectors_pat.match(selector_line):
+                bad_selectors.append(selector_line)
+                bad_lines.append(line_number)
+            python_matches = python_selectors_pat.match(selector_line)
+            if python_matches:
+                for py_selector in python_matches.groups():
+                    if int(py_selector[2:]) in (27, 34, 35, 36):
+                        # py27, py35 and so on are ok up to py36 (included); only warn
+                        python_selectors_hint.append(selector_line)
+                        py_selector_lines_hint.append(line_number)
+                    else:
+                        python_selectors_lint.append(selector_line)
+                        py_selector_lines_lint.append(line_number)
     if bad_selectors:
         lints.append(msg.r.FormattedSelectors(lines=bad_lines).as_string())
     if python_selectors_hint:
@@ -172,12 +175,11 @@ def lint_selectors_should_be_in_tidy_form(recipe_fname, lints, hints):
         )
 
 
-def lint_no_comment_selectors(recipe_fname, lints, hints):
+def lint_no_comment_selectors(recipe_source: Optional[RecipeSource], lints, hints):
     bad_lines = []
-    if os.path.exists(recipe_fname):
-        with open(recipe_fname, encoding="utf-8") as fh:
-            for selector_line, line_number in selector_lines(fh, only_in_comment=True):
-                bad_lines.append(line_number)
+    if recipe_source is not None:
+        for selector_line, line_number in recipe_source.comment_selector_lines:
+            bad_lines.append(line_number)
     if bad_lines:
         lints.append(msg.r.NoCommentSelectors(lines=bad_lines).as_string())
 
@@ -219,10 +221,9 @@ def lint_license_should_not_have_license(about_section, lints):
         lints.append(msg.r.LicenseFieldMentionsLicense().as_string())
 
 
-def lint_should_be_empty_line(meta_fname, lints):
-    if os.path.exists(meta_fname):
-        with open(meta_fname, encoding="utf-8") as f:
-            lines = f.read().split("\n")
+def lint_should_be_empty_line(recipe_source: Optional[RecipeSource], lints):
+    if recipe_source is not None:
+        lines = recipe_source.text.split("\n")
         # Count the number of empty lines from the end of the file
         empty_lines = itertools.takewhile(lambda x: x == "", reversed(lines))
         end_empty_lines_count = len(list(empty_lines))
@@ -318,50 +319,53 @@ def lint_recipe_v1_noarch_and_runtime_dependencies(
 
 
 def lint_noarch_and_runtime_dependencies(
-    noarch_value, meta_fname, forge_yaml, conda_build_config_keys, lints
+    noarch_value,
+    recipe_source: Optional[RecipeSource],
+    forge_yaml,
+    conda_build_config_keys,
+    lints,
 ):
     """Lints `noarch` recipes where the meta file exists.
 
     `noarch` recipes may not have runtime dependencies.  They are checked
     for skips with selectors, and for packages with selectors.
     """
-    if noarch_value is None or not os.path.exists(meta_fname):
+    if noarch_value is None or recipe_source is None:
         return
     noarch_platforms = len(forge_yaml.get("noarch_platforms", [])) > 1
-    with open(meta_fname, encoding="utf-8") as fh:
-        runreqs_spacing = None
-        for line_number, line in enumerate(fh, 1):
-            line_s = line.strip()
-            if line_s == "host:" or line_s == "run:":
-                runreqs_spacing = line[: -len(line.lstrip())]
+    runreqs_spacing = None
+    for line_number, line in enumerate(recipe_source.lines, 1):
+        line_s = line.strip()
+        if line_s == "host:" or line_s == "run:":
+            runreqs_spacing = line[: -len(line.lstrip())]
+            continue
+        if line_s.startswith("skip:") and is_selector_line(line):
+            lints.append(
+                msg.r.NoarchSelectorsV0(
+                    noarch=noarch_value,
+                    line_number=line_number,
+                    line=line,
+                    skips=True,
+                ).as_string()
+            )
+            break
+        if runreqs_spacing is not None:
+            if runreqs_spacing == line[: -len(line.lstrip())]:
+                runreqs_spacing = None
                 continue
-            if line_s.startswith("skip:") and is_selector_line(line):
+            if is_selector_line(
+                line,
+                allow_platforms=noarch_platforms,
+                allow_keys=conda_build_config_keys or set(),
+            ):
                 lints.append(
                     msg.r.NoarchSelectorsV0(
                         noarch=noarch_value,
                         line_number=line_number,
                         line=line,
-                        skips=True,
                     ).as_string()
                 )
                 break
-            if runreqs_spacing is not None:
-                if runreqs_spacing == line[: -len(line.lstrip())]:
-                    runreqs_spacing = None
-                    continue
-                if is_selector_line(
-                    line,
-                    allow_platforms=noarch_platforms,
-                    allow_keys=conda_build_config_keys or set(),
-                ):
-                    lints.append(
-                        msg.r.NoarchSelectorsV0(
-                            noarch=noarch_value,
-                            line_number=line_number,
-                            line=line,
-                        ).as_string()
-                    )
-                    break
 
 
 def lint_package_version(package_section, lints):
@@ -371,17 +375,16 @@ def lint_package_version(package_section, lints):
         lints.append(lint_msg)
 
 
-def lint_jinja_variables_definitions(meta_fname, lints):
+def lint_jinja_variables_definitions(recipe_source: Optional[RecipeSource], lints):
     bad_jinja = []
     bad_lines = []
     # Good Jinja2 variable definitions look like "{% set .+ = .+ %}"
     good_jinja_pat = re.compile(r"\s*\{%\s(set)\s[^\s]+\s=\s[^\s]+\s%\}")
-    if os.path.exists(meta_fname):
-        with open(meta_fname, encoding="utf-8") as fh:
-            for jinja_line, line_number in jinja_lines(fh):
-                if not good_jinja_pat.match(jinja_line):
-                    bad_jinja.append(jinja_line)
-                    bad_lines.append(line_number)
+    if recipe_source is not None:
+        for jinja_line, line_number in recipe_source.jinja_lines:
+            if not good_jinja_pat.match(jinja_line):
+                bad_jinja.append(jinja_line)
+                bad_lines.append(line_number)
         if bad_jinja:
             lints.append(msg.r.JinjaDefinitions(lines=bad_lines).as_string())
 
@@ -514,21 +517,22 @@ def lint_non_noarch_builds(
                         )
 
 
-def lint_jinja_var_references(meta_fname, hints, recipe_version: int = 0):
+def lint_jinja_var_references(
+    recipe_source: Optional[RecipeSource], hints, recipe_version: int = 0
+):
     bad_vars = []
     bad_lines = []
     jinja_pattern = (
         JINJA_VAR_PAT if recipe_version == 0 else conda_recipe_v1_linter.JINJA_VAR_PAT
     )
-    if os.path.exists(meta_fname):
-        with open(meta_fname, encoding="utf-8") as fh:
-            for i, line in enumerate(fh.readlines()):
-                for m in jinja_pattern.finditer(line):
-                    if m.group(1) is not None:
-                        var = m.group(1)
-                        if var != f" {var.strip()} ":
-                            bad_vars.append(m.group(1).strip())
-                            bad_lines.append(i + 1)
+    if recipe_source is not None:
+        for i, line in enumerate(recipe_source.lines):
+            for m in jinja_pattern.finditer(line):
+                if m.group(1) is not None:
+                    var = m.group(1)
+                    if var != f" {var.strip()} ":
+                        bad_vars.append(m.group(1).strip())
+                        bad_lines.append(i + 1)
         if bad_vars:
             hints.append(
                 msg.r.JinjaExpression(
@@ -629,20 +633,21 @@ def lint_pin_subpackages(
         check_pins_build_and_requirements(out)
 
 
-def lint_check_usage_of_whls(meta_fname, noarch_value, lints, hints):
+def lint_check_usage_of_whls(
+    recipe_source: Optional[RecipeSource], noarch_value, lints, hints
+):
     pure_python_wheel_urls = []
     compiled_wheel_urls = []
     # We could iterate on `sources_section`, but that might miss platform specific selector lines
     # ... so raw meta.yaml and regex it is...
     pure_python_wheel_re = re.compile(r".*[:-]\s+(http.*-none-any\.whl)\s+.*")
     wheel_re = re.compile(r".*[:-]\s+(http.*\.whl)\s+.*")
-    if os.path.exists(meta_fname):
-        with open(meta_fname, encoding="utf-8") as f:
-            for line in f:
-                if match := pure_python_wheel_re.search(line):
-                    pure_python_wheel_urls.append(match.group(1))
-                elif match := wheel_re.search(line):
-                    compiled_wheel_urls.append(match.group(1))
+    if recipe_source is not None:
+        for line in recipe_source.lines:
+            if match := pure_python_wheel_re.search(line):
+                pure_python_wheel_urls.append(match.group(1))
+            elif match := wheel_re.search(line):
+                compiled_wheel_urls.append(match.group(1))
         if compiled_wheel_urls:
             lints.append(
                 msg.r.CompiledWheelsNotAllowed(urls=compiled_wheel_urls).as_string()
@@ -897,58 +902,25 @@ def lint_stdlib(
         msg.r.StdlibMacOS(recipe_version=recipe_version).append_if_absent(lints)
 
 
-def lint_recipe_is_parsable(
-    recipe_text: str,
-    lints: list[str],
-    hints: list[str],
-    recipe_version: int = 0,
-):
+def _recipe_parse_results(
+    recipe_text: str, recipe_version: int
+) -> tuple[tuple[str, Optional[bool]], ...]:
+    """Which parsers can read ``recipe_text``."""
     parse_results = {}
 
     if recipe_version == 0:
-        parse_name = "conda-forge-tick (the bot)"
-        try:
-            from conda_forge_tick.recipe_parser import CondaMetaYAML
-        except ImportError:
-            parse_results[parse_name] = None
-            pass
-        else:
-            try:
-                CondaMetaYAML(recipe_text)
-            except Exception as e:
-                logger.warning(
-                    "Error parsing recipe with conda-forge-tick (the bot): %s",
-                    repr(e),
-                    exc_info=e,
-                )
-                parse_results[parse_name] = False
-            else:
-                parse_results[parse_name] = True
+        parser_names = [
+            "conda-forge-tick (the bot)",
+            "conda-souschef (grayskull)",
+            "conda-recipe-manager",
+        ]
+    else:
+        parser_names = ["conda-recipe-manager"]
+    parser_results = run_recipe_parsers(
+        recipe_text, parser_names, timeout=RECIPE_PARSER_TIMEOUT
+    )
 
-        parse_name = "conda-souschef (grayskull)"
-        try:
-            from souschef.recipe import Recipe
-        except ImportError:
-            parse_results[parse_name] = None
-            pass
-        else:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                recipe_file = os.path.join(tmpdir, "meta.yaml")
-                with open(recipe_file, "w", encoding="utf-8") as f:
-                    f.write(recipe_text)
-
-                try:
-                    Recipe(load_file=recipe_file)
-                except Exception as e:
-                    logger.warning(
-                        "Error parsing recipe with conda-souschef: %s",
-                        repr(e),
-                        exc_info=e,
-                    )
-                    parse_results[parse_name] = False
-                else:
-                    parse_results[parse_name] = True
-    elif recipe_version == 1:
+    if recipe_version == 1:
         parse_name = "ruamel.yaml"
         try:
             get_yaml(allow_duplicate_keys=False).load(recipe_text)
@@ -962,23 +934,25 @@ def lint_recipe_is_parsable(
         else:
             parse_results[parse_name] = True
 
-    parse_name = "conda-recipe-manager"
-    try:
-        from conda_recipe_manager.parser.recipe_parser import RecipeParser
-    except ImportError:
-        parse_results[parse_name] = None
-    else:
-        try:
-            RecipeParser(recipe_text)
-        except Exception as e:
+    for parse_name, (parsed, error) in parser_results.items():
+        if parsed is False:
             logger.warning(
-                "Error parsing recipe with conda-recipe-manager: %s",
-                repr(e),
-                exc_info=e,
+                "Error parsing recipe with %s: %s",
+                parse_name,
+                error,
             )
-            parse_results[parse_name] = False
-        else:
-            parse_results[parse_name] = True
+        parse_results[parse_name] = parsed
+
+    return tuple(parse_results.items())
+
+
+def lint_recipe_is_parsable(
+    recipe_text: str,
+    lints: list[str],
+    hints: list[str],
+    recipe_version: int = 0,
+):
+    parse_results = dict(_recipe_parse_results(recipe_text, recipe_version))
 
     if parse_results:
         if any(pv is not None for pv in parse_results.values()):
@@ -11,6 +11,31 @@ from string import Template
 from typing import ClassVar, Literal, Self
 
 
+class RenderedMessage(str):
+    """
+    The rendered text of a `LinterMessage`.
+
+    It behaves like any other string in the `lints` and `hints` containers,
+    but remembers the class it was rendered from so that consumers (e.g.
+    `conda smithy recipe-lint --format json`) can report its identifier.
+    """
+
+    message_class: "type[LinterMessage]"
+
+    def __new__(cls, text: str, message_class: "type[LinterMessage]") -> Self:
+        rendered = super().__new__(cls, text)
+        rendered.message_class = message_class
+        return rendered
+
+    def __reduce__(self):
+        # keep the message class when lints cross process boundaries
+        return (self.__class__, (str(self), self.message_class))
+
+    @property
+    def identifier(self) -> str:
+        return self.message_class.identifier
+
+
 class LinterMessage:
     """
     A (templated) message with an identifier.
@@ -137,9 +162,13 @@ class LinterMessage:
     def __str__(self) -> str:
         return self._render()
 
-    # convenience alias; FIXME: remove once we bump major
+    # FIXME: remove once we bump major and lints/hints hold instances natively
     # FIXME: Remove usage from append_if_absent too!
-    as_string = __str__
+    def as_string(self) -> RenderedMessage:
+        """
+        Renders the message as a string that still knows its message class.
+        """
+        return RenderedMessage(self._render(), self.__class__)
 
     def append_if_absent(
         self, iterable: list, test: Literal["isinstance", "str"] = "str"
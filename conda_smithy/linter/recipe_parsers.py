@@ -0,0 +1,211 @@
+"""
+Run third-party recipe parsers in worker processes.
+
+`lint_recipe_is_parsable` checks that the parsers used elsewhere in the
+ecosystem (the bot, grayskull, conda-recipe-manager) can read a recipe.
+Each of them runs in a worker process of a shared pool, concurrently with
+the others and with a time limit, so that a recipe which makes one parser
+very slow cannot stall the whole lint. This module only imports the standard
+library, to keep the start of the workers cheap.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache
+from typing import Optional
+
+
+def _parse_with_conda_forge_tick(recipe_text: str) -> None:
+    from conda_forge_tick.recipe_parser import CondaMetaYAML
+
+    CondaMetaYAML(recipe_text)
+
+
+def _parse_with_souschef(recipe_text: str) -> None:
+    from souschef.recipe import Recipe
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        recipe_file = os.path.join(tmpdir, "meta.yaml")
+        with open(recipe_file, "w", encoding="utf-8") as f:
+            f.write(recipe_text)
+
+        Recipe(load_file=recipe_file)
+
+
+def _parse_with_conda_recipe_manager(recipe_text: str) -> None:
+    from conda_recipe_manager.parser.recipe_parser import RecipeParser
+
+    RecipeParser(recipe_text)
+
+
+#: parser name -> (module that provides it, function that runs it)
+RECIPE_PARSERS: dict[str, tuple[str, Callable[[str], None]]] = {
+    "conda-forge-tick (the bot)": (
+        "conda_forge_tick.recipe_parser",
+        _parse_with_conda_forge_tick,
+    ),
+    "conda-souschef (grayskull)": ("souschef.recipe", _parse_with_souschef),
+    "conda-recipe-manager": (
+        "conda_recipe_manager.parser.recipe_parser",
+        _parse_with_conda_recipe_manager,
+    ),
+}
+
+
+@cache
+def parser_available(module: str) -> bool:
+    """Whether ``module`` can be imported, probed once per process."""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ImportError:
+        # a parent package is missing
+        return False
+
+
+def _run_parser(
+    parse: Callable[[str], None], recipe_text: str
+) -> tuple[Optional[bool], Optional[str]]:
+    """Whether ``parse`` accepts the recipe, and the repr of its error if not.
+
+    Returns ``(None, None)`` if the parser cannot be imported.
+    """
+    try:
+        parse(recipe_text)
+    except ImportError:
+        return None, None
+    except Exception as e:
+        return False, repr(e)
+    return True, None
+
+
+#: the number of parser results that `run_recipe_parsers` keeps
+PARSER_RESULT_CACHE_SIZE = 384
+
+_result_cache_lock = threading.Lock()
+# (parser name, recipe text) -> result, only for parsers that finished
+_result_cache: dict[tuple[str, str], tuple[Optional[bool], Optional[str]]] = {}
+
+_pool_lock = threading.Lock()
+# the pool of the current process, never inherited by forked children
+_pool: Optional[tuple[int, ProcessPoolExecutor]] = None
+# the number of `run_recipe_parsers` calls waiting on each pool
+_pool_users: dict[ProcessPoolExecutor, int] = {}
+
+
+def _cached_result(
+    name: str, recipe_text: str
+) -> Optional[tuple[Optional[bool], Optional[str]]]:
+    with _result_cache_lock:
+        return _result_cache.get((name, recipe_text))
+
+
+def _cache_result(
+    name: str, recipe_text: str, result: tuple[Optional[bool], Optional[str]]
+) -> None:
+    with _result_cache_lock:
+        _result_cache[(name, recipe_text)] = result
+        while len(_result_cache) > PARSER_RESULT_CACHE_SIZE:
+            # dicts keep the insertion order, drop the oldest result
+            del _result_cache[next(iter(_result_cache))]
+
+
+def _acquire_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool[0] != os.getpid() or _pool[1]._broken:
+            pool = ProcessPoolExecutor(
+                max_workers=len(RECIPE_PARSERS),
+                # forking is not safe, the lint rules run in threads
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool = (os.getpid(), pool)
+        pool = _pool[1]
+        _pool_users[pool] = _pool_users.get(pool, 0) + 1
+        return pool
+
+
+def _release_pool(pool: ProcessPoolExecutor, retire: bool) -> None:
+    """Stop waiting on ``pool``, and no longer use it if ``retire``.
+
+    A retired pool is stopped once no other call waits on it, so that a
+    parser stuck for one call does not kill the parsers of another.
+    """
+    global _pool
+    with _pool_lock:
+        if retire and _pool is not None and _pool[1] is pool:
+            _pool = None
+        _pool_users[pool] -= 1
+        stop = not _pool_users[pool] and (_pool is None or _pool[1] is not pool)
+        if stop:
+            del _pool_users[pool]
+    if stop:
+        # a parser that timed out may never finish, so kill the workers
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+
+def run_recipe_parsers(
+    recipe_text: str, parser_names: Sequence[str], timeout: float
+) -> dict[str, tuple[Optional[bool], Optional[str]]]:
+    """Run the named parsers on ``recipe_text`` concurrently.
+
+    Returns the result of `_run_parser` for each parser. Parsers that are not
+    installed are not started. A parser that takes longer than ``timeout``
+    seconds, or whose worker dies, fails with an error saying so. Only the
+    results of the parsers that finished are cached, by recipe text.
+    """
+    results = {}
+    to_run = []
+    for name in parser_names:
+        module, _ = RECIPE_PARSERS[name]
+        if not parser_available(module):
+            results[name] = (None, None)
+        elif (result := _cached_result(name, recipe_text)) is not None:
+            results[name] = result
+        else:
+            to_run.append(name)
+
+    if to_run:
+        pool = _acquire_pool()
+        retire = False
+        try:
+            futures = {
+                name: pool.submit(_run_parser, RECIPE_PARSERS[name][1], recipe_text)
+                for name in to_run
+            }
+            deadline = time.monotonic() + timeout
+            for name, future in futures.items():
+                try:
+                    result = future.result(timeout=max(deadline - time.monotonic(), 0))
+                except FutureTimeoutError:
+                    result = (False, f"timed out after {timeout} seconds")
+                    retire = True
+                except BrokenProcessPool as e:
+                    result = (False, f"the parser process died: {e!r}")
+                    retire = True
+                else:
+                    if result[0] is not None:
+                        _cache_result(name, recipe_text, result)
+                results[name] = result
+        except BrokenProcessPool as e:
+            # the pool broke before all the parsers were submitted
+            for name in to_run:
+                results.setdefault(name, (False, f"the parser process died: {e!r}"))
+            retire = True
+        finally:
+            _release_pool(pool, retire)
+
+    # keep the order of ``parser_names``
+    return {name: results[name] for name in parser_names}
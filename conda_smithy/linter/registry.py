@@ -0,0 +1,167 @@
+"""
+Declarative registry of lint rules.
+
+A rule is a function ``func(context, lints, hints)`` registered under a
+unique name with the `rule` decorator. It declares the `LinterMessage`
+classes it can emit, the inputs it reads and the recipe versions it applies
+to. Rules are run in registration order by `run_rules`, which:
+
+- drops rules that do not apply, or that are disabled via ``linter.skip``
+  in ``conda-forge.yml``, before they do any work;
+- runs rules that wait on the network or on subprocesses in threads, while
+  the other rules run inline;
+- reports lints and hints in registration order, whichever rule finishes
+  first, and optionally records the duration of every rule.
+
+Rules must only read from the context and only append to the ``lints`` and
+``hints`` lists they are given, which is what makes running them in threads
+safe.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Optional
+
+from conda_smithy.linter.messages.base import LinterMessage
+
+
+class RuleInput(StrEnum):
+    #: the raw text of the recipe file
+    RECIPE_TEXT = "recipe_text"
+    #: the parsed recipe
+    META = "meta"
+    #: the contents of conda-forge.yml
+    FEEDSTOCK_CONFIG = "feedstock_config"
+    #: other files of the recipe or the feedstock
+    FILESYSTEM = "filesystem"
+    NETWORK = "network"
+    SUBPROCESS = "subprocess"
+
+
+#: rules reading these inputs mostly wait, so they run in threads
+CONCURRENT_INPUTS = frozenset({RuleInput.NETWORK, RuleInput.SUBPROCESS})
+
+RuleFunc = Callable[[Any, list[str], list[str]], None]
+
+
+@dataclass(frozen=True)
+class Rule:
+    #: unique name, used for `linter.skip` and in timing reports
+    name: str
+    func: RuleFunc
+    #: the messages this rule can emit
+    messages: tuple[type[LinterMessage], ...]
+    inputs: frozenset[RuleInput]
+    recipe_versions: frozenset[int] = frozenset({0, 1})
+    #: whether this rule only runs for conda-forge (`--conda-forge`)
+    conda_forge: bool = False
+    #: whether this rule can be disabled with `linter.skip` in conda-forge.yml
+    skippable: bool = False
+
+    @property
+    def concurrent(self) -> bool:
+        return bool(self.inputs & CONCURRENT_INPUTS)
+
+
+#: all registered rules, in the order their messages are reported
+RULES: list[Rule] = []
+
+
+def rule(
+    name: str,
+    *,
+    messages: Iterable[type[LinterMessage]] = (),
+    inputs: Iterable[RuleInput] = (),
+    recipe_versions: Iterable[int] = (0, 1),
+    conda_forge: bool = False,
+    skippable: bool = False,
+) -> Callable[[RuleFunc], RuleFunc]:
+    """Register the decorated function as a lint rule."""
+
+    def decorator(func: RuleFunc) -> RuleFunc:
+        if any(r.name == name for r in RULES):
+            raise ValueError(f"Lint rule {name!r} is already registered")
+        RULES.append(
+            Rule(
+                name=name,
+                func=func,
+                messages=tuple(messages),
+                inputs=frozenset(inputs),
+                recipe_versions=frozenset(recipe_versions),
+                conda_forge=conda_forge,
+                skippable=skippable,
+            )
+        )
+        return func
+
+    return decorator
+
+
+def select_rules(
+    rules: Iterable[Rule],
+    recipe_version: int,
+    conda_forge: bool,
+    skip: Iterable[str] = (),
+) -> list[Rule]:
+    """The rules that apply to a recipe, without the skipped ones."""
+    skip = set(skip)
+    return [
+        r
+        for r in rules
+        if recipe_version in r.recipe_versions
+        and (conda_forge or not r.conda_forge)
+        and not (r.skippable and r.name in skip)
+    ]
+
+
+def _run_rule(r: Rule, context: Any) -> tuple[list[str], list[str], float]:
+    lints: list[str] = []
+    hints: list[str] = []
+    start = time.perf_counter()
+    r.func(context, lints, hints)
+    return lints, hints, time.perf_counter() - start
+
+
+def run_rules(
+    rules: Iterable[Rule],
+    context: Any,
+    lints: list[str],
+    hints: list[str],
+    timings: Optional[MutableMapping[str, float]] = None,
+    results: Optional[MutableMapping[str, tuple[list[str], list[str]]]] = None,
+) -> None:
+    """Run ``rules`` on ``context``, appending to ``lints`` and ``hints``.
+
+    If ``timings`` is given, the time spent in each rule is added to it,
+    keyed by rule name. If ``results`` is given, the lints and hints of each
+    rule are stored in it, keyed by rule name.
+    """
+    rules = list(rules)
+    concurrent_rules = [r for r in rules if r.concurrent]
+    with ThreadPoolExecutor(max_workers=max(len(concurrent_rules), 1)) as pool:
+        # start the slow rules first, they finish while the rest run inline
+        futures = {r.name: pool.submit(_run_rule, r, context) for r in concurrent_rules}
+        for r in rules:
+            if r.concurrent:
+                rule_lints, rule_hints, duration = futures[r.name].result()
+            else:
+                rule_lints, rule_hints, duration = _run_rule(r, context)
+            lints.extend(rule_lints)
+            hints.extend(rule_hints)
+            if results is not None:
+                results[r.name] = (rule_lints, rule_hints)
+            if timings is not None:
+                timings[r.name] = timings.get(r.name, 0.0) + duration
+
+
+def format_timings(timings: MutableMapping[str, float], limit: int = 20) -> str:
+    """A report of the slowest rules, for `recipe-lint --profile`."""
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+    lines = [f"Slowest lint rules (total {sum(timings.values()):.3f}s):"]
+    lines.extend(f"  {duration:8.3f}s  {name}" for name, duration in slowest[:limit])
+    return "\n".join(lines)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import io
+import json
+import logging
 import os
 import re
 import time
 import tomllib
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from functools import lru_cache
 from glob import glob
+from pathlib import Path
 from typing import Any, Optional, Union
 
 import requests
@@ -17,11 +23,12 @@ from conda_build.metadata import (
 )
 from rattler_build_conda_compat import loader as rattler_loader
 from rattler_build_conda_compat.recipe_sources import get_all_sources
-from requests.exceptions import Timeout
 
 from conda_smithy.deprecations import deprecated
 from conda_smithy.linter import messages as msg
-from conda_smithy.utils import get_yaml
+from conda_smithy.utils import get_cache_dir, get_yaml
+
+LOGGER = logging.getLogger(__name__)
 
 FIELDS = copy.deepcopy(_CONDA_BUILD_FIELDS)
 
@@ -196,6 +203,50 @@ def jinja_lines(lines):
             yield line, i
 
 
+@dataclass(frozen=True)
+class RecipeSource:
+    """The text of a recipe file, read and indexed once for all lint rules.
+
+    ``lines`` keep their line endings, exactly as iterating over the open
+    file would yield them. ``selector_lines``, ``comment_selector_lines``
+    and ``jinja_lines`` hold the ``(line, index)`` pairs produced by the
+    generators of the same name, with zero-based indices.
+    """
+
+    path: str
+    text: str
+    lines: tuple[str, ...]
+    selector_lines: tuple[tuple[str, int], ...]
+    comment_selector_lines: tuple[tuple[str, int], ...]
+    jinja_lines: tuple[tuple[str, int], ...]
+
+    @classmethod
+    def from_text(cls, text: str, path: str = "") -> RecipeSource:
+        lines = tuple(io.StringIO(text))
+        selectors = tuple(selector_lines(lines))
+        return cls(
+            path=path,
+            text=text,
+            lines=lines,
+            selector_lines=selectors,
+            # selectors in comments are a subset of all selectors
+            comment_selector_lines=tuple(
+                (line, i)
+                for line, i in selectors
+                if is_selector_line(line, only_in_comment=True)
+            ),
+            jinja_lines=tuple(jinja_lines(lines)),
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> Optional[RecipeSource]:
+        """Read the recipe at ``path``, or return None if it does not exist."""
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as fh:
+            return cls.from_text(fh.read(), path=path)
+
+
 def _lint_recipe_name(recipe_name: str) -> Optional[str]:
     if re.match(r"^[a-z0-9_\-.]+$", recipe_name) is None:
         return msg.r.InvalidPackageName().as_string()
@@ -222,32 +273,142 @@ def _lint_package_version(version: Optional[str]) -> Optional[str]:
 PINNING_FEEDSTOCK_RAW = (
     "https://raw.githubusercontent.com/conda-forge/conda-forge-pinning-feedstock/main"
 )
+LINTER_HINTS_TOML_URL = f"{PINNING_FEEDSTOCK_RAW}/recipe/linter_hints/hints.toml"
+GLOBAL_PINNING_URL = f"{PINNING_FEEDSTOCK_RAW}/recipe/conda_build_config.yaml"
+# remote data every conda-forge lint run needs
+LINTER_DATA_URLS = (LINTER_HINTS_TOML_URL, GLOBAL_PINNING_URL)
+
+# contents handed over by another process, keyed by (url, epoch_hour)
+_seeded_url_content: dict[tuple[str, int], Optional[str]] = {}
+
+
+# one session per process: connections of a forked parent must not be reused
+@lru_cache(maxsize=1)
+def _http_session_for_pid(pid: int) -> requests.Session:
+    return requests.Session()
+
+
+def get_http_session() -> requests.Session:
+    """The `requests.Session` (with keep-alive) for all network access of the linter."""
+    return _http_session_for_pid(os.getpid())
+
+
+def _http_cache_path(url: str) -> Path:
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return get_cache_dir() / "conda-smithy" / "http" / f"{name}.json"
+
+
+def _read_http_cache(url: str) -> dict:
+    try:
+        with open(_http_cache_path(url), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_http_cache(url: str, entry: dict) -> None:
+    cache_path = _http_cache_path(url)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent linter runs never
+        # read a partially written cache
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        LOGGER.debug("Could not write the HTTP cache for %s: %s", url, err)
+
+
+def fetch_url_content(url: str, timeout: float = 5) -> Optional[str]:
+    """Fetch a text file, revalidating the copy kept in the conda-smithy cache.
+
+    The ``ETag`` and ``Last-Modified`` headers of the last good response are
+    sent back, so an unchanged file costs a ``304``. If the server cannot be
+    reached or has a transient error, the last good copy is returned. Returns
+    None if there is no copy to return.
+    """
+    cached = _read_http_cache(url)
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        response = get_http_session().get(url, headers=headers, timeout=timeout)
+    except requests.RequestException as err:
+        LOGGER.debug("Could not fetch %s: %r", url, err)
+        return cached.get("content")
+
+    if response.status_code == 304 and "content" in cached:
+        return cached["content"]
+    if response.status_code != 200:
+        if response.status_code == 429 or response.status_code >= 500:
+            return cached.get("content")
+        return None
+
+    content = response.content.decode("utf-8")
+    _write_http_cache(
+        url,
+        {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content": content,
+        },
+    )
+    return content
 
 
 # cache size should be >= number of urls in use; old epochs are never needed again
 @lru_cache(maxsize=5)
 def _try_fetch_url_content(url: str, epoch_hour: int) -> Optional[str]:
     """private helper for _try_fetch_url_content_cached"""
-    try:
-        payload = requests.get(url, timeout=5)
-    except Timeout:
-        return None
-    if payload.status_code != 200:
-        # too bad, but not important enough to throw an error;
-        # linter will rerun on the next commit anyway
-        return None
-    return payload.content.decode("utf-8")
+    # too bad if this fails, but not important enough to throw an error;
+    # linter will rerun on the next commit anyway
+    return fetch_url_content(url)
 
 
 def _try_fetch_url_content_cached(url: str) -> Optional[str]:
     """self-limited to update only once per hour"""
     epoch_hour = int(time.time() / 3600)  # time.time() is in seconds
+    if (url, epoch_hour) in _seeded_url_content:
+        return _seeded_url_content[url, epoch_hour]
     return _try_fetch_url_content(url, epoch_hour)
 
 
+def snapshot_linter_data() -> dict[str, Optional[str]]:
+    """Fetch (or reuse) the remote linter data, keyed by URL.
+
+    Pass the result to `seed_linter_data` in worker processes so that they
+    do not each download the same files again.
+    """
+    return {url: _try_fetch_url_content_cached(url) for url in LINTER_DATA_URLS}
+
+
+def seed_linter_data(contents: Mapping[str, Optional[str]]) -> None:
+    """Prime the hourly URL cache with contents from `snapshot_linter_data`."""
+    epoch_hour = int(time.time() / 3600)
+    for url, content in contents.items():
+        _seeded_url_content[url, epoch_hour] = content
+
+
+def get_linter_data_version(url: str) -> Optional[str]:
+    """An identifier of the current remote linter data at ``url``.
+
+    This is the ``ETag`` of the copy in the HTTP cache, or a hash of the
+    content if the server did not send one. Returns None if the data cannot
+    be fetched.
+    """
+    if (content := _try_fetch_url_content_cached(url)) is None:
+        return None
+    cached = _read_http_cache(url)
+    if cached.get("etag") and cached.get("content") == content:
+        return cached["etag"]
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 def load_linter_toml_metadata():
-    url = f"{PINNING_FEEDSTOCK_RAW}/recipe/linter_hints/hints.toml"
-    if (hints_toml_str := _try_fetch_url_content_cached(url)) is None:
+    if (hints_toml_str := _try_fetch_url_content_cached(LINTER_HINTS_TOML_URL)) is None:
         return None
     return tomllib.loads(hints_toml_str)
 
@@ -274,8 +435,7 @@ deprecated.constant(
 def get_global_pinning_python_min() -> Optional[str]:
     """The default `python_min` from conda-forge's global pinning, as a
     string, or None if it cannot be fetched."""
-    url = f"{PINNING_FEEDSTOCK_RAW}/recipe/conda_build_config.yaml"
-    if (pinning_yaml := _try_fetch_url_content_cached(url)) is None:
+    if (pinning_yaml := _try_fetch_url_content_cached(GLOBAL_PINNING_URL)) is None:
         return None
     python_min = get_yaml().load(pinning_yaml).get("python_min")
     if isinstance(python_min, Sequence) and not isinstance(python_min, str):
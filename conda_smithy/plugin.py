@@ -9,7 +9,6 @@ from __future__ import annotations
 from argparse import Namespace
 
 from conda.plugins import hookimpl
-from conda.plugins.types import CondaSubcommand
 
 
 def _execute(args: Namespace | tuple[str, ...]) -> int | None:
@@ -24,6 +23,8 @@ def _execute(args: Namespace | tuple[str, ...]) -> int | None:
 
 @hookimpl
 def conda_subcommands():
+    from conda.plugins.types import CondaSubcommand
+
     yield CondaSubcommand(
         name="smithy",
         summary=(
@@ -4,10 +4,12 @@ import json
 import os
 import re
 import shutil
+import sys
 import tempfile
 import time
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path, PureWindowsPath
 from typing import Any, Optional, Union
@@ -100,6 +102,13 @@ def get_yaml(allow_duplicate_keys: bool = True, preserve_quotes: bool = False):
     return yaml
 
 
+def get_cache_dir():
+    if sys.platform.startswith("win"):
+        return Path(os.environ.get("TEMP", Path.home() / ".cache"))
+    else:
+        return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+
+
 @contextmanager
 def tmp_directory():
     tmp_dir = tempfile.mkdtemp("_recipe")
@@ -221,6 +230,26 @@ def file_permissions(path) -> str:
     return oct(os.stat(path).st_mode & 0o777)
 
 
+def run_in_threads(
+    tasks: Mapping[Any, Callable[[], Any]], max_workers: Optional[int] = None
+) -> dict[Any, BaseException]:
+    """Call the functions in ``tasks`` concurrently in a pool of threads.
+
+    At most ``max_workers`` functions run at the same time (by default all of
+    them). Returns the exceptions raised by the functions that failed, by key,
+    in the order of ``tasks``.
+    """
+    if not tasks:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks)) as pool:
+        futures = {key: pool.submit(func) for key, func in tasks.items()}
+    errors = {}
+    for key, future in futures.items():
+        if future.exception() is not None:
+            errors[key] = future.exception()
+    return errors
+
+
 class HashableDict(dict):
     """Hashable dict so it can be in sets"""
 
@@ -1,6 +1,11 @@
+import hashlib
 import json
 import os
+import time
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import requests
 from jsonschema import Draft202012Validator, validators
@@ -8,6 +13,8 @@ from jsonschema.exceptions import ValidationError
 from referencing import Registry, Resource
 from referencing.jsonschema import DRAFT202012
 
+from conda_smithy.utils import get_cache_dir
+
 CONDA_FORGE_YAML_DEFAULTS_FILE = (
     Path(__file__).resolve().parent / "data" / "conda-forge.yml"
 )
@@ -17,9 +24,29 @@ CONDA_FORGE_YAML_SCHEMA_FILE = (
 )
 
 
+# the remote schemas (e.g. of the bot config) are refreshed once a day
+REMOTE_SCHEMA_LIFETIME = 24 * 60 * 60
+
+# the deprecation hints of the running `validate_json_schema` call
+_deprecation_hints: ContextVar[list[str] | None] = ContextVar(
+    "_deprecation_hints", default=None
+)
+
+
 class DeprecatedValidator:
-    def __init__(self):
-        self.hints: list[str] = []
+    """Implements the ``deprecated`` keyword by recording a hint.
+
+    The hints are collected per `validate_json_schema` call rather than on
+    this object, so that a validator using it can be reused.
+    """
+
+    @property
+    def hints(self) -> list[str]:
+        hints = _deprecation_hints.get()
+        if hints is None:
+            hints = []
+            _deprecation_hints.set(hints)
+        return hints
 
     def __call__(self, validator, value, instance, schema):
         if value and instance is not None:
@@ -37,6 +64,72 @@ def get_validator_class(deprecated_validator):
     )
 
 
+def _remote_schema_cache_path(uri: str) -> Path:
+    name = hashlib.sha256(uri.encode("utf-8")).hexdigest()
+    return get_cache_dir() / "conda-smithy" / "schemas" / f"{name}.json"
+
+
+def _get_remote_json_schema(uri: str) -> Any:
+    """Fetch a remote schema through the copy kept in the conda-smithy cache.
+
+    The copy is used for `REMOTE_SCHEMA_LIFETIME` seconds, and after that
+    whenever the schema cannot be fetched.
+    """
+    cache_path = _remote_schema_cache_path(uri)
+    cached = None
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if time.time() - cache_path.stat().st_mtime <= REMOTE_SCHEMA_LIFETIME:
+            return cached
+    except (OSError, ValueError):
+        pass
+
+    try:
+        response = requests.get(uri, timeout=30)
+        response.raise_for_status()
+        val = response.json()
+    except (requests.RequestException, ValueError):
+        if cached is None:
+            raise
+        return cached
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent runs never read
+        # a partially written schema
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(val), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return val
+
+
+def _get_json_schema(uri: str) -> Resource:
+    if uri.startswith("file://"):
+        assert Path(uri[7:]).is_file()
+        val = json.loads(Path(uri[7:]).read_text(encoding="utf-8"))
+    else:
+        val = _get_remote_json_schema(uri)
+
+    return Resource.from_contents(val, default_specification=DRAFT202012)
+
+
+@lru_cache(maxsize=8)
+def _get_validator(schema_file: str, mtime_ns: int, bot_schema_uri: str | None):
+    """The validator for ``schema_file``, built once per version of the file."""
+    with open(schema_file, encoding="utf-8") as fh:
+        _json_schema = json.loads(fh.read())
+
+    # allow the URI to be set dynamically
+    if bot_schema_uri is not None:
+        _json_schema["properties"]["bot"]["$ref"] = bot_schema_uri
+
+    return get_validator_class(DeprecatedValidator())(
+        _json_schema, registry=Registry(retrieve=_get_json_schema)
+    )
+
+
 def validate_json_schema(
     config,
     schema_file: str | Path | None = None,
@@ -44,29 +137,16 @@ def validate_json_schema(
     # Validate the merged configuration against a JSON schema
     if not schema_file:
         schema_file = CONDA_FORGE_YAML_SCHEMA_FILE
+    schema_file = os.path.abspath(schema_file)
 
-    with open(schema_file, encoding="utf-8") as fh:
-        _json_schema = json.loads(fh.read())
-
-    def _get_json_schema(uri: str):
-        if uri.startswith("file://"):
-            assert Path(uri[7:]).is_file()
-            val = json.loads(Path(uri[7:]).read_text(encoding="utf-8"))
-        else:
-            response = requests.get(uri)
-            response.raise_for_status()
-            val = response.json()
-
-        return Resource.from_contents(val, default_specification=DRAFT202012)
-
-    # allow the URI to be set dynamically
-    if "CONDA_SMITHY_BOT_SCHEMA_URI" in os.environ:
-        _json_schema["properties"]["bot"]["$ref"] = os.environ[
-            "CONDA_SMITHY_BOT_SCHEMA_URI"
-        ]
-
-    deprecated_validator = DeprecatedValidator()
-    validator = get_validator_class(deprecated_validator)(
-        _json_schema, registry=Registry(retrieve=_get_json_schema)
+    validator = _get_validator(
+        schema_file,
+        os.stat(schema_file).st_mtime_ns,
+        os.environ.get("CONDA_SMITHY_BOT_SCHEMA_URI"),
     )
-    return list(validator.iter_errors(config)), deprecated_validator.hints
+    token = _deprecation_hints.set([])
+    try:
+        errors = list(validator.iter_errors(config))
+        return errors, _deprecation_hints.get()
+    finally:
+        _deprecation_hints.reset(token)
@@ -1,8 +1,13 @@
+import threading
+import time
 from unittest import mock
 
 import pytest
 
-from conda_smithy.anaconda_token_rotation import rotate_anaconda_token
+from conda_smithy.anaconda_token_rotation import (
+    rotate_anaconda_token,
+    rotate_anaconda_tokens,
+)
 from conda_smithy.ci_register import drone_default_endpoint
 
 
@@ -220,3 +225,91 @@ def test_rotate_anaconda_token_provider_error(
         )
 
     assert "on {}".format(provider.replace("_", " ")) in str(e.value)
+
+
+@mock.patch("conda_smithy.github.gh_token")
+@mock.patch("conda_smithy.anaconda_token_rotation._get_anaconda_token")
+@mock.patch("conda_smithy.anaconda_token_rotation.rotate_token_in_circle")
+@mock.patch("conda_smithy.anaconda_token_rotation.rotate_token_in_travis")
+@mock.patch("conda_smithy.anaconda_token_rotation.rotate_token_in_azure")
+def test_rotate_anaconda_token_concurrent(
+    azure_mock, travis_mock, circle_mock, get_ac_token, get_gh_token
+):
+    get_ac_token.return_value = "abc123"
+    get_gh_token.return_value = None
+
+    # circle and travis wait until both of them are running
+    barrier = threading.Barrier(2, timeout=10)
+    circle_mock.side_effect = lambda *args: barrier.wait()
+    travis_mock.side_effect = lambda *args: barrier.wait()
+    azure_mock.side_effect = ValueError("blah")
+
+    with pytest.raises(RuntimeError) as e:
+        rotate_anaconda_token(
+            "foo",
+            "bar",
+            None,
+            drone=False,
+            appveyor=False,
+            github_actions=False,
+        )
+
+    # azure failed, but did not keep the others from finishing
+    assert str(e.value) == "Failed to rotate token for foo/bar on azure!"
+    circle_mock.assert_called_once()
+    travis_mock.assert_called_once()
+
+
+@mock.patch("conda_smithy.github.gh_token")
+@mock.patch("conda_smithy.anaconda_token_rotation.time.sleep")
+@mock.patch("conda_smithy.anaconda_token_rotation.Github")
+@mock.patch("conda_smithy.anaconda_token_rotation._get_anaconda_token")
+@mock.patch("conda_smithy.anaconda_token_rotation.rotate_token_in_circle")
+@mock.patch("conda_smithy.anaconda_token_rotation.rotate_token_in_github_actions")
+def test_rotate_anaconda_tokens(
+    github_actions_mock,
+    circle_mock,
+    get_ac_token,
+    github_mock,
+    sleep_mock,
+    get_gh_token,
+):
+    get_ac_token.return_value = "abc123"
+    get_gh_token.return_value = None
+    gh = github_mock.return_value
+    gh.rate_limiting = (10, 5000)
+    gh.rate_limiting_resettime = time.time() + 30
+
+    def rotate_github_actions(user, project, *args):
+        if project == "baz-feedstock":
+            raise ValueError("blah")
+
+    github_actions_mock.side_effect = rotate_github_actions
+
+    failures = rotate_anaconda_tokens(
+        "foo",
+        {
+            "bar-feedstock": "bar-feedstock/conda-forge.yml",
+            "baz-feedstock": "baz-feedstock/conda-forge.yml",
+        },
+        drone=False,
+        travis=False,
+        azure=False,
+        appveyor=False,
+        token_name="MY_FANCY_TOKEN",
+        max_workers=2,
+    )
+
+    assert failures == {
+        "baz-feedstock": (
+            "Failed to rotate token for foo/baz-feedstock on github actions!"
+        )
+    }
+    assert sorted(call.args[1] for call in circle_mock.call_args_list) == [
+        "bar-feedstock",
+        "baz-feedstock",
+    ]
+    assert github_actions_mock.call_count == 2
+    # the GitHub rate limit was nearly used up, so both waited for the reset
+    assert sleep_mock.call_count == 2
+    assert 29 < sleep_mock.call_args.args[0] <= 31
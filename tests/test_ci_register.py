@@ -0,0 +1,290 @@
+import asyncio
+import copy
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from conda_smithy import ci_register
+from conda_smithy.ci_register import provider_session
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, do not wait for delayed ACKs
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _respond(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append((self.command, self.path))
+        status, headers = (
+            self.server.responses.pop(0) if self.server.responses else (200, {})
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def do_GET(self):  # noqa: N802
+        self._respond()
+
+    def do_POST(self):  # noqa: N802
+        self._respond()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    monkeypatch.setitem(ci_register.PROVIDER_REQUESTS_PER_SECOND, "circle", 1000)
+    ci_register._provider_adapter.cache_clear()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.connections = 0
+    server.requests = []
+    # (status, headers) of the next responses, then 200
+    server.responses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    ci_register._provider_adapter.cache_clear()
+
+
+def test_provider_session_reuses_connections(stub_server):
+    server, url = stub_server
+
+    for _ in range(20):
+        requests.get(f"{url}/envvar").raise_for_status()
+    assert server.connections == 20
+
+    server.connections = 0
+    for _ in range(20):
+        provider_session("circle").get(f"{url}/envvar").raise_for_status()
+    # all sessions of a provider share one keep-alive connection
+    assert server.connections == 1
+
+
+def test_provider_session_retries(stub_server):
+    server, url = stub_server
+    session = provider_session("circle", prefix_url=url)
+
+    server.responses = [(503, {}), (502, {})]
+    assert session.get("/envvar").status_code == 200
+    assert server.requests == [("GET", "/envvar")] * 3
+
+    # a POST is only sent again if the server asks for it
+    server.requests = []
+    server.responses = [(429, {"Retry-After": "1"})]
+    start = time.monotonic()
+    assert session.post("/envvar", data={"name": "A"}).status_code == 200
+    assert time.monotonic() - start >= 1
+    assert server.requests == [("POST", "/envvar")] * 2
+
+    server.requests = []
+    server.responses = [(502, {})]
+    assert session.post("/envvar", data={"name": "A"}).status_code == 502
+    assert server.requests == [("POST", "/envvar")]
+
+
+def test_provider_session_rate_limit(stub_server, monkeypatch):
+    server, url = stub_server
+    monkeypatch.setitem(ci_register.PROVIDER_REQUESTS_PER_SECOND, "circle", 20)
+    ci_register._provider_adapter.cache_clear()
+
+    start = time.monotonic()
+    threads = [
+        threading.Thread(target=provider_session("circle").get, args=(url,))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(server.requests) == 6
+    assert time.monotonic() - start >= 5 / 20
+
+
+def test_travis_sync_delays(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr(ci_register.time, "monotonic", lambda: now)
+
+    # the waits double up to max_delay, with jitter
+    delays = ci_register._travis_sync_delays(60, initial_delay=1, max_delay=4)
+    for expected, delay in zip([1, 2, 4, 4, 4], itertools.islice(delays, 5)):
+        assert expected / 2 <= delay <= expected
+
+    # the last wait ends at the deadline
+    monkeypatch.setattr(ci_register.random, "uniform", lambda a, b: b)
+    delays = []
+    for delay in ci_register._travis_sync_delays(0.5, initial_delay=0.01):
+        delays.append(delay)
+        now += delay
+    assert delays == pytest.approx([0.01, 0.02, 0.04, 0.08, 0.16, 0.19])
+
+
+@pytest.fixture
+def travis_sync(monkeypatch):
+    polls = []
+
+    def user_info(headers):
+        polls.append(time.monotonic())
+        return {"is_syncing": len(polls) < 3}
+
+    monkeypatch.setattr(ci_register, "travis_headers", lambda: {})
+    monkeypatch.setattr(ci_register, "_travis_user_info", user_info)
+    monkeypatch.setattr(
+        ci_register,
+        "_travis_sync_delays",
+        lambda timeout: iter([0.01] * int(timeout * 100)),
+    )
+    return polls
+
+
+def test_travis_wait_until_synced(travis_sync):
+    assert ci_register.travis_wait_until_synced() == {"is_syncing": False}
+    assert len(travis_sync) == 3
+
+    travis_sync.clear()
+    with pytest.raises(RuntimeError, match="not finished for 0.01 seconds"):
+        ci_register.travis_wait_until_synced(timeout=0.01)
+    assert len(travis_sync) == 2
+
+    travis_sync.clear()
+    content = ci_register.travis_wait_until_synced(ignore=True, timeout=0.01)
+    assert content == {"is_syncing": True}
+
+
+def test_travis_wait_until_synced_async(travis_sync, monkeypatch):
+    # the polls only get past the barrier if all four are running at once
+    barrier = threading.Barrier(4, timeout=30)
+
+    def user_info(headers):
+        travis_sync.append(threading.get_ident())
+        barrier.wait()
+        return {"is_syncing": False}
+
+    monkeypatch.setattr(ci_register, "_travis_user_info", user_info)
+
+    async def wait_all():
+        return await asyncio.gather(
+            *(ci_register.travis_wait_until_synced_async() for _ in range(4))
+        )
+
+    assert asyncio.run(wait_all()) == [{"is_syncing": False}] * 4
+    assert len(set(travis_sync)) == 4
+
+
+class FakeGithubSession:
+    """Serves the hooks of the repos in ``hooks`` and records the changes."""
+
+    def __init__(self, hooks):
+        self.hooks = hooks
+        self.changes = []
+
+    def _response(self, status, content=None):
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(content).encode()
+        return response
+
+    def get(self, url, params=None, headers=None):
+        repo = url.split("/")[-2]
+        if repo not in self.hooks:
+            return self._response(404)
+        return self._response(200, self.hooks[repo])
+
+    def post(self, url, json=None, headers=None):
+        self.changes.append(("POST", url.split("/")[-2], json["config"]["url"]))
+        return self._response(201, json)
+
+    def patch(self, url, json=None, headers=None):
+        self.changes.append(("PATCH", url.split("/")[-3], json["config"]["url"]))
+        return self._response(200, json)
+
+
+def _registered_hooks():
+    return [
+        {"id": i, "active": True, **copy.deepcopy(payload)}
+        for i, (_, payload) in enumerate(ci_register.CONDA_FORGE_WEBSERVICE_HOOKS)
+    ]
+
+
+@pytest.fixture
+def github_hooks(monkeypatch):
+    outdated = _registered_hooks()
+    outdated[1]["events"] = ["push"]
+    session = FakeGithubSession(
+        {
+            "a-feedstock": _registered_hooks(),
+            "b-feedstock": outdated[1:],
+            "c-feedstock": [],
+        }
+    )
+    monkeypatch.setattr(ci_register.github, "gh_token", lambda: "abc123")
+    monkeypatch.setattr(ci_register, "provider_session", lambda provider: session)
+    return session
+
+
+def test_webservice_hook_changes():
+    hook_urls = [url for url, _ in ci_register.CONDA_FORGE_WEBSERVICE_HOOKS]
+
+    missing, outdated = ci_register._webservice_hook_changes(_registered_hooks())
+    assert (missing, outdated) == ([], {})
+
+    hooks = _registered_hooks()[1:]
+    hooks[0]["active"] = False
+    hooks[1]["config"]["content_type"] = "form"
+    hooks.append({"id": 10, "config": {"url": "https://example.com/hook"}})
+    missing, outdated = ci_register._webservice_hook_changes(hooks)
+    assert [payload["config"]["url"] for payload in missing] == hook_urls[:1]
+    assert list(outdated) == [1, 2]
+
+
+def test_add_conda_forge_webservice_hooks(github_hooks):
+    ci_register.add_conda_forge_webservice_hooks("conda-forge", "b-feedstock")
+
+    # only the missing hook is created
+    hook_urls = [url for url, _ in ci_register.CONDA_FORGE_WEBSERVICE_HOOKS]
+    assert github_hooks.changes == [("POST", "b-feedstock", hook_urls[0])]
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_reconcile_conda_forge_webservice_hooks(github_hooks, dry_run):
+    repos = ["a-feedstock", "b-feedstock", "c-feedstock", "d-feedstock"]
+    hook_urls = [url for url, _ in ci_register.CONDA_FORGE_WEBSERVICE_HOOKS]
+
+    changes, errors = ci_register.reconcile_conda_forge_webservice_hooks(
+        "conda-forge", repos, max_workers=2, dry_run=dry_run
+    )
+
+    assert changes == {
+        "a-feedstock": {"created": [], "updated": []},
+        "b-feedstock": {"created": hook_urls[:1], "updated": hook_urls[1:2]},
+        "c-feedstock": {"created": hook_urls, "updated": []},
+    }
+    assert list(errors) == ["d-feedstock"]
+    assert isinstance(errors["d-feedstock"], requests.HTTPError)
+    if dry_run:
+        assert github_hooks.changes == []
+    else:
+        assert sorted(github_hooks.changes) == sorted(
+            [
+                ("POST", "b-feedstock", hook_urls[0]),
+                ("PATCH", "b-feedstock", hook_urls[1]),
+            ]
+            + [("POST", "c-feedstock", hook_url) for hook_url in hook_urls]
+        )
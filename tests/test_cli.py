@@ -3,6 +3,7 @@ import collections
 import os
 import shutil
 import subprocess
+import sys
 from pathlib import Path
 from textwrap import dedent
 
@@ -28,7 +29,10 @@ RegenerateArgs = collections.namedtuple(
         "exclusive_config_file",
         "check",
         "temporary_directory",
+        "offline",
+        "manifest",
     ),
+    defaults=(False, None),
 )
 
 
@@ -435,3 +439,45 @@ def test_render_readme_with_v1_recipe_name(testing_workdir):
         readme = readme_file.read()
         assert "recipe-iregi--split-green" not in readme
         assert "`iregi-split, iregi-static` can be installed" not in readme
+
+
+@pytest.mark.parametrize(
+    "module,preloaded",
+    [("conda_smithy.cli", None), ("conda_smithy.plugin", "conda.plugins")],
+)
+def test_cli_import_time(module, preloaded):
+    # `conda smithy --help`, `--version` and every `conda` invocation (via the
+    # plugin) import these modules, so heavy dependencies must not be imported
+    # until a subcommand actually needs them. conda has already imported
+    # conda.plugins when it loads the plugin, so only what the plugin adds
+    # on top of it counts.
+    code = f"import {module}"
+    if preloaded is not None:
+        code = f"import {preloaded}; {code}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line.split("|")
+        if name.rstrip() == f" {preloaded}":
+            # the modules imported so far were imported by the preloaded one
+            cumulative = {}
+        elif cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+
+    for heavy in (
+        "conda_build",
+        "rattler",
+        "rattler_build_conda_compat",
+        "jinja2",
+        "requests",
+        "conda_smithy.configure_feedstock",
+        "conda_smithy.lint_recipe",
+    ):
+        assert heavy not in cumulative, f"{module} imports {heavy}"
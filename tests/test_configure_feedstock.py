@@ -1,6 +1,8 @@
 import copy
+import hashlib
 import io
 import itertools
+import json
 import logging
 import os
 import re
@@ -27,7 +29,7 @@ from conda_smithy.configure_feedstock import (
     DEFAULT_PROVIDERS,
     _read_forge_config,
 )
-from conda_smithy.feedstock_io import get_repo
+from conda_smithy.feedstock_io import get_repo, record_changes, remove_file, write_file
 from conda_smithy.utils import ensure_standard_strings
 
 
@@ -665,6 +667,187 @@ def test_render_with_all_skipped_generates_readme(skipped_recipe, jinja_env):
     assert b"skip-test-meta" in content
 
 
+def test_azure_build_id_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(configure_feedstock, "get_cache_dir", lambda: tmp_path)
+    forge_config = {
+        "azure": {"user_or_org": "conda-forge", "project_name": "feedstock-builds"},
+        "github": {"repo_name": "foo-feedstock"},
+    }
+    calls = []
+
+    def from_public(config):
+        calls.append(config["github"]["repo_name"])
+        config["azure"]["build_id"] = 1234
+
+    monkeypatch.setattr(configure_feedstock, "azure_build_id_from_public", from_public)
+
+    assert configure_feedstock.get_cached_azure_build_id(forge_config) is None
+    assert configure_feedstock.resolve_azure_build_id(forge_config) == 1234
+    assert configure_feedstock.resolve_azure_build_id(forge_config) == 1234
+    assert calls == ["foo-feedstock"]
+    # the passed config is left alone
+    assert "build_id" not in forge_config["azure"]
+
+    # a different repo is a different cache entry
+    other_config = copy.deepcopy(forge_config)
+    other_config["github"]["repo_name"] = "bar-feedstock"
+    assert configure_feedstock.get_cached_azure_build_id(other_config) is None
+
+    # expired entries are looked up again
+    monkeypatch.setattr(configure_feedstock, "AZURE_BUILD_ID_LIFETIME", -1)
+    assert configure_feedstock.get_cached_azure_build_id(forge_config) is None
+    lookup = configure_feedstock.start_azure_build_id_lookup(forge_config)
+    assert lookup.result() == 1234
+    assert calls == ["foo-feedstock", "foo-feedstock"]
+
+
+def test_azure_build_id_failure_not_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(configure_feedstock, "get_cache_dir", lambda: tmp_path)
+    forge_config = {
+        "azure": {"user_or_org": "conda-forge", "project_name": "feedstock-builds"},
+        "github": {"repo_name": "foo-feedstock"},
+    }
+
+    def from_public(config):
+        raise OSError("no network")
+
+    monkeypatch.setattr(configure_feedstock, "azure_build_id_from_public", from_public)
+    assert configure_feedstock.resolve_azure_build_id(forge_config) is None
+    assert not (tmp_path / "conda-smithy" / "azure-build-ids.json").exists()
+
+
+def test_render_readme_offline(noarch_recipe, jinja_env, monkeypatch):
+    def fail(forge_config):
+        raise AssertionError("no lookup should happen when offline")
+
+    monkeypatch.setattr(configure_feedstock, "resolve_azure_build_id", fail)
+    configure_feedstock.render_readme(
+        jinja_env=jinja_env,
+        forge_config=noarch_recipe.config,
+        forge_dir=noarch_recipe.recipe,
+        offline=True,
+    )
+    assert os.path.exists(os.path.join(noarch_recipe.recipe, "README.md"))
+
+
+def test_make_rerender_manifest(tmp_path):
+    unchanged = tmp_path / "unchanged.txt"
+    unchanged.write_text("same")
+    changed = tmp_path / ".ci_support" / "linux_64_.yaml"
+    changed.parent.mkdir()
+    changed.write_text("old")
+    with record_changes() as recorded_changes:
+        with write_file(str(unchanged)) as fh:
+            fh.write("same")
+        with write_file(str(changed)) as fh:
+            fh.write("new")
+        # never existed, so it should not be listed
+        remove_file(str(tmp_path / ".scripts" / "build_steps.sh"))
+
+    migration = tmp_path / "migration.yaml"
+    migration.write_text("__migrator:\n  migration_number: 2\nmigrator_ts: 123\n")
+    render_info = [
+        {
+            "provider_name": "azure",
+            "forge_config": {
+                "configs": [{"config_name": "linux_64_", "platform": "linux-64"}]
+            },
+        },
+        {"provider_name": "circle", "forge_config": {}},
+    ]
+    manifest = configure_feedstock.make_rerender_manifest(
+        str(tmp_path),
+        recorded_changes,
+        render_info,
+        {"conda-smithy": "1.0"},
+        [str(migration)],
+        {"render_readme": 0.1},
+    )
+    assert manifest["changed"]
+    assert manifest["files"] == {
+        ".ci_support/linux_64_.yaml": {
+            "sha256": hashlib.sha256(b"new").hexdigest(),
+            "mode": oct(changed.stat().st_mode & 0o777),
+            "changed": True,
+        },
+        "unchanged.txt": {
+            "sha256": hashlib.sha256(b"same").hexdigest(),
+            "mode": oct(unchanged.stat().st_mode & 0o777),
+            "changed": False,
+        },
+    }
+    assert manifest["variants"] == {"azure": {"linux-64": ["linux_64_"]}}
+    assert manifest["migrations"] == {
+        "migration.yaml": {"migrator_ts": "123", "migration_number": "2"}
+    }
+    assert manifest["versions"] == {"conda-smithy": "1.0"}
+    assert manifest["timings"] == {"render_readme": 0.1}
+    json.dumps(manifest)
+
+
+def test_copy_feedstock_content_only_writes_changes(tmp_path):
+    forge_dir = tmp_path / "feedstock"
+    forge_dir.mkdir()
+    pygit2.init_repository(str(tmp_path))
+    config = {"skip_render": [".github"]}
+
+    with record_changes() as recorded_changes:
+        configure_feedstock.copy_feedstock_content(config, str(forge_dir))
+    written = {
+        Path(path).relative_to(forge_dir).as_posix() for path in recorded_changes
+    }
+    assert written == {
+        entry.rel_path
+        for entry in configure_feedstock.get_feedstock_content_manifest()
+        if entry.rel_path not in ("README", ".github/workflows/conda-build.yml")
+    }
+    assert ".ci_support/README" in written
+    assert os.access(forge_dir / ".scripts" / "logging_utils.sh", os.X_OK)
+    index = get_repo(str(forge_dir)).index
+    assert "feedstock/LICENSE.txt" in index
+
+    # nothing changed, nothing to write
+    with record_changes() as recorded_changes:
+        configure_feedstock.copy_feedstock_content(config, str(forge_dir))
+    assert recorded_changes == {}
+
+    # modified and untracked files are synced again
+    with open(forge_dir / ".gitignore", "a") as fh:
+        fh.write("foo\n")
+    index.remove("feedstock/LICENSE.txt")
+    index.write()
+    with record_changes() as recorded_changes:
+        configure_feedstock.copy_feedstock_content(config, str(forge_dir))
+    assert sorted(recorded_changes) == [
+        str(forge_dir / ".gitignore"),
+        str(forge_dir / "LICENSE.txt"),
+    ]
+    assert "feedstock/LICENSE.txt" in get_repo(str(forge_dir)).index
+
+
+@pytest.mark.parametrize(
+    "rel_path, skipped",
+    [
+        (".github/workflows/conda-build.yml", True),
+        (".github", True),
+        (".githubx/foo", False),
+        ("README", True),
+        (".ci_support/README", False),
+        (".scripts/logging_utils.sh", True),
+        (".scripts/build_steps.sh", False),
+    ],
+)
+def test_skip_matcher(rel_path, skipped):
+    is_skipped = configure_feedstock._compile_skip_matcher(
+        {".github/", "README", ".scripts/logging_utils.sh"}
+    )
+    ignore = {".github", "README", os.path.normpath(".scripts/logging_utils.sh")}
+    assert is_skipped(rel_path) is skipped
+    assert configure_feedstock._ignore_match(ignore, os.path.normpath(rel_path)) is (
+        skipped
+    )
+
+
 def test_render_windows_with_skipped_python(python_skipped_recipe, jinja_env):
     config = python_skipped_recipe.config
     config["provider"]["win"] = "appveyor"
@@ -790,12 +973,23 @@ def test_exec_bits_and_content(py_recipe, jinja_env, provider, store_artifacts):
         stdout=sys.stderr,
     )
 
-    configure_feedstock.main(
+    manifest_path = os.path.join(recipe_dir, "..", "rerender-manifest.json")
+    manifest = configure_feedstock.main(
         forge_file_directory=recipe_dir,
         forge_yml=forge_yml,
         no_check_uptodate=True,
         commit=True,
-    )
+        manifest_path=manifest_path,
+    )
+    with open(manifest_path) as fh:
+        assert json.load(fh) == manifest
+    assert manifest["changed"]
+    assert manifest["files"]["README.md"]["changed"]
+    for fname in ALL_EXECUTABLE_FILES:
+        if fname in manifest["files"] and manifest["files"][fname]["sha256"]:
+            assert manifest["files"][fname]["mode"] == "0o755"
+    assert provider in manifest["variants"]
+    assert "render_readme" in manifest["timings"]
 
     # sanity check for pytest failure logs: check content of recipe folder
     show_content = ["dir"] if os.name == "nt" else ["ls", "-lla"]
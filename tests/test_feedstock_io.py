@@ -174,6 +174,36 @@ class TestFeedstockIO(unittest.TestCase):
                     repo.index.read()
                     self.assertRaises(KeyError, lambda: repo.index[basename])
 
+    def test_remove_files(self):
+        for tmp_dir, repo, pathfunc in parameterize():
+            basenames = ["test.txt", "dir1/dir2/test.txt", "dir1/deleted.txt"]
+            for basename in basenames:
+                filename = os.path.join(tmp_dir, basename)
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename, "w", encoding="utf-8", newline="\n") as fh:
+                    fh.write("")
+                if repo is not None:
+                    repo.index.add(basename)
+                    repo.index.write()
+            # tracked in git, but already removed from disk
+            os.remove(os.path.join(tmp_dir, "dir1", "deleted.txt"))
+            missing = os.path.join(tmp_dir, "missing", "test.txt")
+
+            with fio.record_changes() as changes:
+                fio.remove_files(
+                    [pathfunc(os.path.join(tmp_dir, b)) for b in basenames]
+                    + [pathfunc(missing)]
+                )
+
+            for basename in basenames:
+                self.assertFalse(os.path.exists(os.path.join(tmp_dir, basename)))
+                if repo is not None:
+                    repo.index.read()
+                    self.assertNotIn(basename, repo.index)
+            self.assertFalse(os.path.exists(os.path.join(tmp_dir, "dir1")))
+            self.assertFalse(os.path.exists(os.path.dirname(missing)))
+            self.assertNotIn(os.path.abspath(missing), changes)
+
     def test_remove_dir(self):
         for tmp_dir, repo, pathfunc in parameterize():
             dirname = os.path.join(tmp_dir, "dir")
@@ -238,6 +268,33 @@ class TestFeedstockIO(unittest.TestCase):
 
                 self.assertEqual(write_text, read_text)
 
+    def test_record_changes(self):
+        for tmp_dir, repo, pathfunc in parameterize():
+            existing = os.path.join(tmp_dir, "existing.txt")
+            with open(existing, "w", encoding="utf-8", newline="\n") as fh:
+                fh.write("text")
+            existing_state = fio.file_state(existing)
+            new = os.path.join(tmp_dir, "dir1", "new.txt")
+
+            with fio.record_changes() as changes:
+                with fio.write_file(pathfunc(new)) as fh:
+                    fh.write("text")
+                fio.remove_file(pathfunc(existing))
+                # only the state before the first change is kept
+                with fio.write_file(pathfunc(new)) as fh:
+                    fh.write("more text")
+
+            self.assertEqual(
+                changes,
+                {os.path.abspath(new): None, os.path.abspath(existing): existing_state},
+            )
+            self.assertIsNone(fio.file_state(existing))
+
+            # nothing is recorded outside of the context manager
+            with fio.write_file(pathfunc(existing)) as fh:
+                fh.write("text")
+            self.assertEqual(len(changes), 2)
+
     def tearDown(self):
         os.chdir(self.old_dir)
         del self.old_dir
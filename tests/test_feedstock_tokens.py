@@ -1,14 +1,18 @@
 import json
 import os
+import subprocess
 import time
 from unittest import mock
 
 import pytest
 import scrypt
 
+from conda_smithy import feedstock_tokens
 from conda_smithy.ci_register import drone_default_endpoint
 from conda_smithy.feedstock_tokens import (
     FeedstockTokenError,
+    _push_token_files,
+    _token_repo_mirror,
     feedstock_token_exists,
     feedstock_token_local_path,
     generate_and_write_feedstock_token,
@@ -16,10 +20,81 @@ from conda_smithy.feedstock_tokens import (
     read_feedstock_token,
     register_feedstock_token,
     register_feedstock_token_with_providers,
+    register_feedstock_tokens,
 )
 from conda_smithy.utils import file_permissions
 
 
+class TokenRemote:
+    """A local stand-in for the token repo on GitHub, at ``<root>/abc123``."""
+
+    def __init__(self, root, work):
+        self.root = root
+        self.path = root / "abc123"
+        self.work = work
+
+    def url(self, repo):
+        """The token repo URL with the GitHub token placeholder ``repo``."""
+        return os.path.join(str(self.root), repo)
+
+    def _git(self, *args, **kwargs):
+        return subprocess.run(
+            ["git", *args], check=True, capture_output=True, text=True, **kwargs
+        ).stdout.strip()
+
+    def write(self, project, data):
+        self._git("pull", "-q", str(self.path), "main", cwd=self.work)
+        os.makedirs(self.work / "tokens", exist_ok=True)
+        with open(self.work / "tokens" / f"{project}.json", "w") as fp:
+            fp.write(json.dumps(data))
+        self._git("add", ".", cwd=self.work)
+        self._git("commit", "-q", "-m", f"update {project}", cwd=self.work)
+        self._git("push", "-q", str(self.path), "main", cwd=self.work)
+
+    def read(self, project):
+        try:
+            data = self._git(
+                "--git-dir", str(self.path), "show", f"main:tokens/{project}.json"
+            )
+        except subprocess.CalledProcessError:
+            return None
+        return json.loads(data)
+
+    def log(self):
+        return self._git(
+            "--git-dir", str(self.path), "log", "--format=%s", "main"
+        ).splitlines()
+
+
+@pytest.fixture
+def token_remote(tmp_path, monkeypatch):
+    for who in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{who}_NAME", "conda-forge-test")
+        monkeypatch.setenv(f"GIT_{who}_EMAIL", "test@conda-forge.org")
+    monkeypatch.setattr(feedstock_tokens, "get_cache_dir", lambda: tmp_path / "cache")
+
+    work = tmp_path / "work"
+    subprocess.run(["git", "init", "-q", "-b", "main", str(work)], check=True)
+    with open(work / "README.md", "w") as fp:
+        fp.write("feedstock tokens\n")
+    subprocess.run(["git", "add", "."], check=True, cwd=work)
+    subprocess.run(["git", "commit", "-q", "-m", "initial"], check=True, cwd=work)
+    remote = TokenRemote(tmp_path / "remote", work)
+    subprocess.run(
+        ["git", "clone", "-q", "--bare", str(work), str(remote.path)], check=True
+    )
+
+    yield remote
+
+    mirrors = tmp_path / "cache" / "conda-smithy" / "token-repos"
+    for mirror in mirrors.glob("*") if mirrors.exists() else []:
+        if mirror.is_dir():
+            # the GitHub token is never stored in the mirror
+            with open(mirror / "config") as fp:
+                assert "abc123" not in fp.read()
+            assert not (mirror / "FETCH_HEAD").exists()
+
+
 @pytest.mark.parametrize(
     "provider,ci,retval_ci",
     [
@@ -47,18 +122,12 @@ from conda_smithy.utils import file_permissions
 )
 @pytest.mark.parametrize("project", ["bar", "bar-feedstock"])
 @pytest.mark.parametrize(
-    "repo", ["GITHUB_TOKEN", "${GITHUB_TOKEN}", "GH_TOKEN", "${GH_TOKEN}"]
+    "repo", ["$GITHUB_TOKEN", "${GITHUB_TOKEN}", "$GH_TOKEN", "${GH_TOKEN}"]
 )
-@mock.patch("conda_smithy.feedstock_tokens.tempfile")
-@mock.patch("conda_smithy.feedstock_tokens.pygit2")
-@mock.patch("conda_smithy.feedstock_tokens.subprocess")
 @mock.patch("conda_smithy.github.gh_token")
 def test_feedstock_tokens_roundtrip(
     gh_mock,
-    subprocess_mock,
-    git_mock,
-    tmp_mock,
-    tmpdir,
+    token_remote,
     repo,
     project,
     provider,
@@ -68,7 +137,7 @@ def test_feedstock_tokens_roundtrip(
     retval_time,
 ):
     gh_mock.return_value = "abc123"
-    tmp_mock.TemporaryDirectory.return_value.__enter__.return_value = str(tmpdir)
+    token_repo = token_remote.url(repo)
 
     user = "foo"
     pth = feedstock_token_local_path(
@@ -76,36 +145,30 @@ def test_feedstock_tokens_roundtrip(
         project,
         provider=ci,
     )
-    token_json_pth = os.path.join(tmpdir, "tokens", f"{project}.json")
-    os.makedirs(os.path.join(tmpdir, "tokens"), exist_ok=True)
 
     try:
         generate_and_write_feedstock_token(user, project, provider=ci)
         assert os.path.exists(pth)
 
-        register_feedstock_token(user, project, repo, provider=ci)
-        assert os.path.exists(token_json_pth)
+        register_feedstock_token(user, project, token_repo, provider=ci)
 
-        with open(token_json_pth) as fp:
-            token_data = json.load(fp)
+        token_data = token_remote.read(project)
+        assert token_data is not None
         if provider is not None:
             token_data["tokens"][0]["provider"] = provider
         if expires_at is not None:
             token_data["tokens"][0]["expires_at"] = expires_at
-        with open(token_json_pth, "w") as fp:
-            fp.write(json.dumps(token_data))
+        token_remote.write(project, token_data)
 
         with open(pth) as fp:
             feedstock_token = fp.read().strip()
 
         retval = is_valid_feedstock_token(
-            user, project, feedstock_token, repo, provider=ci
+            user, project, feedstock_token, token_repo, provider=ci
         )
     finally:
         if os.path.exists(pth):
             os.remove(pth)
-        if os.path.exists(token_json_pth):
-            os.remove(token_json_pth)
 
     assert retval is (retval_ci and retval_time)
 
@@ -113,28 +176,23 @@ def test_feedstock_tokens_roundtrip(
 @pytest.mark.parametrize("ci", [None, "azure"])
 @pytest.mark.parametrize("project", ["bar", "bar-feedstock"])
 @pytest.mark.parametrize(
-    "repo", ["GITHUB_TOKEN", "${GITHUB_TOKEN}", "GH_TOKEN", "${GH_TOKEN}"]
+    "repo", ["$GITHUB_TOKEN", "${GITHUB_TOKEN}", "$GH_TOKEN", "${GH_TOKEN}"]
 )
-@mock.patch("conda_smithy.feedstock_tokens.tempfile")
-@mock.patch("conda_smithy.feedstock_tokens.pygit2")
-@mock.patch("conda_smithy.feedstock_tokens.subprocess")
 @mock.patch("conda_smithy.github.gh_token")
 def test_is_valid_feedstock_token_nofile(
     gh_mock,
-    subprocess_mock,
-    git_mock,
-    tmp_mock,
-    tmpdir,
+    token_remote,
     repo,
     project,
     ci,
 ):
     gh_mock.return_value = "abc123"
-    tmp_mock.TemporaryDirectory.return_value.__enter__.return_value = str(tmpdir)
 
     user = "conda-forge"
     feedstock_token = "akdjhfl"
-    retval = is_valid_feedstock_token(user, project, feedstock_token, repo, provider=ci)
+    retval = is_valid_feedstock_token(
+        user, project, feedstock_token, token_remote.url(repo), provider=ci
+    )
     assert not retval
 
 
@@ -154,18 +212,12 @@ def test_is_valid_feedstock_token_nofile(
 )
 @pytest.mark.parametrize("project", ["bar", "bar-feedstock"])
 @pytest.mark.parametrize(
-    "repo", ["GITHUB_TOKEN", "${GITHUB_TOKEN}", "GH_TOKEN", "${GH_TOKEN}"]
+    "repo", ["$GITHUB_TOKEN", "${GITHUB_TOKEN}", "$GH_TOKEN", "${GH_TOKEN}"]
 )
-@mock.patch("conda_smithy.feedstock_tokens.tempfile")
-@mock.patch("conda_smithy.feedstock_tokens.pygit2")
-@mock.patch("conda_smithy.feedstock_tokens.subprocess")
 @mock.patch("conda_smithy.github.gh_token")
 def test_is_valid_feedstock_token_badtoken(
     gh_mock,
-    subprocess_mock,
-    git_mock,
-    tmp_mock,
-    tmpdir,
+    token_remote,
     repo,
     project,
     expires_at,
@@ -173,25 +225,131 @@ def test_is_valid_feedstock_token_badtoken(
     ci,
 ):
     gh_mock.return_value = "abc123"
-    tmp_mock.TemporaryDirectory.return_value.__enter__.return_value = str(tmpdir)
 
     user = "conda-forge"
     feedstock_token = "akdjhfl"
 
-    token_pth = os.path.join(tmpdir, "tokens", f"{project}.json")
-    os.makedirs(os.path.dirname(token_pth), exist_ok=True)
-    with open(token_pth, "w") as fp:
-        td = {"salt": b"adf".hex(), "hashed_token": b"fgh".hex()}
-        if provider is not None:
-            td["provider"] = provider
-        if expires_at is not None:
-            td["expires_at"] = expires_at
-        json.dump({"tokens": [td]}, fp)
+    td = {"salt": b"adf".hex(), "hashed_token": b"fgh".hex()}
+    if provider is not None:
+        td["provider"] = provider
+    if expires_at is not None:
+        td["expires_at"] = expires_at
+    token_remote.write(project, {"tokens": [td]})
 
-    retval = is_valid_feedstock_token(user, project, feedstock_token, repo, provider=ci)
+    retval = is_valid_feedstock_token(
+        user, project, feedstock_token, token_remote.url(repo), provider=ci
+    )
     assert not retval
 
 
+def _write_candidate_tokens(token_remote):
+    """Register tokens for ``bar``, of which only one matches ``fgh`` now."""
+    now = time.time()
+    salt = b"\x80SA"
+    good = {
+        "salt": salt.hex(),
+        "hashed_token": scrypt.hash("fgh", salt, buflen=256).hex(),
+    }
+    bad = {"salt": b"adf".hex(), "hashed_token": b"fgh".hex()}
+    token_remote.write(
+        "bar",
+        {
+            "tokens": [
+                bad,
+                {**good, "provider": "azure"},
+                {**bad, "provider": "azure", "expires_at": now + 1e4},
+                {**good, "expires_at": now - 1e4},
+                {**bad, "provider": "travis"},
+            ]
+        },
+    )
+    return now, good, bad
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@mock.patch("conda_smithy.github.gh_token")
+def test_is_valid_feedstock_token_checks_candidates(gh_mock, token_remote, jobs):
+    gh_mock.return_value = "abc123"
+
+    _write_candidate_tokens(token_remote)
+    token_repo = token_remote.url("$GITHUB_TOKEN")
+
+    assert is_valid_feedstock_token(
+        "foo", "bar", "fgh", token_repo, provider="azure", jobs=jobs
+    )
+    assert not is_valid_feedstock_token(
+        "foo", "bar", "fgh", token_repo, provider="travis", jobs=jobs
+    )
+    assert not is_valid_feedstock_token(
+        "foo", "bar", "fgh", token_repo, provider=None, jobs=jobs
+    )
+
+
+@mock.patch("conda_smithy.github.gh_token")
+def test_is_valid_feedstock_token_stops_at_match(gh_mock, token_remote):
+    gh_mock.return_value = "abc123"
+
+    now, good, bad = _write_candidate_tokens(token_remote)
+    token_repo = token_remote.url("$GITHUB_TOKEN")
+
+    with mock.patch.object(
+        feedstock_tokens,
+        "_check_feedstock_token",
+        wraps=feedstock_tokens._check_feedstock_token,
+    ) as check_mock:
+        assert is_valid_feedstock_token(
+            "foo", "bar", "fgh", token_repo, provider="azure"
+        )
+        assert not is_valid_feedstock_token(
+            "foo", "bar", "fgh", token_repo, provider="travis"
+        )
+
+    # the newest azure token, then the matching one; expired tokens and
+    # the ones of other providers are never hashed
+    assert [c.args[1] for c in check_mock.call_args_list] == [
+        {**bad, "provider": "azure", "expires_at": now + 1e4},
+        {**good, "provider": "azure"},
+        {**bad, "provider": "travis"},
+        bad,
+    ]
+
+
+def test_any_feedstock_token_matches_throughput(record_property):
+    # the worst case: every candidate is hashed before the last one matches
+    jobs = 4
+    salt = b"\x80SA"
+    candidates = [
+        {"salt": salt.hex(), "hashed_token": b"fgh".hex()} for _ in range(jobs - 1)
+    ]
+    candidates.append(
+        {"salt": salt.hex(), "hashed_token": scrypt.hash("fgh", salt, buflen=256).hex()}
+    )
+
+    # start the workers of the pool, they are reused by later validations
+    feedstock_tokens._any_feedstock_token_matches("fgh", candidates, jobs=jobs)
+
+    for n_jobs in (1, jobs):
+        start = time.monotonic()
+        assert feedstock_tokens._any_feedstock_token_matches(
+            "fgh", candidates, jobs=n_jobs
+        )
+        duration = time.monotonic() - start
+        # scrypt derivations per second and per core used, only recorded since
+        # timings on shared CI runners are too noisy to assert on
+        record_property(
+            f"derivations_per_second_per_core_jobs_{n_jobs}",
+            round(len(candidates) / duration / n_jobs, 2),
+        )
+
+
+def test_scrypt_pool_reused():
+    pool = feedstock_tokens._get_scrypt_pool(2)
+    assert feedstock_tokens._get_scrypt_pool(2) is pool
+    # the callers may run in threads, so the workers are never forked
+    assert pool._mp_context.get_start_method() == "spawn"
+    assert feedstock_tokens._get_scrypt_pool(3) is not pool
+
+
 @pytest.mark.parametrize("ci", [None, "azure"])
 def test_generate_and_write_feedstock_token(ci):
     user = "bar"
@@ -309,16 +467,10 @@ def test_read_feedstock_token(ci):
 @pytest.mark.parametrize(
     "repo", ["$GITHUB_TOKEN", "${GITHUB_TOKEN}", "$GH_TOKEN", "${GH_TOKEN}"]
 )
-@mock.patch("conda_smithy.feedstock_tokens.tempfile")
-@mock.patch("conda_smithy.feedstock_tokens.pygit2")
-@mock.patch("conda_smithy.feedstock_tokens.subprocess")
 @mock.patch("conda_smithy.github.gh_token")
 def test_feedstock_token_exists(
     gh_mock,
-    subprocess_mock,
-    git_mock,
-    tmp_mock,
-    tmpdir,
+    token_remote,
     repo,
     project,
     file_exists,
@@ -329,26 +481,21 @@ def test_feedstock_token_exists(
     retval_time,
 ):
     gh_mock.return_value = "abc123"
-    tmp_mock.TemporaryDirectory.return_value.__enter__.return_value = str(tmpdir)
 
     user = "foo"
-    os.makedirs(os.path.join(tmpdir, "tokens"), exist_ok=True)
     if file_exists:
-        with open(os.path.join(tmpdir, "tokens", f"{project}.json"), "w") as fp:
-            data = {"tokens": [{}]}
-            if provider is not None:
-                data["tokens"][0]["provider"] = provider
-            if expires_at is not None:
-                data["tokens"][0]["expires_at"] = expires_at
-            fp.write(json.dumps(data))
+        data = {"tokens": [{}]}
+        if provider is not None:
+            data["tokens"][0]["provider"] = provider
+        if expires_at is not None:
+            data["tokens"][0]["expires_at"] = expires_at
+        token_remote.write(project, data)
 
     _retval = file_exists and retval_time and retval_ci
 
-    assert feedstock_token_exists(user, project, repo, provider=ci) is _retval
-
-    subprocess_mock.run.assert_called_once_with(
-        ["git", "clone", "-q", "--depth", "1", "abc123", str(tmpdir)],
-        check=True,
+    assert (
+        feedstock_token_exists(user, project, token_remote.url(repo), provider=ci)
+        is _retval
     )
 
 
@@ -357,31 +504,38 @@ def test_feedstock_token_exists(
 @pytest.mark.parametrize(
     "repo", ["$GITHUB_TOKEN", "${GITHUB_TOKEN}", "$GH_TOKEN", "${GH_TOKEN}"]
 )
-@mock.patch("conda_smithy.feedstock_tokens.tempfile")
-@mock.patch("conda_smithy.feedstock_tokens.pygit2")
-@mock.patch("conda_smithy.feedstock_tokens.subprocess")
 @mock.patch("conda_smithy.github.gh_token")
-def test_feedstock_token_raises(
-    gh_mock, subprocess_mock, git_mock, tmp_mock, tmpdir, repo, project, ci
-):
+def test_feedstock_token_raises(gh_mock, token_remote, tmp_path, repo, project, ci):
     gh_mock.return_value = "abc123"
-    tmp_mock.TemporaryDirectory.return_value.__enter__.return_value = str(tmpdir)
 
-    subprocess_mock.run.side_effect = ValueError("blarg")
     user = "foo"
-    os.makedirs(os.path.join(tmpdir, "tokens"), exist_ok=True)
-    with open(os.path.join(tmpdir, "tokens", f"{project}.json"), "w") as fp:
-        fp.write("{}")
+    token_remote.write(project, {})
 
+    # the token repo cannot be cloned
+    token_repo = os.path.join(str(tmp_path / "nowhere"), repo)
     with pytest.raises(FeedstockTokenError) as e:
-        feedstock_token_exists(user, project, repo, provider=ci)
+        feedstock_token_exists(user, project, token_repo, provider=ci)
 
     assert "Testing for the feedstock token for" in str(e.value)
+    assert not feedstock_tokens._token_repo_mirror_path(token_repo).exists()
 
-    subprocess_mock.run.assert_called_once_with(
-        ["git", "clone", "-q", "--depth", "1", "abc123", str(tmpdir)],
-        check=True,
-    )
+
+@mock.patch("conda_smithy.github.gh_token")
+def test_token_repo_mirror_reused(gh_mock, token_remote):
+    gh_mock.return_value = "abc123"
+    token_repo = token_remote.url("$GITHUB_TOKEN")
+
+    with mock.patch.object(
+        feedstock_tokens.subprocess, "run", wraps=subprocess.run
+    ) as run_mock:
+        assert not feedstock_token_exists("foo", "bar", token_repo)
+        token_remote.write("bar", {"tokens": [{}]})
+        assert feedstock_token_exists("foo", "bar", token_repo)
+
+    commands = [call.args[0][1] for call in run_mock.call_args_list]
+    # the second call fetches the new commit instead of cloning again
+    assert commands.count("clone") == 1
+    assert commands.count("fetch") == 1
 
 
 @pytest.mark.parametrize("ci", [None, "azure"])
@@ -390,68 +544,41 @@ def test_feedstock_token_raises(
 )
 @mock.patch("conda_smithy.feedstock_tokens.secrets")
 @mock.patch("conda_smithy.feedstock_tokens.os.urandom")
-@mock.patch("conda_smithy.feedstock_tokens.tempfile")
-@mock.patch("conda_smithy.feedstock_tokens.pygit2")
-@mock.patch("conda_smithy.feedstock_tokens.subprocess")
 @mock.patch("conda_smithy.github.gh_token")
 def test_register_feedstock_token_works(
     gh_mock,
-    subprocess_mock,
-    git_mock,
-    tmp_mock,
     osuran_mock,
     secrets_mock,
-    tmpdir,
+    token_remote,
     repo,
     ci,
 ):
     gh_mock.return_value = "abc123"
-    tmp_mock.TemporaryDirectory.return_value.__enter__.return_value = str(tmpdir)
     secrets_mock.token_hex.return_value = "fgh"
     osuran_mock.return_value = b"\x80SA"
 
     user = "foo"
     project = "bar"
-    os.makedirs(os.path.join(tmpdir, "tokens"), exist_ok=True)
     pth = feedstock_token_local_path(
         user,
         project,
         provider=ci,
     )
-    token_json_pth = os.path.join(tmpdir, "tokens", f"{project}.json")
 
     try:
         generate_and_write_feedstock_token(user, project, provider=ci)
 
-        register_feedstock_token(user, project, repo, provider=ci)
+        register_feedstock_token(user, project, token_remote.url(repo), provider=ci)
 
     finally:
         if os.path.exists(pth):
             os.remove(pth)
 
-    subprocess_mock.run.assert_any_call(
-        ["git", "clone", "-q", "--depth", "1", "abc123", str(tmpdir)],
-        check=True,
-    )
-
-    repo = git_mock.Repository.return_value
-    repo.index.add.assert_called_once_with(f"tokens/{project}.json")
-    subprocess_mock.run.assert_any_call(
-        [
-            "git",
-            "commit",
-            "-q",
-            "-m",
-            "[ci skip] [skip ci] [cf admin skip] ***NO_CI*** "
-            f"added token for {user}/{project} on provider{'' if ci is None else ' ' + ci}",
-        ],
-        check=True,
-        cwd=tmpdir,
-    )
-    subprocess_mock.run.assert_any_call(
-        ["git", "pull", "-q", "--rebase"], check=True, cwd=tmpdir
-    )
-    subprocess_mock.run.assert_any_call(["git", "push", "-q"], check=True, cwd=tmpdir)
+    assert token_remote.log() == [
+        "[ci skip] [skip ci] [cf admin skip] ***NO_CI*** "
+        f"added token for {user}/{project} on provider{'' if ci is None else ' ' + ci}",
+        "initial",
+    ]
 
     salted_token = scrypt.hash("fgh", b"\x80SA", buflen=256)
     data = {
@@ -461,8 +588,7 @@ def test_register_feedstock_token_works(
     if ci is not None:
         data["provider"] = ci
 
-    with open(token_json_pth) as fp:
-        assert json.load(fp) == {"tokens": [data]}
+    assert token_remote.read(project) == {"tokens": [data]}
 
 
 @pytest.mark.parametrize("ci", [None, "azure"])
@@ -471,49 +597,38 @@ def test_register_feedstock_token_works(
 )
 @mock.patch("conda_smithy.feedstock_tokens.secrets")
 @mock.patch("conda_smithy.feedstock_tokens.os.urandom")
-@mock.patch("conda_smithy.feedstock_tokens.tempfile")
-@mock.patch("conda_smithy.feedstock_tokens.pygit2")
-@mock.patch("conda_smithy.feedstock_tokens.subprocess")
 @mock.patch("conda_smithy.github.gh_token")
 def test_register_feedstock_token_notoken(
     gh_mock,
-    subprocess_mock,
-    git_mock,
-    tmp_mock,
     osuran_mock,
     secrets_mock,
-    tmpdir,
+    token_remote,
+    tmp_path,
     repo,
     ci,
 ):
     gh_mock.return_value = "abc123"
-    tmp_mock.TemporaryDirectory.return_value.__enter__.return_value = str(tmpdir)
     secrets_mock.token_hex.return_value = "fgh"
     osuran_mock.return_value = b"\x80SA"
 
     user = "foo"
     project = "bar"
-    os.makedirs(os.path.join(tmpdir, "tokens"), exist_ok=True)
     pth = feedstock_token_local_path(
         user,
         project,
         provider=ci,
     )
-    token_json_pth = os.path.join(tmpdir, "tokens", "bar.json")
 
     try:
         with pytest.raises(FeedstockTokenError) as e:
-            register_feedstock_token(user, project, repo, provider=ci)
+            register_feedstock_token(user, project, token_remote.url(repo), provider=ci)
     finally:
         if os.path.exists(pth):
             os.remove(pth)
 
-    subprocess_mock.run.assert_not_called()
-    git_mock.Repository.assert_not_called()
-    repo = git_mock.Repository.return_value
-    repo.index.add.assert_not_called()
-
-    assert not os.path.exists(token_json_pth)
+    # the token repo is not even fetched
+    assert not (tmp_path / "cache").exists()
+    assert token_remote.read(project) is None
 
     assert "No token found in" in str(e.value)
 
@@ -525,58 +640,47 @@ def test_register_feedstock_token_notoken(
 )
 @mock.patch("conda_smithy.feedstock_tokens.secrets")
 @mock.patch("conda_smithy.feedstock_tokens.os.urandom")
-@mock.patch("conda_smithy.feedstock_tokens.tempfile")
-@mock.patch("conda_smithy.feedstock_tokens.pygit2")
-@mock.patch("conda_smithy.feedstock_tokens.subprocess")
 @mock.patch("conda_smithy.github.gh_token")
 def test_register_feedstock_token_append_expire(
     gh_mock,
-    subprocess_mock,
-    git_mock,
-    tmp_mock,
     osuran_mock,
     secrets_mock,
-    tmpdir,
+    token_remote,
     repo,
     ci,
     existing_tokens_time_to_expiration,
 ):
     gh_mock.return_value = "abc123"
-    tmp_mock.TemporaryDirectory.return_value.__enter__.return_value = str(tmpdir)
     secrets_mock.token_hex.return_value = "fgh"
     osuran_mock.return_value = b"\x80SA"
 
     user = "foo"
     project = "bar"
-    os.makedirs(os.path.join(tmpdir, "tokens"), exist_ok=True)
     pth = feedstock_token_local_path(
         user,
         project,
         provider=ci,
     )
-    token_json_pth = os.path.join(tmpdir, "tokens", "bar.json")
     now = time.time()
-    with open(token_json_pth, "w") as fp:
-        fp.write(
-            json.dumps(
-                {
-                    "tokens": [
-                        {},
-                        {"provider": "azure"},
-                        {"provider": "blarg"},
-                        {"expires_at": now - 1e4},
-                        {"expires_at": now + 1e4},
-                    ]
-                }
-            )
-        )
+    token_remote.write(
+        project,
+        {
+            "tokens": [
+                {},
+                {"provider": "azure"},
+                {"provider": "blarg"},
+                {"expires_at": now - 1e4},
+                {"expires_at": now + 1e4},
+            ]
+        },
+    )
 
     try:
         generate_and_write_feedstock_token(user, project, provider=ci)
         register_feedstock_token(
             user,
             project,
-            repo,
+            token_remote.url(repo),
             provider=ci,
             existing_tokens_time_to_expiration=existing_tokens_time_to_expiration,
         )
@@ -584,29 +688,10 @@ def test_register_feedstock_token_append_expire(
         if os.path.exists(pth):
             os.remove(pth)
 
-    subprocess_mock.run.assert_any_call(
-        ["git", "clone", "-q", "--depth", "1", "abc123", str(tmpdir)],
-        check=True,
+    assert token_remote.log()[0] == (
+        "[ci skip] [skip ci] [cf admin skip] ***NO_CI*** "
+        f"added token for {user}/{project} on provider{'' if ci is None else ' ' + ci}"
     )
-
-    repo = git_mock.Repository.return_value
-    repo.index.add.assert_called_once_with(f"tokens/{project}.json")
-    subprocess_mock.run.assert_any_call(
-        [
-            "git",
-            "commit",
-            "-q",
-            "-m",
-            "[ci skip] [skip ci] [cf admin skip] ***NO_CI*** "
-            f"added token for {user}/{project} on provider{'' if ci is None else ' ' + ci}",
-        ],
-        check=True,
-        cwd=tmpdir,
-    )
-    subprocess_mock.run.assert_any_call(
-        ["git", "pull", "-q", "--rebase"], check=True, cwd=tmpdir
-    )
-    subprocess_mock.run.assert_any_call(["git", "push", "-q"], check=True, cwd=tmpdir)
     salted_token = scrypt.hash("fgh", b"\x80SA", buflen=256)
     data = {
         "salt": b"\x80SA".hex(),
@@ -615,8 +700,7 @@ def test_register_feedstock_token_append_expire(
     if ci is not None:
         data["provider"] = ci
 
-    with open(token_json_pth) as fp:
-        final_tokens = json.load(fp)
+    final_tokens = token_remote.read(project)
 
     if existing_tokens_time_to_expiration is None:
         assert final_tokens == {
@@ -654,6 +738,102 @@ def test_register_feedstock_token_append_expire(
             }
 
 
+@mock.patch("conda_smithy.github.gh_token")
+def test_push_token_files_retries_on_top_of_remote(gh_mock, token_remote):
+    gh_mock.return_value = "abc123"
+
+    def update(repo):
+        return {"bar": {"tokens": [{"salt": "ab", "hashed_token": "cd"}]}}
+
+    with _token_repo_mirror(token_remote.url("$GITHUB_TOKEN")) as (repo, url):
+        # someone else pushes after the mirror was updated
+        token_remote.write("baz", {"tokens": []})
+        _push_token_files(repo, url, update, "add bar")
+
+    assert token_remote.log() == ["add bar", "update baz", "initial"]
+    assert token_remote.read("baz") == {"tokens": []}
+    assert token_remote.read("bar") == update(None)["bar"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("providers", [[None], ["azure", "travis"]])
+@mock.patch("conda_smithy.github.gh_token")
+def test_register_feedstock_tokens(gh_mock, token_remote, providers, jobs):
+    gh_mock.return_value = "abc123"
+    token_repo = token_remote.url("$GITHUB_TOKEN")
+
+    user = "foo"
+    projects = ["bar", "baz-feedstock", "qux"]
+    now = time.time()
+    old = {"salt": b"adf".hex(), "hashed_token": b"fgh".hex()}
+    token_remote.write("bar", {"tokens": [old, {**old, "provider": "travis"}]})
+    pths = [
+        feedstock_token_local_path(user, project, provider=provider)
+        for project in projects
+        for provider in providers
+    ]
+
+    try:
+        for project in projects:
+            for provider in providers:
+                generate_and_write_feedstock_token(user, project, provider=provider)
+
+        register_feedstock_tokens(
+            user,
+            projects,
+            token_repo,
+            providers=providers,
+            existing_tokens_time_to_expiration=10,
+            jobs=jobs,
+        )
+
+        for project in projects:
+            for provider in providers:
+                feedstock_token, _ = read_feedstock_token(
+                    user, project, provider=provider
+                )
+                assert is_valid_feedstock_token(
+                    user, project, feedstock_token, token_repo, provider=provider
+                )
+    finally:
+        for pth in pths:
+            if os.path.exists(pth):
+                os.remove(pth)
+
+    # a single commit for all of the tokens
+    assert token_remote.log()[1:] == ["update bar", "initial"]
+    for project in projects:
+        tokens = token_remote.read(project)["tokens"]
+        new_tokens = tokens[-len(providers) :]
+        assert [td.get("provider") for td in new_tokens] == providers
+        assert all("expires_at" not in td for td in new_tokens)
+    # the existing tokens of bar expire
+    old_tokens = token_remote.read("bar")["tokens"][: -len(providers)]
+    assert old_tokens[0]["expires_at"] >= now + 10
+    assert ("expires_at" in old_tokens[1]) is ("travis" in providers)
+
+
+@mock.patch("conda_smithy.github.gh_token")
+def test_register_feedstock_tokens_notoken(gh_mock, token_remote):
+    gh_mock.return_value = "abc123"
+
+    user = "foo"
+    pth = feedstock_token_local_path(user, "bar")
+    try:
+        generate_and_write_feedstock_token(user, "bar")
+        with pytest.raises(FeedstockTokenError) as e:
+            register_feedstock_tokens(
+                user, ["bar", "baz"], token_remote.url("$GITHUB_TOKEN")
+            )
+    finally:
+        if os.path.exists(pth):
+            os.remove(pth)
+
+    assert "No token found in" in str(e.value)
+    # none of the tokens are registered
+    assert token_remote.log() == ["initial"]
+
+
 @pytest.mark.parametrize("unique_token_per_provider", [False, True])
 @pytest.mark.parametrize("drone", [True, False])
 @pytest.mark.parametrize("circle", [True, False])
@@ -892,3 +1072,40 @@ def test_register_feedstock_token_with_providers_error(
             pth = feedstock_token_local_path(user, project, provider=_provider)
             if os.path.exists(pth):
                 os.remove(pth)
+
+
+@mock.patch("conda_smithy.feedstock_tokens.add_feedstock_token_to_drone")
+@mock.patch("conda_smithy.feedstock_tokens.add_feedstock_token_to_circle")
+@mock.patch("conda_smithy.feedstock_tokens.add_feedstock_token_to_travis")
+@mock.patch("conda_smithy.feedstock_tokens.add_feedstock_token_to_azure")
+@mock.patch("conda_smithy.feedstock_tokens.add_feedstock_token_to_github_actions")
+def test_register_feedstock_token_with_providers_errors(
+    github_actions_mock,
+    azure_mock,
+    travis_mock,
+    circle_mock,
+    drone_mock,
+):
+    user = "foo"
+    project = "bar-feedstock"
+    azure_mock.side_effect = ValueError("blah")
+    travis_mock.side_effect = ValueError("blah")
+
+    pth = feedstock_token_local_path(user, project)
+    try:
+        generate_and_write_feedstock_token(user, project)
+
+        with pytest.raises(FeedstockTokenError) as e:
+            register_feedstock_token_with_providers(
+                user, project, drone_endpoints=[drone_default_endpoint]
+            )
+    finally:
+        if os.path.exists(pth):
+            os.remove(pth)
+
+    # all of the failures are reported, and the other providers still run
+    assert "on travis" in str(e.value)
+    assert "on azure" in str(e.value)
+    drone_mock.assert_called_once()
+    circle_mock.assert_called_once()
+    github_actions_mock.assert_called_once()
@@ -0,0 +1,351 @@
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+from conda_smithy import feedstocks
+from conda_smithy.feedstocks import (
+    SYNC_STATE_FILE,
+    clone_feedstocks,
+    fetch_feedstocks,
+    read_sync_state,
+)
+
+
+def _git(*args, cwd=None):
+    return subprocess.run(
+        ["git", *args], check=True, capture_output=True, text=True, cwd=cwd
+    ).stdout.strip()
+
+
+class Upstream:
+    """Bare feedstock repos at ``<root>/<name>``, standing in for GitHub."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def repo(self, name):
+        return argparse.Namespace(
+            name=name,
+            clone_url=f"file://{self.root / name}",
+            pushed_at="2024-01-01T00:00:00Z",
+        )
+
+    def commit(self, name, message):
+        work = self.root / "work" / name
+        if not work.exists():
+            _git("init", "-q", "-b", "main", str(work))
+        (work / "README.md").write_text(message)
+        _git("add", ".", cwd=work)
+        _git("commit", "-q", "-m", message, cwd=work)
+        if not (self.root / name).exists():
+            _git("init", "-q", "--bare", "-b", "main", str(self.root / name))
+        _git("push", "-q", str(self.root / name), "main", cwd=work)
+        return _git("rev-parse", "HEAD", cwd=work)
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    for who in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{who}_NAME", "conda-forge-test")
+        monkeypatch.setenv(f"GIT_{who}_EMAIL", "test@conda-forge.org")
+    upstream = Upstream(tmp_path / "upstream")
+    for name in ("a-feedstock", "b-feedstock"):
+        upstream.commit(name, "initial")
+    return upstream
+
+
+def test_fetch_feedstocks_skips_unchanged(upstream, tmp_path, capsys):
+    clones = tmp_path / "clones"
+    clones.mkdir()
+    repos = [upstream.repo("a-feedstock"), upstream.repo("b-feedstock")]
+
+    results = clone_feedstocks(repos, clones, jobs=2)
+    assert {name: r.action for name, r in results.items()} == {
+        "a-feedstock": "cloned",
+        "b-feedstock": "cloned",
+    }
+    state = read_sync_state(clones)
+    assert set(state) == {"a-feedstock", "b-feedstock"}
+    assert list(state["a-feedstock"]["remotes"]["upstream"]) == ["refs/heads/main"]
+    assert state["a-feedstock"]["pushed_at"] == "2024-01-01T00:00:00Z"
+
+    # nothing moved, so nothing is fetched
+    with mock.patch.object(feedstocks, "_git", wraps=feedstocks._git) as git_mock:
+        results = fetch_feedstocks(clones, jobs=2)
+    assert {r.action for r in results.values()} == {"unchanged"}
+    assert not [c for c in git_mock.call_args_list if c.args[0] == "fetch"]
+
+    head = upstream.commit("a-feedstock", "update")
+    capsys.readouterr()
+    with mock.patch.object(feedstocks, "_git", wraps=feedstocks._git) as git_mock:
+        results = fetch_feedstocks(clones, jobs=2)
+    assert results["a-feedstock"].action == "fetched"
+    assert results["b-feedstock"].action == "unchanged"
+    assert len([c for c in git_mock.call_args_list if c.args[0] == "fetch"]) == 1
+    # only the feedstocks that changed are listed
+    (line,) = capsys.readouterr().out.splitlines()
+    assert line.endswith("/2] a-feedstock: fetched")
+    assert _git("rev-parse", "upstream/main", cwd=clones / "a-feedstock") == head
+    assert read_sync_state(clones)["a-feedstock"]["remotes"]["upstream"] == {
+        "refs/heads/main": head
+    }
+
+    # existing clones are not cloned again
+    results = clone_feedstocks(repos, clones)
+    assert {r.action for r in results.values()} == {"unchanged"}
+
+
+def test_sync_feedstocks_collects_errors(upstream, tmp_path):
+    clones = tmp_path / "clones"
+    clones.mkdir()
+    repos = [upstream.repo("a-feedstock"), upstream.repo("missing-feedstock")]
+
+    results = clone_feedstocks(repos, clones)
+    assert results["a-feedstock"].action == "cloned"
+    assert results["missing-feedstock"].action == "failed"
+    assert "Failed to clone" in results["missing-feedstock"].errors[0]
+    assert not (clones / "missing-feedstock").exists()
+
+    _git(
+        "remote", "add", "broken", str(tmp_path / "nowhere"), cwd=clones / "a-feedstock"
+    )
+    results = fetch_feedstocks(clones)
+    assert results["a-feedstock"].action == "failed"
+    assert results["a-feedstock"].errors == [
+        f"Failed to fetch broken from {tmp_path / 'nowhere'}."
+    ]
+    # the refs of the remotes that worked are kept
+    with open(clones / SYNC_STATE_FILE) as fh:
+        assert list(json.load(fh)["a-feedstock"]["remotes"]) == ["upstream"]
+
+
+class AuthChallengeHandler(BaseHTTPRequestHandler):
+    """Asks for credentials, like GitHub does for deleted or renamed repos."""
+
+    def do_GET(self):  # noqa: N802
+        self.send_response(401)
+        self.send_header("WWW-Authenticate", 'Basic realm="GitHub"')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sync_feedstocks_never_prompts(upstream, tmp_path, monkeypatch):
+    for var in ("GIT_ASKPASS", "SSH_ASKPASS"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AuthChallengeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/o/gone-feedstock"
+    clones = tmp_path / "clones"
+    clones.mkdir()
+    try:
+        repo = argparse.Namespace(name="gone-feedstock", clone_url=url, pushed_at=None)
+        results = clone_feedstocks([repo], clones)
+        assert results["gone-feedstock"].action == "failed"
+
+        clone_feedstocks([upstream.repo("a-feedstock")], clones)
+        _git("remote", "set-url", "upstream", url, cwd=clones / "a-feedstock")
+        results = fetch_feedstocks(clones)
+        assert results["a-feedstock"].action == "failed"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_clone_feedstocks_shallow(upstream, tmp_path):
+    upstream.commit("a-feedstock", "update")
+    work = upstream.root / "work" / "a-feedstock"
+    _git("push", "-q", str(upstream.root / "a-feedstock"), "main:v1.x", cwd=work)
+    clones = tmp_path / "clones"
+    clones.mkdir()
+
+    results = clone_feedstocks([upstream.repo("a-feedstock")], clones, depth=1)
+
+    assert results["a-feedstock"].action == "cloned"
+    clone = clones / "a-feedstock"
+    assert _git("rev-parse", "--is-shallow-repository", cwd=clone) == "true"
+    assert _git("rev-list", "--count", "upstream/main", cwd=clone) == "1"
+    # all the branches are cloned
+    assert _git("rev-list", "--count", "upstream/v1.x", cwd=clone) == "1"
+
+
+def test_fetch_feedstocks_skips_unpushed(upstream, tmp_path, monkeypatch):
+    clones = tmp_path / "clones"
+    clones.mkdir()
+    repos = [upstream.repo("a-feedstock"), upstream.repo("b-feedstock")]
+    clone_feedstocks(repos, clones)
+    index = {
+        repo.name: {"clone_url": repo.clone_url, "pushed_at": repo.pushed_at}
+        for repo in repos
+    }
+    monkeypatch.setattr(feedstocks, "repo_index", lambda organization: index)
+
+    upstream.commit("a-feedstock", "update")
+    index["a-feedstock"]["pushed_at"] = "2024-01-02T00:00:00Z"
+    with mock.patch.object(feedstocks, "_git", wraps=feedstocks._git) as git_mock:
+        results = fetch_feedstocks(clones, organization="conda-forge")
+
+    assert results["a-feedstock"].action == "fetched"
+    assert results["b-feedstock"].action == "unchanged"
+    # b-feedstock is not even listed
+    assert len(git_mock.call_args_list) == 2
+    state = read_sync_state(clones)
+    assert state["a-feedstock"]["pushed_at"] == "2024-01-02T00:00:00Z"
+
+
+class FakeRequester:
+    """Serves the repos of an organization by descending ``pushedAt``."""
+
+    def __init__(self, repos, page_size=2):
+        self.repos = repos
+        self.page_size = page_size
+        self.queries = 0
+
+    def graphql_query(self, query, variables):
+        self.queries += 1
+        repos = sorted(self.repos.items(), key=lambda item: item[1], reverse=True)
+        start = int(variables["cursor"] or 0)
+        end = start + self.page_size
+        page = {
+            "pageInfo": {"hasNextPage": end < len(repos), "endCursor": str(end)},
+            "nodes": [
+                {"name": name, "url": f"https://github.com/o/{name}", "pushedAt": at}
+                for name, at in repos[start:end]
+            ],
+        }
+        return {}, {"data": {"organization": {"repositories": page}}}
+
+
+@pytest.fixture
+def requester(tmp_path, monkeypatch):
+    requester = FakeRequester(
+        {
+            "a-feedstock": "2024-01-05T00:00:00Z",
+            "b-feedstock": "2024-01-04T00:00:00Z",
+            "c-feedstock": "2024-01-03T00:00:00Z",
+            "staged-recipes": "2024-01-02T00:00:00Z",
+            "d-feedstock": "2024-01-01T00:00:00Z",
+        }
+    )
+    monkeypatch.setattr(feedstocks, "get_cache_dir", lambda: tmp_path / "cache")
+    monkeypatch.setattr(feedstocks.smithy_github, "gh_token", lambda: "abc123")
+    monkeypatch.setattr(
+        feedstocks, "Github", lambda token: argparse.Namespace(requester=requester)
+    )
+    return requester
+
+
+def test_repo_index_incremental(requester):
+    repos = feedstocks.feedstock_repos("o")
+    assert [repo.name for repo in repos] == [
+        "a-feedstock",
+        "b-feedstock",
+        "c-feedstock",
+        "d-feedstock",
+    ]
+    assert repos[0].package_name == "a"
+    assert repos[0].clone_url == "https://github.com/o/a-feedstock.git"
+    assert repos[3].pushed_at == "2024-01-01T00:00:00Z"
+    assert requester.queries == 3
+
+    # only the first page is queried to find the repos pushed since
+    requester.queries = 0
+    requester.repos["c-feedstock"] = "2024-01-06T00:00:00Z"
+    requester.repos["e-feedstock"] = "2024-01-07T00:00:00Z"
+    index = feedstocks.repo_index("o")
+    assert requester.queries == 2
+    assert index["c-feedstock"]["pushed_at"] == "2024-01-06T00:00:00Z"
+    assert set(index) == {
+        "a-feedstock",
+        "b-feedstock",
+        "c-feedstock",
+        "d-feedstock",
+        "e-feedstock",
+    }
+
+    # a refresh drops the deleted repos
+    requester.queries = 0
+    del requester.repos["d-feedstock"]
+    assert "d-feedstock" not in feedstocks.repo_index("o", refresh=True)
+    assert requester.queries == 3
+
+
+SCRIPT = """
+import os, sys, time
+name = os.environ["FEEDSTOCK_NAME"]
+print("stdout of", name, sys.argv[1])
+print("stderr of", name, file=sys.stderr)
+if name == "b":
+    sys.exit(3)
+if name == "slow":
+    time.sleep(30)
+"""
+
+
+@pytest.fixture
+def cloned(tmp_path):
+    clones = tmp_path / "clones"
+    for name in ("a", "b", "c", "slow"):
+        (clones / f"{name}-feedstock").mkdir(parents=True)
+    return clones
+
+
+def test_apply_cloned_captures_output(cloned, tmp_path):
+    cmd = [sys.executable, "-c", SCRIPT, "{FEEDSTOCK_BASENAME}"]
+    results = feedstocks.apply_cloned(
+        cloned,
+        cmd,
+        jobs=3,
+        timeout=5,
+        keep_going=True,
+        output_dir=tmp_path / "output",
+        jsonl_path=tmp_path / "results.jsonl",
+        regexp="^[a-c]$",
+    )
+
+    assert {name: r.returncode for name, r in results.items()} == {
+        "a-feedstock": 0,
+        "b-feedstock": 3,
+        "c-feedstock": 0,
+    }
+    assert results["a-feedstock"].stdout == "stdout of a a-feedstock\n"
+    assert (tmp_path / "output" / "b-feedstock.stderr").read_text() == "stderr of b\n"
+    with open(tmp_path / "results.jsonl") as fh:
+        lines = [json.loads(line) for line in fh]
+    assert sorted(line["name"] for line in lines) == list(results)
+    for line in lines:
+        assert line["cmd"][-1] == line["name"]
+        assert line["stdout"] == results[line["name"]].stdout
+
+
+def test_apply_cloned_fails_fast(cloned):
+    cmd = [sys.executable, "-c", SCRIPT, "x"]
+    results = feedstocks.apply_cloned(cloned, cmd, regexp="^[a-c]$")
+
+    # the feedstocks run in order and the output is not captured
+    assert list(results) == ["a-feedstock", "b-feedstock"]
+    assert results["b-feedstock"].returncode == 3
+    assert results["b-feedstock"].stdout is None
+
+
+def test_apply_cloned_timeout(cloned):
+    cmd = [sys.executable, "-c", SCRIPT, "x"]
+    start = time.monotonic()
+    results = feedstocks.apply_cloned(
+        cloned, cmd, jobs=2, timeout=1, keep_going=True, regexp="^(a|slow)$"
+    )
+
+    assert time.monotonic() - start < 10
+    assert results["a-feedstock"].ok
+    assert results["slow-feedstock"].returncode is None
+    assert not results["slow-feedstock"].ok
@@ -1,12 +1,15 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import json
 import os
 import platform
 import shutil
 import subprocess
 import tempfile
 import textwrap
+import threading
+import time
 import unittest
 from collections import OrderedDict
 from collections.abc import Iterator
@@ -18,18 +21,31 @@ from unittest import mock
 import pytest
 
 import conda_smithy.lint_recipe as linter
-from conda_smithy.linter import hints, update_licenses_list
+from conda_smithy.linter import hints, recipe_parsers, update_licenses_list
+from conda_smithy.linter import utils as linter_utils
 from conda_smithy.linter.conda_recipe_v1_linter import lint_recipe_tests
 from conda_smithy.linter.utils import (
     CONDA_BUILD_TOOL,
     RATTLER_BUILD_TOOL,
     VALID_PYTHON_BUILD_BACKENDS,
+    RecipeSource,
+    jinja_lines,
+    selector_lines,
 )
 from conda_smithy.utils import get_yaml, render_meta_yaml
 
 _thisdir = os.path.abspath(os.path.dirname(__file__))
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    # the maintainer, HTTP and shellcheck caches must not leak between tests or
+    # into the user's cache, or the network checks would be skipped on reruns
+    cache_dir = tmp_path / "cache"
+    for module in (linter, hints, linter_utils):
+        monkeypatch.setattr(module, "get_cache_dir", lambda: cache_dir)
+
+
 @contextmanager
 def get_recipe_in_dir(recipe_name: str) -> Iterator[Path]:
     base_dir = Path(__file__).parent
@@ -2358,6 +2374,59 @@ class TestCliRecipeLint(unittest.TestCase):
             out, _ = child.communicate()
             self.assertEqual(child.returncode, 0, out)
 
+    def test_cli_json_jobs(self):
+        with tmp_directory() as good_dir, tmp_directory() as bad_dir:
+            with open(os.path.join(good_dir, "meta.yaml"), "w") as fh:
+                fh.write(textwrap.dedent("""
+                    package:
+                        name: 'test_package'
+                        version: 1.0.0
+                    build:
+                        number: 0
+                    test:
+                        imports:
+                            - foo
+                    about:
+                        home: something
+                        license: MIT
+                        license_file: LICENSE
+                        summary: a test recipe
+                    extra:
+                        recipe-maintainers:
+                            - a
+                            - b
+                    """))
+            with open(os.path.join(bad_dir, "meta.yaml"), "w") as fh:
+                fh.write(textwrap.dedent("""
+                    package:
+                        name: 'test_package'
+                    requirements: []
+                    """))
+            child = subprocess.Popen(
+                [
+                    "conda-smithy",
+                    "recipe-lint",
+                    "--jobs=2",
+                    "--format=json",
+                    good_dir,
+                    bad_dir,
+                ],
+                stdout=subprocess.PIPE,
+            )
+            out, _ = child.communicate()
+            self.assertEqual(child.returncode, 1, out)
+            results = json.loads(out)
+            self.assertEqual([r["recipe"] for r in results], [good_dir, bad_dir])
+            self.assertEqual(results[0]["lints"], [])
+            self.assertIn(
+                {
+                    "identifier": "R-008",
+                    "name": "BuildNumberMissing",
+                    "message": "The recipe must have a `build/number` section.",
+                },
+                results[1]["lints"],
+            )
+
     def test_unicode(self):
         """
         Tests that unicode does not confuse the linter.
@@ -4000,6 +4069,55 @@ def test_lint_recipe_parses_ok():
         ), hints
 
 
+def test_recipe_parsers_time_out(monkeypatch):
+    # time.sleep(recipe_text) stands in for a parser stuck on a recipe
+    monkeypatch.setitem(recipe_parsers.RECIPE_PARSERS, "slow", ("time", time.sleep))
+    start = time.monotonic()
+    results = recipe_parsers.run_recipe_parsers(30, ["slow"], timeout=1)
+    assert results == {"slow": (False, "timed out after 1 seconds")}
+    assert time.monotonic() - start < 10
+
+
+def test_recipe_parsers_cache_only_finished(monkeypatch):
+    monkeypatch.setattr(recipe_parsers, "_result_cache", {})
+    monkeypatch.setitem(recipe_parsers.RECIPE_PARSERS, "slow", ("time", time.sleep))
+
+    # a timeout says nothing about the recipe, so it is not cached
+    results = recipe_parsers.run_recipe_parsers(2, ["slow"], timeout=0.5)
+    assert results == {"slow": (False, "timed out after 0.5 seconds")}
+    results = recipe_parsers.run_recipe_parsers(2, ["slow"], timeout=30)
+    assert results == {"slow": (True, None)}
+
+    def no_pool():
+        raise AssertionError("the parser should not run again")
+
+    monkeypatch.setattr(recipe_parsers, "_acquire_pool", no_pool)
+    results = recipe_parsers.run_recipe_parsers(2, ["slow"], timeout=30)
+    assert results == {"slow": (True, None)}
+
+
+def test_recipe_parsers_timeout_spares_other_calls(monkeypatch):
+    monkeypatch.setattr(recipe_parsers, "_result_cache", {})
+    monkeypatch.setitem(recipe_parsers.RECIPE_PARSERS, "slow", ("time", time.sleep))
+    # start the shared pool, so that both calls below use it
+    recipe_parsers.run_recipe_parsers(0, ["slow"], timeout=30)
+
+    results = {}
+
+    def run(recipe_text, timeout):
+        results[recipe_text] = recipe_parsers.run_recipe_parsers(
+            recipe_text, ["slow"], timeout=timeout
+        )
+
+    finishes = threading.Thread(target=run, args=(3, 30))
+    finishes.start()
+    run(30, 1)
+    finishes.join()
+    assert results[30] == {"slow": (False, "timed out after 1 seconds")}
+    # the workers of the pool were only killed once the other call was done
+    assert results[3] == {"slow": (True, None)}
+
+
 def test_lint_recipe_parses_forblock():
     with tempfile.TemporaryDirectory() as tmpdir:
         with open(os.path.join(tmpdir, "meta.yaml"), "w") as f:
@@ -5310,6 +5428,250 @@ def test_lint_recipe_v1_comment_selectors():
         ]
 
 
+def test_recipe_source_indexes():
+    text = textwrap.dedent("""
+        {% set version = "1.0" %}
+        {%set name="foo"%}
+        package:
+          name: {{name}}
+          version: {{ version }}
+        requirements:
+          build:
+            - gcc  # [linux]
+            - clang # [osx]
+            - bar [win]
+        """)
+    source = RecipeSource.from_text(text, path="meta.yaml")
+
+    assert source.lines == tuple(text.splitlines(keepends=True))
+    assert source.selector_lines == tuple(selector_lines(source.lines))
+    assert source.comment_selector_lines == tuple(
+        selector_lines(source.lines, only_in_comment=True)
+    )
+    assert source.jinja_lines == tuple(jinja_lines(source.lines))
+    assert [i for _, i in source.selector_lines] == [8, 9, 10]
+    assert [i for _, i in source.comment_selector_lines] == [8, 9]
+    assert [i for _, i in source.jinja_lines] == [1, 2]
+    with pytest.raises(AttributeError):
+        source.text = ""
+
+    assert RecipeSource.from_file(os.path.join(_thisdir, "missing.yaml")) is None
+
+
+class _FakeHTTPSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _http_response(status_code, content=b"", headers=None):
+    response = mock.Mock(status_code=status_code, content=content)
+    response.headers = headers or {}
+    return response
+
+
+def test_fetch_url_content_revalidates(monkeypatch, tmp_path):
+    monkeypatch.setattr(linter_utils, "get_cache_dir", lambda: tmp_path)
+    session = _FakeHTTPSession(
+        _http_response(200, b"hints", {"ETag": '"abc"', "Last-Modified": "then"}),
+        _http_response(304),
+        linter.requests.ConnectionError("offline"),
+        _http_response(503),
+        _http_response(404),
+    )
+    monkeypatch.setattr(linter_utils, "get_http_session", lambda: session)
+    url = "https://example.com/hints.toml"
+
+    assert linter_utils.fetch_url_content(url) == "hints"
+    assert session.requests[0] == {}
+    assert linter_utils.fetch_url_content(url) == "hints"
+    assert session.requests[1] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "then",
+    }
+    # offline and transient errors fall back to the last good copy
+    assert linter_utils.fetch_url_content(url) == "hints"
+    assert linter_utils.fetch_url_content(url) == "hints"
+    assert linter_utils.fetch_url_content(url) is None
+
+    session = _FakeHTTPSession(linter.requests.ConnectionError("offline"))
+    monkeypatch.setattr(linter_utils, "get_http_session", lambda: session)
+    assert linter_utils.fetch_url_content("https://example.com/other") is None
+
+
+@pytest.mark.parametrize("filename", ["meta.yaml", "recipe.yaml"])
+def test_lint_recipe_reads_recipe_once(filename: str):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        recipe_file = os.path.join(tmpdir, filename)
+        with open(recipe_file, "w") as f:
+            f.write(textwrap.dedent("""
+                package:
+                  name: test
+                  version: 1.0
+
+                requirements:
+                  host:
+                    - pip
+                    - python
+                """))
+
+        real_open = open
+        reads = []
+
+        def counting_open(file, *args, **kwargs):
+            if os.fspath(file) == recipe_file:
+                reads.append(file)
+            return real_open(file, *args, **kwargs)
+
+        with mock.patch("builtins.open", counting_open):
+            linter.main(tmpdir, return_hints=True, conda_forge=True)
+        assert len(reads) == 1
+
+
+@pytest.fixture
+def lint_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(linter, "get_cache_dir", lambda: tmp_path / "cache")
+    monkeypatch.setattr(linter, "get_linter_data_version", lambda url: '"etag"')
+    monkeypatch.setattr(linter, "get_global_pinning_python_min", lambda: "3.10")
+    recipe_dir = tmp_path / "recipe"
+    recipe_dir.mkdir()
+    (recipe_dir / "meta.yaml").write_text(textwrap.dedent("""
+        package:
+          name: test
+
+        extra:
+          recipe-maintainers:
+            - some-user
+        """))
+    return recipe_dir
+
+
+def test_lint_cache_reuses_results(monkeypatch, lint_cache):
+    lints, hints = linter.main(str(lint_cache), return_hints=True, use_cache=True)
+    assert lints
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the recipe should not be linted again")
+
+    with monkeypatch.context() as m:
+        m.setattr(linter, "lintify_meta_yaml", fail)
+        cached_lints, cached_hints = linter.main(
+            str(lint_cache), return_hints=True, use_cache=True
+        )
+    assert (cached_lints, cached_hints) == (lints, hints)
+    assert [getattr(lint, "message_class", None) for lint in cached_lints] == [
+        getattr(lint, "message_class", None) for lint in lints
+    ]
+
+    # any change to the recipe directory invalidates the cached results
+    (lint_cache / "build.sh").write_text("echo hello\n")
+    with pytest.raises(AssertionError, match="linted again"):
+        with monkeypatch.context() as m:
+            m.setattr(linter, "lintify_meta_yaml", fail)
+            linter.main(str(lint_cache), return_hints=True, use_cache=True)
+
+
+def test_lint_cache_key_feedstock_inputs(lint_cache):
+    def key():
+        return linter._lint_cache_key(str(lint_cache), "conda-build", True)
+
+    keys = [key()]
+    ci_support = lint_cache.parent / ".ci_support"
+    ci_support.mkdir()
+    (ci_support / "linux_64_.yaml").write_text("python:\n- 3.10\n")
+    keys.append(key())
+    # the hints read the contents of the variant files
+    (ci_support / "linux_64_.yaml").write_text("python:\n- 3.11\n")
+    keys.append(key())
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=lint_cache.parent, check=True)
+
+    git("init", "-q")
+    git("remote", "add", "upstream", "https://github.com/conda-forge/a-feedstock")
+    keys.append(key())
+    git("remote", "set-url", "upstream", "https://github.com/conda-forge/b-feedstock")
+    keys.append(key())
+
+    staged = lint_cache.parent / "recipes" / "test"
+    shutil.copytree(lint_cache, staged)
+    keys.append(linter._lint_cache_key(str(staged), "conda-build", True))
+
+    assert len(set(keys)) == len(keys)
+    assert key() == keys[-2]
+
+
+def test_lint_cache_reruns_network_rules(monkeypatch, lint_cache):
+    checked = []
+
+    def maintainers_exist(maintainers):
+        checked.append(list(maintainers))
+        return {m: len(checked) == 1 for m in maintainers}
+
+    monkeypatch.setattr(linter, "_maintainers_exist", maintainers_exist)
+    monkeypatch.setattr(linter, "load_linter_toml_metadata", lambda: None)
+    monkeypatch.setattr(hints, "get_global_pinning_python_min", lambda: "3.10")
+
+    def lint_maintainers():
+        lints = linter.main(str(lint_cache), conda_forge=True, use_cache=True)
+        return [lint for lint in lints if "some-user" in lint]
+
+    assert lint_maintainers() == []
+    assert lint_maintainers() == []
+    assert checked == [["some-user"]]
+
+    monkeypatch.setattr(linter, "LINT_CACHE_NETWORK_LIFETIME", -1)
+    assert len(lint_maintainers()) == 1
+    assert checked == [["some-user"], ["some-user"]]
+
+
+def test_shellcheck_batched_and_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(hints, "get_cache_dir", lambda: tmp_path / "cache")
+    monkeypatch.setattr(hints, "_shellcheck_version", lambda shellcheck: "0.10.0")
+    monkeypatch.setattr(hints.shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+    monkeypatch.setattr(hints, "SHELLCHECK_SCRIPTS_PER_PROCESS", 2)
+    recipe_dir = tmp_path / "recipe"
+    recipe_dir.mkdir()
+    for i in range(5):
+        (recipe_dir / f"build{i}.sh").write_text(f"echo {i}\n")
+
+    batches = []
+
+    def run_shellcheck(cmd, shell_scripts):
+        batches.append([os.path.basename(s) for s in shell_scripts])
+        return int("build3.sh" in batches[-1][-1]), f"{batches[-1]}\n"
+
+    monkeypatch.setattr(hints, "_run_shellcheck", run_shellcheck)
+    feedstock_config = {"shellcheck": {"enabled": True}}
+
+    found = []
+    hints.hint_shellcheck_usage(str(recipe_dir), found, feedstock_config)
+    assert sorted(batches) == [
+        ["build0.sh", "build1.sh"],
+        ["build2.sh", "build3.sh"],
+        ["build4.sh"],
+    ]
+    assert len(found) == 1
+    assert "['build0.sh', 'build1.sh']\n['build2.sh', 'build3.sh']" in found[0]
+
+    # unchanged scripts are not checked again
+    cached = []
+    hints.hint_shellcheck_usage(str(recipe_dir), cached, feedstock_config)
+    assert cached == found
+    assert len(batches) == 3
+
+    (recipe_dir / "build4.sh").write_text("echo changed\n")
+    hints.hint_shellcheck_usage(str(recipe_dir), [], feedstock_config)
+    assert len(batches) == 6
+
+
 @pytest.mark.parametrize("filename", ["meta.yaml", "recipe.yaml"])
 def test_version_zero(filename: str):
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -5927,13 +6289,20 @@ def no_gh_token(monkeypatch):
     monkeypatch.delenv("GH_TOKEN", raising=False)
 
 
+@pytest.fixture
+def maintainer_cache(tmp_path, monkeypatch):
+    cache_path = tmp_path / "maintainers.json"
+    monkeypatch.setattr(linter, "_maintainer_cache_path", lambda: cache_path)
+    return cache_path
+
+
 @pytest.fixture
 def _no_sleep(monkeypatch):
     monkeypatch.setattr(linter.time, "sleep", lambda *a, **k: None)
 
 
 def _patch_head(monkeypatch, responses):
-    """Patch requests.head used by _head_with_retries.
+    """Patch the HEAD requests of _head_with_retries.
 
     ``responses`` maps a URL substring to either a status code (int) or an
     exception instance to raise.
@@ -5949,7 +6318,7 @@ def _patch_head(monkeypatch, responses):
                 return _FakeResponse(value)
         raise AssertionError(f"unexpected HEAD {url}")
 
-    monkeypatch.setattr(linter.requests, "head", fake_head)
+    monkeypatch.setattr(linter.get_http_session(), "head", fake_head)
     return calls
 
 
@@ -6022,7 +6391,130 @@ def test_maintainer_exists_token_rate_limited(monkeypatch):
     assert linter._maintainer_exists("chrisburr") is None
 
 
-def test_run_conda_forge_specific_routes_unverified_to_lints(monkeypatch):
+class _FakeGraphQL:
+    """A `github.Github` stand-in answering `repositoryOwner` queries."""
+
+    def __init__(self, owners, exc=None):
+        # login -> "User", or {"team slugs"} for an organization
+        self.owners = owners
+        self.exc = exc
+        self.queries = []
+        self.requester = self
+
+    def graphql_query(self, query, variables):
+        self.queries.append(query)
+        if self.exc is not None:
+            raise self.exc
+        data = {}
+        for key, login in variables.items():
+            if not key.startswith("o"):
+                continue
+            alias = "m" + key[1:]
+            owner = self.owners.get(login)
+            if owner is None:
+                data[alias] = None
+            elif owner == "User":
+                data[alias] = {"__typename": "User"}
+            else:
+                team = variables.get("t" + key[1:])
+                data[alias] = {
+                    "__typename": "Organization",
+                    "team": {"id": "x"} if team in owner else None,
+                }
+        return {}, {"data": data}
+
+
+def test_maintainers_exist_graphql_batched(monkeypatch, maintainer_cache):
+    monkeypatch.setenv("GH_TOKEN", "x")
+    gh = _FakeGraphQL({"chrisburr": "User", "conda-forge": {"core"}})
+    monkeypatch.setattr(linter, "_cached_gh", lambda: gh)
+    maintainers = [
+        "chrisburr",
+        "nope",
+        "conda-forge",
+        "conda-forge/core",
+        "conda-forge/nope",
+        "chrisburr/core",
+        "conda-forge/",
+    ]
+    assert linter._maintainers_exist(maintainers) == {
+        "chrisburr": True,
+        "nope": False,
+        "conda-forge": False,
+        "conda-forge/core": True,
+        "conda-forge/nope": False,
+        "chrisburr/core": False,
+        "conda-forge/": False,
+    }
+    assert len(gh.queries) == 1
+
+
+def test_maintainers_exist_graphql_rate_limited(monkeypatch, maintainer_cache):
+    monkeypatch.setenv("GH_TOKEN", "x")
+    gh = _FakeGraphQL(
+        {}, exc=linter.github.GithubException(403, {"message": "rate limit"}, None)
+    )
+    monkeypatch.setattr(linter, "_cached_gh", lambda: gh)
+    assert linter._maintainers_exist(["chrisburr", "conda-forge/core"]) == {
+        "chrisburr": None,
+        "conda-forge/core": None,
+    }
+
+
+def test_maintainers_exist_no_token(
+    monkeypatch, no_gh_token, _no_sleep, maintainer_cache
+):
+    calls = _patch_head(
+        monkeypatch,
+        {
+            "github.com/chrisburr": 200,
+            "orgs/chrisburr/teams": 404,
+            "github.com/nope": 404,
+        },
+    )
+    assert linter._maintainers_exist(
+        ["chrisburr", "nope", "conda-forge/core", "chrisburr"]
+    ) == {"chrisburr": True, "nope": False, "conda-forge/core": True}
+    assert len(calls) == 3
+
+
+def test_maintainers_exist_cached(monkeypatch, maintainer_cache):
+    monkeypatch.setenv("GH_TOKEN", "x")
+    gh = _FakeGraphQL({"chrisburr": "User", "conda-forge": {"core"}})
+    monkeypatch.setattr(linter, "_cached_gh", lambda: gh)
+    maintainers = ["chrisburr", "nope", "conda-forge/core"]
+    expected = {"chrisburr": True, "nope": False, "conda-forge/core": True}
+    assert linter._maintainers_exist(maintainers) == expected
+    assert linter._maintainers_exist(maintainers) == expected
+    assert len(gh.queries) == 1
+
+    # negative results expire sooner than positive ones
+    now = linter.time.time()
+    monkeypatch.setattr(
+        linter.time, "time", lambda: now + linter.MAINTAINER_MISSING_LIFETIME + 1
+    )
+    assert linter._maintainers_exist(maintainers) == expected
+    assert len(gh.queries) == 2
+    assert "$o0: String!)" in gh.queries[-1]
+
+
+def test_maintainers_exist_undetermined_not_cached(
+    monkeypatch, no_gh_token, _no_sleep, maintainer_cache
+):
+    calls = _patch_head(monkeypatch, {"github.com/chrisburr": 429})
+    assert linter._maintainers_exist(["chrisburr", "conda-forge/core"]) == {
+        "chrisburr": None,
+        "conda-forge/core": True,
+    }
+    # neither the failed check nor the team assumed to exist are cached
+    assert not maintainer_cache.exists()
+    linter._maintainers_exist(["chrisburr"])
+    assert len(calls) == 8
+
+
+def test_run_conda_forge_specific_routes_unverified_to_lints(
+    monkeypatch, no_gh_token, maintainer_cache
+):
     # None from the existence check fails the lint (asking for a retry),
     # rather than reporting the maintainer as missing
     monkeypatch.setattr(linter, "_maintainer_exists", lambda m: None)
@@ -6037,7 +6529,9 @@ def test_run_conda_forge_specific_routes_unverified_to_lints(monkeypatch):
     )
 
 
-def test_run_conda_forge_specific_routes_missing_to_lints(monkeypatch):
+def test_run_conda_forge_specific_routes_missing_to_lints(
+    monkeypatch, no_gh_token, maintainer_cache
+):
     monkeypatch.setattr(linter, "_maintainer_exists", lambda m: False)
     monkeypatch.setattr(linter, "load_linter_toml_metadata", lambda: {})
     meta = {"extra": {"recipe-maintainers": ["nope"]}}
@@ -2,6 +2,7 @@ import dataclasses
 import importlib
 import inspect
 import json
+import pickle
 import pkgutil
 import re
 from collections import defaultdict
@@ -185,3 +186,16 @@ def test_message_template_fields_are_valid(module):
                 f"remove the '$' (use '{{{word}}}' instead). "
                 f"Full message: {message!r}"
             )
+
+
+def test_rendered_message_keeps_identifier():
+    from conda_smithy.linter.messages import recipe
+
+    rendered = recipe.FormattedSelectors(lines=[1, 2]).as_string()
+    assert rendered == str(recipe.FormattedSelectors(lines=[1, 2]))
+    assert rendered.identifier == recipe.FormattedSelectors.identifier
+
+    # lints are sent back from `recipe-lint --jobs` worker processes
+    unpickled = pickle.loads(pickle.dumps(rendered))
+    assert unpickled == rendered
+    assert unpickled.message_class is recipe.FormattedSelectors
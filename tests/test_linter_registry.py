@@ -0,0 +1,110 @@
+import os
+import textwrap
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+import conda_smithy.lint_recipe as linter
+from conda_smithy.linter.messages.base import LinterMessage
+from conda_smithy.linter.registry import (
+    RULES,
+    Rule,
+    RuleInput,
+    format_timings,
+    run_rules,
+    select_rules,
+)
+from conda_smithy.schema import Lints
+
+
+def _rule(name, func, inputs=(), **kwargs):
+    return Rule(
+        name=name,
+        func=func,
+        messages=(),
+        inputs=frozenset(inputs),
+        **kwargs,
+    )
+
+
+def test_registered_rules():
+    names = [r.name for r in RULES]
+    assert len(names) == len(set(names))
+    for r in RULES:
+        assert all(issubclass(m, LinterMessage) for m in r.messages), r.name
+        assert r.recipe_versions <= {0, 1}, r.name
+
+    # every lint that conda-forge.yml may skip has a skippable rule
+    skippable = {r.name for r in RULES if r.skippable}
+    assert {lint.value for lint in Lints} <= skippable
+
+
+def test_select_rules():
+    rules = [
+        _rule("a", None),
+        _rule("b", None, recipe_versions=frozenset({1})),
+        _rule("c", None, conda_forge=True),
+        _rule("d", None, skippable=True),
+        _rule("e", None),
+    ]
+    assert [r.name for r in select_rules(rules, 0, False, skip=["d", "e"])] == [
+        "a",
+        "e",
+    ]
+    assert [r.name for r in select_rules(rules, 1, True)] == ["a", "b", "c", "d", "e"]
+
+
+def test_run_rules_keeps_order():
+    started = threading.Event()
+
+    def slow(context, lints, hints):
+        started.set()
+        time.sleep(0.05)
+        lints.append("slow")
+
+    def fast(context, lints, hints):
+        # the network rule was started before the inline rules ran
+        assert started.wait(5)
+        lints.append("fast")
+        hints.append(context)
+
+    rules = [
+        _rule("fast1", fast),
+        _rule("slow", slow, inputs=[RuleInput.NETWORK]),
+        _rule("fast2", fast),
+    ]
+    lints, hints, timings = [], [], {}
+    run_rules(rules, "ctx", lints, hints, timings=timings)
+
+    assert lints == ["fast", "slow", "fast"]
+    assert hints == ["ctx", "ctx"]
+    assert set(timings) == {"fast1", "slow", "fast2"}
+    assert timings["slow"] >= 0.05
+    assert "slow" in format_timings(timings).splitlines()[1]
+
+
+@pytest.mark.parametrize("skip", [True, False])
+def test_skipped_rule_does_not_run(tmp_path, skip):
+    recipe_dir = tmp_path / "recipe"
+    recipe_dir.mkdir()
+    (recipe_dir / "meta.yaml").write_text(textwrap.dedent("""
+        package:
+          name: foo
+          version: 1.0.0
+        """))
+    if skip:
+        (tmp_path / "conda-forge.yml").write_text(
+            "linter:\n  skip:\n    - lint_stdlib\n"
+        )
+
+    timings = {}
+    with mock.patch.object(linter, "lint_stdlib") as lint_stdlib:
+        linter.lintify_meta_yaml(
+            {"package": {"name": "foo", "version": "1.0.0"}},
+            recipe_dir=os.fspath(recipe_dir),
+            timings=timings,
+        )
+    assert lint_stdlib.called is not skip
+    assert ("lint_stdlib" in timings) is not skip
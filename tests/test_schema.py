@@ -2,15 +2,19 @@ import json
 import os
 import tempfile
 import textwrap
+import time
 from pathlib import Path
 
 import pytest
+import requests
 
 import conda_smithy
+from conda_smithy import validate_schema
 from conda_smithy.schema import ConfigModel
 from conda_smithy.utils import get_yaml
 from conda_smithy.validate_schema import (
     CONDA_FORGE_YAML_SCHEMA_FILE,
+    _get_validator,
     validate_json_schema,
 )
 
@@ -51,6 +55,46 @@ def test_schema_validate_json_schema_with_bot():
     assert hints == []
 
 
+def test_schema_validator_reused():
+    _get_validator.cache_clear()
+
+    for _ in range(2):
+        lints, hints = validate_json_schema({"min_py_ver": "27"})
+        assert lints == []
+        # the deprecation hints of one call do not leak into the next
+        assert len(hints) == 1
+        assert "'Min Py Ver' is deprecated." in hints[0]
+
+    assert _get_validator.cache_info().misses == 1
+    assert _get_validator.cache_info().hits == 1
+
+
+def test_remote_json_schema_refreshed(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_schema, "get_cache_dir", lambda: tmp_path)
+    fetched = []
+
+    def get(uri, timeout):
+        fetched.append(uri)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"version": len(fetched)}).encode()
+        return response
+
+    monkeypatch.setattr(validate_schema.requests, "get", get)
+    uri = "https://example.com/schema.json"
+
+    assert validate_schema._get_remote_json_schema(uri) == {"version": 1}
+    assert validate_schema._get_remote_json_schema(uri) == {"version": 1}
+    assert len(fetched) == 1
+
+    # the same process fetches the schema again once its copy expired
+    cache_path = validate_schema._remote_schema_cache_path(uri)
+    expired = time.time() - validate_schema.REMOTE_SCHEMA_LIFETIME - 1
+    os.utime(cache_path, (expired, expired))
+    assert validate_schema._get_remote_json_schema(uri) == {"version": 2}
+    assert len(fetched) == 2
+
+
 def test_schema_no_empty_properties_for_bot():
     """
     If a property references a remote schema with $ref, it should NOT have a properties key.